@@ -1,9 +1,12 @@
 
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
+import heapq
 import logging
-from typing import Dict, Any
+import os
+import orjson
+from typing import Dict, Any, List, Optional
 
 
 logging.basicConfig(level=logging.INFO)
@@ -14,31 +17,78 @@ app = Flask(__name__)
 CORS(app)
 
 
-database = {
-    1: {'name': 'Alice', 'age': 30},
-    2: {'name': 'Bob', 'age': 25},
-    3: {'name': 'Charlie', 'age': 35}
-}
+# Users are stored by ID in a dense list (slot 0 unused). Only mutate through
+# add_user/update_user_fields/remove_user so freed IDs are recycled and the
+# cached GET /users payload is invalidated.
+database: List[Optional[Dict[str, Any]]] = [
+    None,
+    {'name': 'Alice', 'age': 30},
+    {'name': 'Bob', 'age': 25},
+    {'name': 'Charlie', 'age': 35}
+]
+_free_ids: List[int] = []
 
+_users_json: Optional[bytes] = None
 
-def find_user(user_id: int) -> Dict[str, Any]:
-    return database.get(user_id, None)
+
+def _users_payload() -> bytes:
+    global _users_json
+    if _users_json is None:
+        _users_json = b'{' + b','.join(
+            b'"%d":%s' % (user_id, orjson.dumps(user, option=orjson.OPT_SORT_KEYS))
+            for user_id, user in enumerate(database) if user is not None
+        ) + b'}'
+    return _users_json
+
+
+def _invalidate_users_payload():
+    global _users_json
+    _users_json = None
+
+
+def find_user(user_id: int) -> Optional[Dict[str, Any]]:
+    return database[user_id] if 0 < user_id < len(database) else None
+
+
+def add_user(data: Dict[str, Any]) -> int:
+    if _free_ids:
+        user_id = heapq.heappop(_free_ids)
+        database[user_id] = data
+    else:
+        user_id = len(database)
+        database.append(data)
+    _invalidate_users_payload()
+    return user_id
+
+
+def update_user_fields(user_id: int, data: Dict[str, Any]) -> Dict[str, Any]:
+    database[user_id].update(data)
+    _invalidate_users_payload()
+    return database[user_id]
+
+
+def remove_user(user_id: int) -> Dict[str, Any]:
+    user = database[user_id]
+    database[user_id] = None
+    heapq.heappush(_free_ids, user_id)
+    _invalidate_users_payload()
+    return user
 
 @app.route('/users', methods=['GET'])
 def get_users():
 
     logger.info("Fetching all users.")
-    return jsonify(database), 200
+    return Response(_users_payload(), mimetype='application/json'), 200
 
 @app.route('/users/<int:user_id>', methods=['GET'])
 def get_user(user_id):
 
     user = find_user(user_id)
     if user:
-        logger.info(f"User found: ID {user_id}")
+        logger.info("User found: ID %s", user_id)
         return jsonify(user), 200
     else:
-        logger.warning(f"User not found: ID {user_id}")
+        logger.warning("User not found: ID %s", user_id)
         return jsonify({'error': 'User not found'}), 404
 
 @app.route('/users', methods=['POST'])
@@ -46,9 +96,8 @@ def create_user():
 
     if request.is_json:
         new_data = request.get_json()
-        user_id = max(database.keys()) + 1
-        database[user_id] = new_data
-        logger.info(f"User created with ID {user_id}: {new_data}")
+        user_id = add_user(new_data)
+        logger.info("User created with ID %s: %s", user_id, new_data)
         return jsonify({'id': user_id}), 201
     else:
         logger.warning("Invalid data format.")
@@ -59,12 +108,12 @@ def update_user(user_id):
 
     if request.is_json:
         new_data = request.get_json()
-        if user_id in database:
-            database[user_id].update(new_data)
-            logger.info(f"User updated: ID {user_id}: {new_data}")
-            return jsonify(database[user_id]), 200
+        if find_user(user_id) is not None:
+            user = update_user_fields(user_id, new_data)
+            logger.info("User updated: ID %s: %s", user_id, new_data)
+            return jsonify(user), 200
         else:
-            logger.warning(f"User not found for update: ID {user_id}")
+            logger.warning("User not found for update: ID %s", user_id)
             return jsonify({'error': 'User not found'}), 404
     else:
         logger.warning("Invalid data format for update.")
@@ -73,15 +122,30 @@ def update_user(user_id):
 @app.route('/users/<int:user_id>', methods=['DELETE'])
 def delete_user(user_id):
 
-    if user_id in database:
-        deleted_user = database.pop(user_id)
-        logger.info(f"User deleted: ID {user_id}")
+    if find_user(user_id) is not None:
+        deleted_user = remove_user(user_id)
+        logger.info("User deleted: ID %s", user_id)
         return jsonify(deleted_user), 200
     else:
-        logger.warning(f"User not found for deletion: ID {user_id}")
+        logger.warning("User not found for deletion: ID %s", user_id)
         return jsonify({'error': 'User not found'}), 404
 
 
+def main():
+
+    worker_class = os.environ.get('API_WORKER_CLASS', 'gevent')
+    workers = os.environ.get('API_WORKERS', '1')
+    bind = os.environ.get('API_BIND', '127.0.0.1:5000')
+    os.execvp('gunicorn', [
+        'gunicorn',
+        '-k', worker_class,
+        '-w', workers,
+        '--worker-connections', '1000',
+        '-b', bind,
+        'api.flask_api:app',
+    ])
+
+
 if __name__ == '__main__':
     app.run(debug=True)
 
@@ -1,11 +1,13 @@
 
 
-from multiprocessing import Pool, cpu_count
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
+from multiprocessing.shared_memory import SharedMemory
+from numba import njit
+import numpy as np
 import pandas as pd
 from typing import List, Tuple, Any
 import logging
-import random
-import time
 
 
 logging.basicConfig(level=logging.INFO)
@@ -17,44 +19,78 @@ class DataPipeline:
     def __init__(self, num_workers: int = cpu_count(), batch_size: int = 10000):
         self.num_workers = num_workers
         self.batch_size = batch_size
-        logger.debug(f"Pipeline initialized with {num_workers} workers and batch size of {batch_size}")
+        self._executor = ProcessPoolExecutor(max_workers=num_workers)
+        logger.debug("Pipeline initialized with %s workers and batch size of %s", num_workers, batch_size)
 
     @staticmethod
-    def _transform_data(batch: pd.DataFrame) -> pd.DataFrame:
+    def _transform_data(bounds: Tuple[str, int, int, int, int]) -> int:
 
 
-        logger.info(f"Processing batch of size {len(batch)}")
+        name, rows, columns, start, end = bounds
+        logger.info("Processing batch of size %s", end - start)
 
 
-        for column in batch.select_dtypes(include=['int', 'float']).columns:
-            batch[column] = (batch[column] - batch[column].mean()) / batch[column].std()
+        shm = SharedMemory(name=name)
+        try:
+            shared = np.ndarray((rows, columns), dtype=np.float64, buffer=shm.buf, order='F')
+            _standardize(shared[start:end])
+            del shared
+        finally:
+            shm.close()
+        return start
 
+    def process_data(self, data: pd.DataFrame) -> pd.DataFrame:
 
-        for column in batch.select_dtypes(include=['category']).columns:
-            batch[column] = batch[column].cat.codes
 
+        logger.info("Starting data processing...")
 
-        delay = random.uniform(0.1, 0.3)
-        time.sleep(delay)
 
-        return batch
+        numeric_columns = data.select_dtypes(include=[np.number]).columns
+        categorical_columns = data.select_dtypes(include=['category']).columns
+        values = self._process_shared(data, numeric_columns)
 
-    def process_data(self, data: pd.DataFrame) -> pd.DataFrame:
 
+        processed_data = pd.DataFrame(values, columns=numeric_columns, copy=False)
+        for position, column in enumerate(data.columns):
+            if column in categorical_columns:
+                processed_data.insert(position, column, data[column].cat.codes.to_numpy())
+            elif column not in numeric_columns:
+                processed_data.insert(position, column, data[column].array)
 
-        logger.info("Starting data processing...")
+        logger.info("Data processing complete.")
+        return processed_data
 
+    def _process_shared(self, data: pd.DataFrame, columns: pd.Index) -> np.ndarray:
 
-        batched_data = [data[i:i + self.batch_size] for i in range(0, len(data), self.batch_size)]
 
+        rows = len(data)
+        if rows == 0 or len(columns) == 0:
+            return np.empty((rows, len(columns)), dtype=np.float64)
 
-        with Pool(self.num_workers) as pool:
-            processed_batches = pool.map(self._transform_data, batched_data)
 
+        shm = SharedMemory(create=True, size=rows * len(columns) * np.dtype(np.float64).itemsize)
+        try:
+            shared = np.ndarray((rows, len(columns)), dtype=np.float64, buffer=shm.buf, order='F')
+            for index, column in enumerate(columns):
+                shared[:, index] = data[column].to_numpy()
 
-        processed_data = pd.concat(processed_batches, ignore_index=True)
-        logger.info("Data processing complete.")
-        return processed_data
+            bounds = [
+                (shm.name, rows, len(columns), start, min(start + self.batch_size, rows))
+                for start in range(0, rows, self.batch_size)
+            ]
+            chunksize = max(1, len(bounds) // (self.num_workers * 4))
+            for _ in self._executor.map(self._transform_data, bounds, chunksize=chunksize):
+                pass
+
+            result = shared.copy(order='F')
+            del shared
+            return result
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
 
     @staticmethod
     def validate_data(data: pd.DataFrame) -> Tuple[bool, List[str]]:
@@ -65,12 +101,11 @@ class DataPipeline:
 
 
         critical_columns = ['id', 'value']
-        for column in critical_columns:
-            if data[column].isnull().any():
-                errors.append(f"Column '{column}' contains missing values.")
+        missing = data[critical_columns].isna().any(axis=0)
+        errors.extend(f"Column '{column}' contains missing values." for column, has_missing in missing.items() if has_missing)
 
 
-        if data.duplicated(subset=['id']).any():
+        if not data['id'].is_unique:
             errors.append("Duplicate IDs found.")
 
         logger.info("Data validation complete.")
@@ -79,20 +114,45 @@ class DataPipeline:
     def sample_data(self, data: pd.DataFrame, frac: float = 0.1) -> pd.DataFrame:
 
 
-        logger.info(f"Sampling {frac * 100}% of data...")
+        logger.info("Sampling %s%% of data...", frac * 100)
         sample = data.sample(frac=frac, random_state=42)
         logger.info("Sampling complete.")
         return sample
 
 
+@njit(cache=True)
+def _standardize(values: np.ndarray) -> None:
+    rows, columns = values.shape
+    for j in range(columns):
+        total = 0.0
+        count = 0
+        for i in range(rows):
+            if not np.isnan(values[i, j]):
+                total += values[i, j]
+                count += 1
+        mean = total / count if count > 0 else np.nan
+
+        squares = 0.0
+        for i in range(rows):
+            if not np.isnan(values[i, j]):
+                squares += (values[i, j] - mean) ** 2
+        std = np.sqrt(squares / (count - 1)) if count > 1 else np.nan
+
+        for i in range(rows):
+            values[i, j] -= mean
+            if std != 0:
+                values[i, j] /= std
+
+
 def main():
 
 
     data_size = 100000
+    rng = np.random.default_rng(42)
     df = pd.DataFrame({
-        'id': range(data_size),
-        'value': [random.uniform(0, 100) for _ in range(data_size)],
-        'category': pd.Categorical([random.choice(['A', 'B', 'C']) for _ in range(data_size)])
+        'id': np.arange(data_size),
+        'value': rng.uniform(0, 100, data_size),
+        'category': pd.Categorical.from_codes(rng.integers(0, 3, data_size), ['A', 'B', 'C'])
     })
 
     pipeline = DataPipeline(num_workers=4, batch_size=5000)
@@ -114,6 +174,7 @@ def main():
 
     logger.info("Sampled data:")
     logger.info(sample.head())
+    pipeline.close()
     logger.info("Data pipeline complete.")
 
 
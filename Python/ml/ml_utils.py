@@ -2,18 +2,23 @@
 
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
+from sklearn.model_selection import (
+    cross_validate, GridSearchCV, ParameterGrid, StratifiedKFold, StratifiedShuffleSplit
+)
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.svm import SVC, SVR
 from sklearn.metrics import (
-    accuracy_score, precision_score, recall_score, f1_score,
+    accuracy_score, f1_score,
+    precision_recall_fscore_support,
     mean_squared_error, mean_absolute_error, r2_score,
     classification_report, confusion_matrix
 )
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.pipeline import Pipeline
+from sklearn.base import clone
 import joblib
+import hashlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 from typing import Dict, List, Tuple, Any, Optional
@@ -28,6 +33,8 @@ warnings.filterwarnings('ignore')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+TUNING_BACKENDS = ('loky', 'threading', 'multiprocessing', 'dask', 'ray')
+
 @dataclass
 class ModelResult:
 
@@ -45,8 +52,9 @@ class MLPipeline:
     def __init__(self):
         self.models = {}
         self.results = {}
-        self.scaler = StandardScaler()
+        self.scaler = StandardScaler(copy=False)
         self.label_encoder = LabelEncoder()
+        self._split_cache: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {}
         
     def prepare_data(self, df: pd.DataFrame, target_column: str, 
                     test_size: float = 0.2, random_state: int = 42) -> Tuple:
@@ -60,28 +68,45 @@ class MLPipeline:
 
         categorical_columns = X.select_dtypes(include=['object', 'category']).columns
         for col in categorical_columns:
-            X[col] = LabelEncoder().fit_transform(X[col].astype(str))
+            X[col], _ = pd.factorize(X[col].astype(str), sort=True)
         
 
-        X = X.fillna(X.mean())
+        X.fillna(X.mean(numeric_only=True), inplace=True)
+        X = X.astype(np.float32)
         
 
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=test_size, random_state=random_state, stratify=y
-        )
+        train_index, test_index = self._stratified_split(y, test_size, random_state)
+        X_train, X_test = X.iloc[train_index], X.iloc[test_index]
+        y_train, y_test = y.iloc[train_index], y.iloc[test_index]
         
 
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
         
-        logger.info(f"Data prepared: {X_train.shape[0]} training samples, {X_test.shape[0]} test samples")
+        logger.info("Data prepared: %s training samples, %s test samples", X_train.shape[0], X_test.shape[0])
         
         return X_train_scaled, X_test_scaled, y_train, y_test
     
+    def _stratified_split(self, y: pd.Series, test_size: float,
+                          random_state: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
+
+
+        splitter = StratifiedShuffleSplit(n_splits=1, test_size=test_size, random_state=random_state)
+        if random_state is None:
+            return next(splitter.split(np.zeros(len(y)), y))
+        
+        digest = hashlib.blake2b(pd.util.hash_pandas_object(y, index=False).to_numpy().tobytes()).digest()
+        key = (digest, len(y), test_size, random_state)
+        if key not in self._split_cache:
+            if len(self._split_cache) >= 8:
+                del self._split_cache[next(iter(self._split_cache))]
+            self._split_cache[key] = next(splitter.split(np.zeros(len(y)), y))
+        return self._split_cache[key]
+    
     def train_models(self, X_train: np.ndarray, y_train: np.ndarray, 
                     problem_type: str = 'classification') -> Dict:
 
-        logger.info(f"Training models for {problem_type}...")
+        logger.info("Training models for %s...", problem_type)
         
         if problem_type == 'classification':
             models = {
@@ -98,7 +123,7 @@ class MLPipeline:
         
         trained_models = {}
         for name, model in models.items():
-            logger.info(f"Training {name}...")
+            logger.info("Training %s...", name)
             model.fit(X_train, y_train)
             trained_models[name] = model
             
@@ -113,17 +138,14 @@ class MLPipeline:
         results = []
         for name, model in self.models.items():
 
-            y_pred = model.predict(X_test)
-            y_pred_proba = model.predict_proba(X_test)[:, 1] if hasattr(model, 'predict_proba') else None
+            y_pred = self._predict_labels(model, X_test)
             
 
             accuracy = accuracy_score(y_test, y_pred)
-            precision = precision_score(y_test, y_pred, average='weighted')
-            recall = recall_score(y_test, y_pred, average='weighted')
-            f1 = f1_score(y_test, y_pred, average='weighted')
+            precision, recall, f1, _ = precision_recall_fscore_support(y_test, y_pred, average='weighted')
             
 
-            cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring='accuracy')
+            cv_scores = cross_validate(model, X_train, y_train, cv=5, scoring='accuracy', n_jobs=-1)['test_score']
             
             result = ModelResult(
                 model_name=name,
@@ -135,11 +157,19 @@ class MLPipeline:
             )
             results.append(result)
             
-            logger.info(f"{name} - Accuracy: {accuracy:.4f}, F1: {f1:.4f}")
+            logger.info("%s - Accuracy: %.4f, F1: %.4f", name, accuracy, f1)
         
         self.results = results
         return results
     
+    @staticmethod
+    def _predict_labels(model: Any, X: np.ndarray) -> np.ndarray:
+
+
+        if isinstance(model, SVC) or not hasattr(model, 'predict_proba'):
+            return model.predict(X)
+        return model.classes_[model.predict_proba(X).argmax(axis=1)]
+    
     def evaluate_regression_models(self, X_test: np.ndarray, y_test: np.ndarray) -> Dict[str, Dict]:
 
         logger.info("Evaluating regression models...")
@@ -160,46 +190,109 @@ class MLPipeline:
                 'R2': r2
             }
             
-            logger.info(f"{name} - RMSE: {rmse:.4f}, R2: {r2:.4f}")
+            logger.info("%s - RMSE: %.4f, R2: %.4f", name, rmse, r2)
         
         return results
     
     def hyperparameter_tuning(self, model_name: str, X_train: np.ndarray, 
-                            y_train: np.ndarray, param_grid: Dict) -> Dict:
+                            y_train: np.ndarray, param_grid: Dict,
+                            backend: str = 'loky') -> Dict:
 
-        logger.info(f"Performing hyperparameter tuning for {model_name}...")
+        if backend not in TUNING_BACKENDS:
+            raise ValueError(f"Unsupported tuning backend: {backend}")
+        
+        logger.info("Performing hyperparameter tuning for %s...", model_name)
+        
+        if backend == 'ray':
+            from ray.util.joblib import register_ray
+            register_ray()
         
         model = self.models[model_name]
-        grid_search = GridSearchCV(
-            model, param_grid, cv=5, scoring='accuracy', n_jobs=-1, verbose=1
-        )
         
-        grid_search.fit(X_train, y_train)
+
+        backend_kwargs = {'scatter': [X_train, y_train]} if backend == 'dask' else {}
+        with joblib.parallel_backend(backend, **backend_kwargs):
+            if self._grows_forest(model, param_grid):
+                best_params, best_score = self._tune_forest(model, X_train, y_train, param_grid)
+                best_estimator = clone(model).set_params(**best_params).fit(X_train, y_train)
+            else:
+                grid_search = GridSearchCV(
+                    model, param_grid, cv=5, scoring='accuracy', n_jobs=-1, verbose=1
+                )
+                grid_search.fit(X_train, y_train)
+                best_params, best_score = grid_search.best_params_, grid_search.best_score_
+                best_estimator = grid_search.best_estimator_
         
-        logger.info(f"Best parameters for {model_name}: {grid_search.best_params_}")
-        logger.info(f"Best cross-validation score: {grid_search.best_score_:.4f}")
+        logger.info("Best parameters for %s: %s", model_name, best_params)
+        logger.info("Best cross-validation score: %.4f", best_score)
         
 
-        self.models[model_name] = grid_search.best_estimator_
+        self.models[model_name] = best_estimator
         
-        return grid_search.best_params_
+        return best_params
     
-    def save_model(self, model_name: str, filepath: str):
+    @staticmethod
+    def _grows_forest(model: Any, param_grid: Any) -> bool:
+
+        return (isinstance(model, RandomForestClassifier) and isinstance(param_grid, dict)
+                and len(param_grid.get('n_estimators', ())) > 1)
+    
+    @staticmethod
+    def _score_forest_sizes(model: Any, params: Dict, sizes: List[int],
+                            X: np.ndarray, y: np.ndarray, train: np.ndarray, test: np.ndarray) -> List[float]:
+
+
+        forest = clone(model).set_params(warm_start=True, **params)
+        scores = []
+        for n_estimators in sizes:
+            forest.set_params(n_estimators=n_estimators).fit(X[train], y[train])
+            scores.append(forest.score(X[test], y[test]))
+        return scores
+    
+    def _tune_forest(self, model: Any, X_train: np.ndarray, y_train: np.ndarray,
+                     param_grid: Dict) -> Tuple[Dict, float]:
+
+
+        X, y = np.asarray(X_train), np.asarray(y_train)
+        sizes = sorted(param_grid['n_estimators'])
+        other_params = list(ParameterGrid({key: values for key, values in param_grid.items() if key != 'n_estimators'}))
+        folds = list(StratifiedKFold(n_splits=5).split(X, y))
+        
+        fold_scores = joblib.Parallel(n_jobs=-1)(
+            joblib.delayed(self._score_forest_sizes)(model, params, sizes, X, y, train, test)
+            for params in other_params for train, test in folds
+        )
+        
+        mean_scores = {}
+        for index, params in enumerate(other_params):
+            per_size = np.mean(fold_scores[index * len(folds):(index + 1) * len(folds)], axis=0)
+            for n_estimators, score in zip(sizes, per_size):
+                mean_scores[tuple(sorted({**params, 'n_estimators': n_estimators}.items()))] = score
+        
+
+        best_params, best_score = None, -np.inf
+        for params in ParameterGrid(param_grid):
+            score = mean_scores[tuple(sorted(params.items()))]
+            if score > best_score:
+                best_params, best_score = params, score
+        return best_params, best_score
+    
+    def save_model(self, model_name: str, filepath: str, compress: Any = 0):
 
         if model_name in self.models:
-            joblib.dump(self.models[model_name], filepath)
-            logger.info(f"Model {model_name} saved to {filepath}")
+            joblib.dump(self.models[model_name], filepath, compress=compress)
+            logger.info("Model %s saved to %s", model_name, filepath)
         else:
-            logger.error(f"Model {model_name} not found")
+            logger.error("Model %s not found", model_name)
     
-    def load_model(self, filepath: str, model_name: str):
+    def load_model(self, filepath: str, model_name: str, mmap_mode: Optional[str] = 'r'):
 
         try:
-            model = joblib.load(filepath)
+            model = joblib.load(filepath, mmap_mode=mmap_mode)
             self.models[model_name] = model
-            logger.info(f"Model loaded from {filepath} as {model_name}")
+            logger.info("Model loaded from %s as %s", filepath, model_name)
         except Exception as e:
-            logger.error(f"Error loading model: {e}")
+            logger.error("Error loading model: %s", e)
     
     def plot_model_comparison(self, results: List[ModelResult], save_path: Optional[str] = None):
 
@@ -210,7 +303,7 @@ class MLPipeline:
         x = np.arange(len(model_names))
         width = 0.35
         
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), layout='constrained')
         bars1 = ax.bar(x - width/2, accuracies, width, label='Accuracy', alpha=0.8)
         bars2 = ax.bar(x + width/2, f1_scores, width, label='F1 Score', alpha=0.8)
         
@@ -223,19 +316,12 @@ class MLPipeline:
         ax.set_ylim(0, 1)
         
 
-        for bar in bars1 + bars2:
-            height = bar.get_height()
-            ax.annotate(f'{height:.3f}',
-                       xy=(bar.get_x() + bar.get_width() / 2, height),
-                       xytext=(0, 3),
-                       textcoords="offset points",
-                       ha='center', va='bottom')
-        
-        plt.tight_layout()
+        ax.bar_label(bars1, fmt='%.3f', padding=3)
+        ax.bar_label(bars2, fmt='%.3f', padding=3)
         
         if save_path:
             plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            logger.info(f"Plot saved to {save_path}")
+            logger.info("Plot saved to %s", save_path)
         
         plt.show()
 
@@ -258,35 +344,36 @@ class FeatureEngineering:
 
         from sklearn.feature_selection import SelectKBest, f_classif
         
-        selector = SelectKBest(score_func=f_classif, k=k)
-        X_selected = selector.fit_transform(X, y)
+        values = X.to_numpy()
+        support = SelectKBest(score_func=f_classif, k=k).fit(values, np.asarray(y)).get_support()
         
-        selected_features = X.columns[selector.get_support()]
-        return pd.DataFrame(X_selected, columns=selected_features)
+        return pd.DataFrame(values[:, support], columns=X.columns[support])
     
     @staticmethod
     def detect_outliers(df: pd.DataFrame, method: str = 'iqr') -> pd.DataFrame:
 
-        outliers = pd.DataFrame()
+        numeric = df.select_dtypes(include=[np.number])
+        if numeric.empty:
+            return pd.DataFrame(columns=numeric.columns, dtype=bool)
+        
+        values = numeric.to_numpy(dtype=np.float64)
         
         if method == 'iqr':
-            for column in df.select_dtypes(include=[np.number]).columns:
-                Q1 = df[column].quantile(0.25)
-                Q3 = df[column].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
-                outliers[column] = (df[column] < lower_bound) | (df[column] > upper_bound)
+            Q1, Q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+            IQR = Q3 - Q1
+            mask = (values < Q1 - 1.5 * IQR) | (values > Q3 + 1.5 * IQR)
         
         elif method == 'zscore':
-            from scipy import stats
-            for column in df.select_dtypes(include=[np.number]).columns:
-                z_scores = np.abs(stats.zscore(df[column]))
-                outliers[column] = z_scores > 3
+            with np.errstate(divide='ignore', invalid='ignore'):
+                z_scores = np.abs((values - values.mean(axis=0)) / values.std(axis=0))
+            mask = z_scores > 3
+        
+        else:
+            return pd.DataFrame()
         
-        return outliers
+        return pd.DataFrame(mask, columns=numeric.columns, index=df.index)
 
-def generate_sample_data(n_samples: int = 1000) -> pd.DataFrame:
+def generate_sample_data(n_samples: int = 1000, random_state: int = 42) -> pd.DataFrame:
 
     from sklearn.datasets import make_classification
     
@@ -296,7 +383,7 @@ def generate_sample_data(n_samples: int = 1000) -> pd.DataFrame:
         n_informative=5,
         n_redundant=2,
         n_clusters_per_class=1,
-        random_state=42
+        random_state=random_state
     )
     
 
@@ -310,7 +397,7 @@ def main():
 
 
     df = generate_sample_data(1000)
-    logger.info(f"Generated dataset with shape: {df.shape}")
+    logger.info("Generated dataset with shape: %s", df.shape)
     
 
     pipeline = MLPipeline()
@@ -46,6 +46,11 @@ setup(
             "tensorflow>=2.13.0",
             "torch>=2.0.1",
             "scikit-learn>=1.3.0",
+            "lz4>=4.3.2",
+        ],
+        "distributed": [
+            "dask[distributed]>=2023.7.0",
+            "ray>=2.6.0",
         ],
         "web": [
             "selenium>=4.11.2",
@@ -0,0 +1,471 @@
+import asyncio
+
+from utils.async_task_manager import AsyncTaskManager, TaskPriority, TaskStatus
+
+
+async def _record(order, name):
+    order.append(name)
+    return name
+
+
+def test_queued_tasks_run_by_priority_then_submission_order():
+    async def scenario():
+        manager = AsyncTaskManager(max_concurrent_tasks=1)
+        order = []
+        task_ids = []
+        for name, priority in [('low', TaskPriority.LOW), ('high1', TaskPriority.HIGH),
+                               ('medium', TaskPriority.MEDIUM), ('high2', TaskPriority.HIGH)]:
+            task_ids.append(await manager.submit_task(_record(order, name), priority))
+
+        async with manager.managed_lifecycle():
+            for task_id in task_ids:
+                await manager.wait_for_task(task_id, timeout=5)
+        return order
+
+    assert asyncio.run(scenario()) == ['high1', 'high2', 'medium', 'low']
+
+
+def test_cancelled_queued_task_never_runs():
+    async def scenario():
+        manager = AsyncTaskManager(max_concurrent_tasks=1)
+        order = []
+        kept = await manager.submit_task(_record(order, 'kept'))
+        dropped_coro = _record(order, 'dropped')
+        dropped = await manager.submit_task(dropped_coro)
+
+        assert await manager.cancel_task(dropped)
+        dropped_coro.close()
+        async with manager.managed_lifecycle():
+            result = await manager.wait_for_task(kept, timeout=5)
+        return order, result, manager.get_task_status(dropped)
+
+    order, result, dropped_status = asyncio.run(scenario())
+
+    assert order == ['kept']
+    assert result.status == TaskStatus.COMPLETED and result.result == 'kept'
+    assert dropped_status == TaskStatus.CANCELLED
+
+
+def test_wait_for_task_wakes_as_soon_as_the_task_finishes():
+    async def scenario():
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            task_id = await manager.submit_task(asyncio.sleep(0, result='done'))
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            result = await manager.wait_for_task(task_id, timeout=5)
+            return result, loop.time() - started
+
+    result, waited = asyncio.run(scenario())
+
+    assert result.status == TaskStatus.COMPLETED and result.result == 'done'
+    assert waited < 0.09
+
+
+def test_wait_for_task_times_out():
+    async def scenario():
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            task_id = await manager.submit_task(asyncio.sleep(1))
+            try:
+                await manager.wait_for_task(task_id, timeout=0.05)
+            except asyncio.TimeoutError:
+                await manager.cancel_task(task_id)
+                return True
+        return False
+
+    assert asyncio.run(scenario())
+
+
+def test_idle_worker_does_not_poll_the_queue():
+    async def scenario():
+        manager = AsyncTaskManager()
+        calls = []
+        process_queue = manager._process_queue
+
+        async def counting_process_queue():
+            calls.append(None)
+            return await process_queue()
+
+        manager._process_queue = counting_process_queue
+        async with manager.managed_lifecycle():
+            await asyncio.sleep(0.1)
+            idle_calls = len(calls)
+            task_id = await manager.submit_task(asyncio.sleep(0, result='ran'))
+            result = await manager.wait_for_task(task_id, timeout=5)
+        return idle_calls, result
+
+    idle_calls, result = asyncio.run(scenario())
+
+    assert idle_calls <= 1
+    assert result.result == 'ran'
+
+
+def test_submit_task_starts_immediately_when_a_slot_is_free():
+    async def scenario():
+        async with AsyncTaskManager(max_concurrent_tasks=1).managed_lifecycle() as manager:
+            blocker = asyncio.Event()
+            first = await manager.submit_task(blocker.wait())
+            second = await manager.submit_task(asyncio.sleep(0))
+            statuses = manager.get_task_status(first), manager.get_task_status(second)
+            blocker.set()
+            await manager.wait_for_task(second, timeout=5)
+        return statuses
+
+    assert asyncio.run(scenario()) == (TaskStatus.RUNNING, TaskStatus.PENDING)
+
+
+def test_cancel_callbacks_can_submit_new_tasks():
+    async def scenario():
+        manager = AsyncTaskManager()
+        resubmitted = []
+
+        async def resubmit(result):
+            resubmitted.append(await manager.submit_task(asyncio.sleep(0, result='again')))
+
+        manager.add_callback('task_cancelled', resubmit)
+        pending = asyncio.sleep(0)
+        await manager.submit_task(pending)
+        await asyncio.wait_for(manager.cancel_all_tasks(), timeout=1)
+        pending.close()
+        async with manager.managed_lifecycle():
+            return await manager.wait_for_task(resubmitted[0], timeout=5)
+
+    assert asyncio.run(scenario()).result == 'again'
+
+
+def test_finished_queued_tasks_are_recycled_without_their_coroutines():
+    from utils import async_task_manager
+
+    async def scenario():
+        async_task_manager._queued_task_pool.clear()
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            task_id = await manager.submit_task(asyncio.sleep(0, result='first'))
+            await manager.wait_for_task(task_id, timeout=5)
+            await asyncio.sleep(0)
+            [pooled] = async_task_manager._queued_task_pool
+            assert pooled.coro is None and pooled.callback is None
+
+            second = await manager.submit_task(asyncio.sleep(0, result='second'), max_retries=0)
+            assert not async_task_manager._queued_task_pool
+            return (await manager.wait_for_task(second, timeout=5)).result
+
+    assert asyncio.run(scenario()) == 'second'
+
+
+def test_results_and_history_are_bounded():
+    async def scenario():
+        async with AsyncTaskManager(history_size=3).managed_lifecycle() as manager:
+            task_ids = []
+            for index in range(5):
+                task_id = await manager.submit_task(asyncio.sleep(0, result=index))
+                await manager.wait_for_task(task_id, timeout=5)
+                task_ids.append(task_id)
+            return manager, task_ids
+
+    manager, task_ids = asyncio.run(scenario())
+
+    assert list(manager._task_results) == task_ids[2:]
+    assert [result.result for result in manager._task_history] == [2, 3, 4]
+    assert manager.get_task_status(task_ids[0]) is None
+
+
+async def _fail_after(delay):
+    await asyncio.sleep(delay)
+    raise ValueError('boom')
+
+
+def test_fail_fast_group_stops_on_first_failure_to_finish():
+    from utils.async_task_manager import GroupFailurePolicy
+
+    async def scenario():
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            results = await manager.execute_task_group(
+                [(asyncio.sleep(2), TaskPriority.MEDIUM), (_fail_after(0.01), TaskPriority.MEDIUM)],
+                failure_policy=GroupFailurePolicy.FAIL_FAST
+            )
+            return results, loop.time() - started
+
+    results, elapsed = asyncio.run(scenario())
+
+    assert elapsed < 1
+    assert [result.status for result in results] == [TaskStatus.FAILED]
+    assert isinstance(results[0].error, ValueError)
+
+
+def test_group_results_keep_submission_order():
+    async def scenario():
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            return await manager.execute_task_group([
+                (asyncio.sleep(0.05, result='slow'), TaskPriority.MEDIUM),
+                (_fail_after(0), TaskPriority.MEDIUM),
+                (asyncio.sleep(0, result='fast'), TaskPriority.MEDIUM),
+            ])
+
+    results = asyncio.run(scenario())
+
+    assert [result.status for result in results] == [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.COMPLETED]
+    assert [results[0].result, results[2].result] == ['slow', 'fast']
+
+
+def _describe_array(values, offset=0.0):
+    return type(values.base).__name__, float(values.sum() + offset)
+
+
+def test_run_in_process_passes_large_arrays_through_shared_memory():
+    import os
+
+    import numpy as np
+
+    async def scenario():
+        async with AsyncTaskManager(process_pool_size=1).managed_lifecycle() as manager:
+            large = np.ones(1 << 18)
+            small = np.ones(4)
+            return (
+                await manager.run_in_process(_describe_array, large, offset=1.0),
+                await manager.run_in_process(_describe_array, small)
+            )
+
+    before = set(os.listdir('/dev/shm'))
+    (large_base, large_sum), (small_base, small_sum) = asyncio.run(scenario())
+
+    assert large_base == 'mmap' and large_sum == (1 << 18) + 1.0
+    assert small_base != 'mmap' and small_sum == 4.0
+    assert set(os.listdir('/dev/shm')) <= before
+
+
+def test_run_in_thread_forwards_keyword_arguments():
+    async def scenario():
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            return await manager.run_in_thread(int, '11', base=2)
+
+    assert asyncio.run(scenario()) == 3
+
+
+def test_metrics_average_completed_execution_time():
+    async def scenario():
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            empty = manager.get_metrics()['average_execution_time']
+            for delay in (0.01, 0.03):
+                await manager.wait_for_task(await manager.submit_task(asyncio.sleep(delay)), timeout=5)
+            return empty, manager.get_metrics()
+
+    empty, metrics = asyncio.run(scenario())
+
+    assert empty == 0.0
+    assert metrics['completed_tasks'] == 2
+    assert metrics['average_execution_time'] == metrics['total_execution_time'] / 2
+    assert 0.02 <= metrics['average_execution_time'] < 0.5
+
+
+def test_cancelled_entries_are_skipped_and_compacted():
+    async def scenario():
+        manager = AsyncTaskManager(max_concurrent_tasks=1)
+        order = []
+        coros = [_record(order, index) for index in range(4)]
+        task_ids = [await manager.submit_task(coro) for coro in coros]
+
+        assert await manager.cancel_task(task_ids[1])
+        assert not await manager.cancel_task(task_ids[1])
+        queue_length = len(manager._task_queue)
+        metrics = manager.get_metrics()
+        async with manager.managed_lifecycle():
+            await manager.wait_for_task(task_ids[3], timeout=5)
+        return order, queue_length, metrics, manager.get_task_status(task_ids[1])
+
+    order, queue_length, metrics, status = asyncio.run(scenario())
+
+    assert order == [0, 2, 3]
+    assert queue_length == 4
+    assert metrics['queued_tasks'] == 3 and metrics['cancelled_tasks'] == 1
+    assert status == TaskStatus.CANCELLED
+
+
+def test_task_records_use_slots():
+    import sys
+    from uuid import uuid4
+
+    import pytest
+
+    from utils.async_task_manager import TaskResult
+
+    if sys.version_info < (3, 10):
+        pytest.skip('dataclass slots need Python 3.10')
+    assert not hasattr(TaskResult(task_id=uuid4(), status=TaskStatus.PENDING), '__dict__')
+
+
+def test_sync_and_async_callbacks_are_both_notified():
+    async def scenario():
+        seen = []
+
+        async def on_completed_async(result):
+            seen.append(('async', result.result))
+
+        def on_completed(result):
+            seen.append(('sync', result.result))
+
+        def broken(result):
+            raise RuntimeError('ignored')
+
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            manager.add_callback('task_completed', on_completed_async)
+            manager.add_callback('task_completed', broken)
+            manager.add_callback('task_completed', on_completed)
+            await manager.wait_for_task(await manager.submit_task(asyncio.sleep(0, result=1)), timeout=5)
+            manager.remove_callback('task_completed', on_completed_async)
+            await manager.wait_for_task(await manager.submit_task(asyncio.sleep(0, result=2)), timeout=5)
+        return seen
+
+    assert asyncio.run(scenario()) == [('sync', 1), ('async', 1), ('sync', 2)]
+
+
+def test_process_queue_fills_every_free_slot_at_once():
+    async def scenario():
+        manager = AsyncTaskManager(max_concurrent_tasks=3)
+        blocker = asyncio.Event()
+        task_ids = [await manager.submit_task(blocker.wait()) for _ in range(5)]
+
+        launched = await manager._process_queue()
+        running = len(manager._running_tasks)
+        blocker.set()
+        async with manager.managed_lifecycle():
+            for task_id in task_ids:
+                await manager.wait_for_task(task_id, timeout=5)
+        return launched, running
+
+    assert asyncio.run(scenario()) == (3, 3)
+
+
+def test_running_tasks_never_exceed_the_concurrency_limit():
+    async def scenario():
+        running = []
+        peak = []
+
+        async def tracked():
+            running.append(None)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+        async with AsyncTaskManager(max_concurrent_tasks=2).managed_lifecycle() as manager:
+            task_ids = [await manager.submit_task(tracked()) for _ in range(6)]
+            for task_id in task_ids:
+                await manager.wait_for_task(task_id, timeout=5)
+        return max(peak), len(peak)
+
+    assert asyncio.run(scenario()) == (2, 6)
+
+
+class _Flaky:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def __await__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ValueError('not yet')
+        return 'recovered'
+        yield
+
+
+def test_retry_delay_does_not_hold_a_concurrency_slot():
+    async def scenario():
+        async with AsyncTaskManager(max_concurrent_tasks=1).managed_lifecycle() as manager:
+            flaky = _Flaky(failures=1)
+            retried = await manager.submit_task(flaky, max_retries=1, retry_delay=0.2)
+            await asyncio.sleep(0.01)
+            other = await manager.submit_task(asyncio.sleep(0, result='other'))
+            other_result = await manager.wait_for_task(other, timeout=0.1)
+            return other_result, await manager.wait_for_task(retried, timeout=5)
+
+    other_result, retried_result = asyncio.run(scenario())
+
+    assert other_result.result == 'other'
+    assert retried_result.status == TaskStatus.COMPLETED and retried_result.result == 'recovered'
+
+
+def test_cancelling_a_task_waiting_to_retry():
+    async def scenario():
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            task_id = await manager.submit_task(_Flaky(failures=5), max_retries=3, retry_delay=10)
+            await asyncio.sleep(0.01)
+            assert await manager.cancel_task(task_id)
+            return await manager.wait_for_task(task_id, timeout=1), manager._retry_waits
+
+    result, retry_waits = asyncio.run(scenario())
+
+    assert result.status == TaskStatus.CANCELLED
+    assert not retry_waits
+
+
+def test_singleton_works_across_event_loops():
+    from utils.async_task_manager import TaskManagerSingleton
+
+    async def scenario():
+        first, second = await asyncio.gather(TaskManagerSingleton.get_instance(), TaskManagerSingleton.get_instance())
+        await TaskManagerSingleton.shutdown()
+        return first is second
+
+    assert asyncio.run(scenario())
+    assert asyncio.run(scenario())
+
+
+def test_execute_batch_bounds_in_flight_items_and_keeps_order():
+    async def scenario():
+        active = []
+        peak = []
+
+        async def process(item):
+            active.append(item)
+            peak.append(len(active))
+            await asyncio.sleep(0.001 * (item % 3))
+            active.remove(item)
+            return item * 2
+
+        def items():
+            yield from range(10)
+
+        async with AsyncTaskManager().managed_lifecycle() as manager:
+            results = await manager.execute_batch(items(), process, batch_size=3)
+        return [result.result for result in results], max(peak)
+
+    results, peak = asyncio.run(scenario())
+
+    assert results == [item * 2 for item in range(10)]
+    assert peak <= 3
+
+
+def test_timeouts_default_expire_and_can_be_disabled():
+    async def scenario():
+        async with AsyncTaskManager(default_timeout=0.05).managed_lifecycle() as manager:
+            defaulted = await manager.submit_task(asyncio.sleep(1))
+            explicit = await manager.submit_task(asyncio.sleep(1), timeout=0.01)
+            unlimited = await manager.submit_task(asyncio.sleep(0.1, result='finished'), timeout=None)
+            return [await manager.wait_for_task(task_id, timeout=5) for task_id in (defaulted, explicit, unlimited)]
+
+    defaulted, explicit, unlimited = asyncio.run(scenario())
+
+    for result in (defaulted, explicit):
+        assert result.status == TaskStatus.FAILED
+        assert isinstance(result.error, asyncio.TimeoutError)
+    assert unlimited.status == TaskStatus.COMPLETED and unlimited.result == 'finished'
+
+
+def test_history_and_metrics_are_flushed_from_completions():
+    async def scenario():
+        manager = AsyncTaskManager()
+        async with manager.managed_lifecycle():
+            ok = await manager.submit_task(asyncio.sleep(0))
+            failed = await manager.submit_task(_fail_after(0))
+            await manager.wait_for_task(ok, timeout=5)
+            await manager.wait_for_task(failed, timeout=5)
+            metrics = manager.get_metrics()
+            history_after_metrics = len(manager._task_history)
+        return metrics, history_after_metrics, manager._completion_queue
+
+    metrics, history_length, completion_queue = asyncio.run(scenario())
+
+    assert (metrics['completed_tasks'], metrics['failed_tasks']) == (1, 1)
+    assert history_length == 2
+    assert not completion_queue
@@ -0,0 +1,674 @@
+from utils.cache_manager import EvictionPolicy, MemoryCache, ReadWriteLock, ShardedMemoryCache
+
+
+def test_lfu_evicts_least_frequently_used_key():
+    cache = MemoryCache(max_size=3, eviction_policy=EvictionPolicy.LFU)
+    for key in 'abc':
+        cache.set(key, key)
+    for _ in range(3):
+        cache.get('a')
+    cache.get('c')
+
+    cache.set('d', 'd')
+
+    assert not cache.exists('b')
+    assert all(cache.exists(key) for key in 'acd')
+
+
+def test_lfu_breaks_ties_by_age_and_resets_on_overwrite():
+    cache = MemoryCache(max_size=2, eviction_policy=EvictionPolicy.LFU)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.get('b')
+    cache.set('a', 3)
+
+    cache.set('c', 4)
+
+    assert not cache.exists('a')
+    assert cache.get('b') == 2 and cache.get('c') == 4
+
+
+def test_lfu_survives_deletes_of_the_minimum_bucket():
+    cache = MemoryCache(max_size=3, eviction_policy=EvictionPolicy.LFU)
+    for key in 'abc':
+        cache.set(key, key)
+    for key in 'aabc':
+        cache.get(key)
+    cache.delete('c')
+
+    cache.set('d', 'd')
+    cache.set('e', 'e')
+
+    assert not cache.exists('d')
+    assert all(cache.exists(key) for key in 'abe')
+
+
+def test_fifo_evicts_oldest_write():
+    cache = MemoryCache(max_size=2, eviction_policy=EvictionPolicy.FIFO)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('a', 3)
+
+    cache.set('c', 4)
+
+    assert not cache.exists('b')
+    assert cache.get('a') == 3
+
+
+def test_lru_evicts_least_recently_used_key():
+    cache = MemoryCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+
+    cache.set('c', 3)
+
+    assert not cache.exists('b')
+    assert cache.get_stats().evictions == 1
+    assert cache.get_stats().entry_count == 2
+
+
+def test_expired_entries_are_cleaned_up_promptly():
+    import time
+
+    cache = MemoryCache()
+    cache.set('short', 1, ttl=0.05)
+    cache.set('long', 2, ttl=60)
+    cache.set('forever', 3)
+
+    deadline = time.time() + 2
+    while 'short' in cache._cache and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert 'short' not in cache._cache
+    assert cache.get('long') == 2 and cache.get('forever') == 3
+    assert cache.get_stats().entry_count == 2
+
+
+def test_cleanup_skips_stale_heap_entries():
+    cache = MemoryCache()
+    cache.set('a', 1, ttl=-1)
+    cache.set('a', 2)
+
+    cache._cleanup_expired()
+
+    assert cache.get('a') == 2
+    assert cache._expiry_heap == []
+
+
+def test_ttl_policy_evicts_the_soonest_expiring_entry():
+    cache = MemoryCache(max_size=2, eviction_policy=EvictionPolicy.TTL)
+    cache.set('a', 1, ttl=300)
+    cache.set('b', 2, ttl=100)
+
+    cache.set('c', 3, ttl=200)
+
+    assert not cache.exists('b')
+    assert cache.exists('a') and cache.exists('c')
+
+
+def test_read_write_lock_shares_readers_and_excludes_writers():
+    import threading
+
+    lock = ReadWriteLock()
+    both_reading = threading.Barrier(2, timeout=2)
+    events = []
+
+    def reader():
+        with lock.reader:
+            both_reading.wait()
+
+    def writer():
+        with lock.writer:
+            events.append('write')
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in readers:
+        thread.start()
+    for thread in readers:
+        thread.join(timeout=5)
+    assert not any(thread.is_alive() for thread in readers)
+
+    with lock.reader:
+        blocked = threading.Thread(target=writer)
+        blocked.start()
+        blocked.join(timeout=0.1)
+        assert events == []
+    blocked.join(timeout=5)
+    assert events == ['write']
+
+
+def test_read_write_lock_is_reentrant_for_the_writer():
+    lock = ReadWriteLock()
+
+    with lock.writer:
+        with lock.writer:
+            with lock.reader:
+                pass
+
+    with lock.writer:
+        pass
+
+
+def test_concurrent_gets_count_every_hit():
+    import threading
+
+    cache = MemoryCache(eviction_policy=EvictionPolicy.FIFO)
+    cache.set('a', 1)
+
+    def hammer():
+        for _ in range(2000):
+            cache.get('a')
+            cache.get('missing')
+
+    threads = [threading.Thread(target=hammer) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.get_stats()
+    assert stats.hits == 8000 and stats.misses == 8000
+
+
+def test_tag_lookups_follow_sets_overwrites_and_deletes():
+    cache = MemoryCache()
+    cache.set('a', 1, tags=['red', 'round'])
+    cache.set('b', 2, tags=['red'])
+    cache.set('c', 3, tags=['blue'])
+    cache.set('d', 4, tags=['red'], ttl=-1)
+    cache.set('b', 5, tags=['green'])
+
+    assert cache.get_by_tags(['red']) == {'a': 1}
+    assert cache.get_by_tags(['green', 'blue']) == {'b': 5, 'c': 3}
+    assert cache.get_by_tags(['missing']) == {}
+
+    assert cache.delete_by_tags(['round', 'blue']) == 2
+    assert not cache.exists('a') and not cache.exists('c')
+    assert 'round' not in cache._tag_index and 'blue' not in cache._tag_index
+
+    cache.clear()
+    assert cache.get_by_tags(['green']) == {}
+
+
+def test_stats_track_sizes_incrementally():
+    cache = MemoryCache(max_size=2)
+    cache.set('a', 'x' * 100)
+    cache.set('b', 'y' * 10)
+    cache.set('a', 'z')
+    cache.set('c', 'w' * 50)
+    cache.get('a')
+    cache.get('b')
+
+    stats = cache.get_stats()
+
+    entries = cache._cache.values()
+    assert stats.entry_count == len(entries) == 2
+    assert stats.memory_usage == stats.total_size == sum(entry.size for entry in entries)
+    assert stats.hit_rate == 0.5
+
+
+def test_entry_sizes_are_estimated_without_pickling():
+    import sys
+
+    import numpy as np
+
+    from utils.cache_manager import CacheEntry
+
+    class Unpicklable:
+        def __reduce__(self):
+            raise TypeError('no pickling')
+
+    def size_of(value):
+        return CacheEntry('k', value, 0.0, 0.0).size
+
+    assert size_of(b'abcd') == 4
+    assert size_of(np.zeros(1000)) == 8000
+    assert size_of('x' * 100) == sys.getsizeof('x' * 100)
+    assert size_of([b'ab', b'cd']) == sys.getsizeof([b'ab', b'cd']) + 4
+    assert size_of({'a': np.zeros(10)}) == sys.getsizeof({'a': 0}) + sys.getsizeof('a') + 80
+    assert size_of(Unpicklable()) > 0
+
+
+def test_entries_expire_on_the_monotonic_clock(monkeypatch):
+    from types import SimpleNamespace
+
+    from utils import cache_manager
+
+    clock = [10_000_000_000]
+    monkeypatch.setattr(cache_manager, 'time', SimpleNamespace(monotonic_ns=lambda: clock[0]))
+    cache = MemoryCache()
+    cache.set('a', 1, ttl=1.5)
+
+    clock[0] += 1_500_000_000
+    assert cache.get('a') == 1
+    assert cache._cache['a'].last_accessed == clock[0]
+
+    clock[0] += 1
+    assert cache.get('a') is None
+    assert cache.get_stats().evictions == 1
+
+
+def test_sharded_cache_routes_keys_and_aggregates_stats():
+    cache = ShardedMemoryCache(max_size=64, shards=3)
+    assert len(cache._shards) == 4
+    assert all(shard.max_size == 16 for shard in cache._shards)
+
+    for index in range(20):
+        cache.set(f'k{index}', index, tags=['even' if index % 2 == 0 else 'odd'])
+    for index in range(25):
+        cache.get(f'k{index}')
+
+    assert sum(len(shard._cache) for shard in cache._shards) == 20
+    assert all(cache._shard(f'k{index}').exists(f'k{index}') for index in range(20))
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.entry_count) == (20, 5, 20)
+    assert stats.hit_rate == 0.8
+    assert stats.memory_usage == sum(shard.get_stats().total_size for shard in cache._shards)
+
+    assert cache.get_by_tags(['odd']) == {f'k{index}': index for index in range(1, 20, 2)}
+    assert cache.delete_by_tags(['even']) == 10
+    assert cache.delete('k1') and not cache.exists('k1')
+    assert cache.clear() and cache.get_stats().entry_count == 0
+
+
+def test_generated_cache_keys_are_stable_and_distinct():
+    import threading
+
+    from utils.cache_manager import _generate_cache_key
+
+    key = _generate_cache_key('f', (1, 'a'), {'b': 2, 'c': [3]})
+
+    assert len(key) == 16
+    assert key == _generate_cache_key('f', (1, 'a'), {'c': [3], 'b': 2})
+    assert key != _generate_cache_key('g', (1, 'a'), {'b': 2, 'c': [3]})
+    assert key != _generate_cache_key('f', (1, 'a'), {'b': 2, 'c': [4]})
+    lock = threading.Lock()
+    assert _generate_cache_key('f', (lock,), {}) == _generate_cache_key('f', (lock,), {})
+
+
+def test_hash_ring_lookup_matches_linear_scan():
+    import hashlib
+
+    from utils.cache_manager import DistributedCache
+
+    cache = DistributedCache(['node-a', 'node-b', 'node-c'])
+    ring_keys = sorted(cache.hash_ring)
+
+    for index in range(2000):
+        key = f'key{index}'
+        key_hash = int(hashlib.md5(key.encode()).hexdigest(), 16)
+        expected = next((ring_key for ring_key in ring_keys if key_hash <= ring_key), ring_keys[0])
+        assert cache._get_node(key) == cache.hash_ring[expected]
+
+
+def test_bulk_operations_match_single_key_calls():
+    for cache in (MemoryCache(), ShardedMemoryCache(shards=4)):
+        assert cache.mset({'a': 1, 'b': 2, 'c': 3})
+        cache.set('old', 0, ttl=-1)
+
+        assert cache.mget(['a', 'missing', 'c', 'old']) == {'a': 1, 'c': 3}
+        assert cache.mdelete(['b', 'missing', 'b', 'c']) == [True, False, False, True]
+        assert cache.mget(['a', 'b', 'c']) == {'a': 1}
+
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.entry_count) == (3, 4, 1)
+
+
+def test_bulk_get_promotes_lru_entries():
+    cache = MemoryCache(max_size=3)
+    cache.mset({'a': 1, 'b': 2, 'c': 3})
+    cache.mget(['a', 'b'])
+
+    cache.set('d', 4)
+
+    assert not cache.exists('c')
+
+
+def test_batch_groups_consecutive_operations():
+    from utils.cache_manager import CacheBatch
+
+    cache = MemoryCache()
+    calls = []
+    for name in ('mget', 'mset', 'mdelete'):
+        method = getattr(cache, name)
+        setattr(cache, name, lambda *args, _method=method, _name=name: calls.append(_name) or _method(*args))
+
+    results = (CacheBatch(cache)
+               .set('a', 1).set('b', 2).set('c', 3, ttl=60)
+               .get('a').get('c').get('x')
+               .delete('a').delete('x')
+               .get('a')
+               .execute())
+
+    assert results == [True, True, True, 1, 3, None, True, False, None]
+    assert calls == ['mset', 'mset', 'mget', 'mdelete', 'mget']
+    assert cache._cache['c'].ttl == 60 and cache._cache['b'].ttl is None
+
+
+def test_batch_runs_against_hybrid_cache():
+    from utils.cache_manager import CacheBackend, CacheBatch, cache_manager
+
+    cache = cache_manager.create_cache('batch_hybrid', CacheBackend.HYBRID)
+    try:
+        cache.set('a', 1)
+        assert CacheBatch(cache).get('a').set('b', 2).delete('a').execute() == [1, True, True]
+        assert cache.get('b') == 2 and cache.get('a') is None
+    finally:
+        cache_manager.caches.pop('batch_hybrid', None)
+
+
+def test_multi_level_set_sizes_value_once(monkeypatch):
+    from utils.cache_manager import CacheEntry, CacheLevel, MultiLevelCache, _fast_sizeof
+
+    cache = MultiLevelCache()
+    for level in CacheLevel:
+        cache.add_level(level, MemoryCache())
+    sized = []
+    monkeypatch.setattr(CacheEntry, '_calculate_size', lambda entry: sized.append(entry) or 1)
+
+    assert cache.set('k', [1, 2, 3], ttl=60)
+
+    assert sized == []
+    entries = [level_cache._cache['k'] for level_cache in cache.levels.values()]
+    assert len({id(entry) for entry in entries}) == 3
+    assert {entry.size for entry in entries} == {_fast_sizeof([1, 2, 3])}
+    assert all(entry.ttl == 60 for entry in entries)
+
+
+def test_multi_level_hits_promote_one_level_up():
+    from utils.cache_manager import CacheLevel, MultiLevelCache
+
+    cache = MultiLevelCache()
+    for level in CacheLevel:
+        cache.add_level(level, MemoryCache())
+    cache.levels[CacheLevel.L3].set('k', 'v')
+
+    assert cache.get('k') == 'v'
+    assert cache.levels[CacheLevel.L2].exists('k')
+    assert not cache.levels[CacheLevel.L1].exists('k')
+
+    assert cache.get('k') == 'v'
+    assert cache.levels[CacheLevel.L1].exists('k')
+
+
+def test_caches_share_one_cleanup_thread_and_can_be_collected():
+    import gc
+    import threading
+    import weakref
+
+    MemoryCache()
+    before = threading.active_count()
+    caches = [MemoryCache() for _ in range(10)]
+    assert threading.active_count() == before
+
+    refs = [weakref.ref(cache) for cache in caches]
+    del caches
+    gc.collect()
+    assert all(cache_ref() is None for cache_ref in refs)
+
+
+def test_async_cache_result_collapses_concurrent_misses():
+    import asyncio
+
+    from utils.cache_manager import CacheManager, async_cache_result
+
+    calls = []
+
+    @async_cache_result(ttl=60)
+    async def load(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async def scenario():
+        first = await asyncio.gather(*(load(21) for _ in range(10)), load(5))
+        second = await load(21)
+        return first, second
+
+    try:
+        first, second = asyncio.run(scenario())
+    finally:
+        CacheManager().get_cache().clear()
+
+    assert first == [42] * 10 + [10]
+    assert second == 42
+    assert sorted(calls) == [5, 21]
+
+
+def test_async_cache_result_shares_failures_without_caching_them():
+    import asyncio
+
+    import pytest
+
+    from utils.cache_manager import async_cache_result
+
+    calls = []
+
+    @async_cache_result()
+    async def explode():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError('boom')
+
+    async def scenario():
+        results = await asyncio.gather(explode(), explode(), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        with pytest.raises(ValueError):
+            await explode()
+
+    asyncio.run(scenario())
+    assert len(calls) == 2
+
+
+def test_cache_entries_carry_no_instance_dict():
+    import sys
+
+    import pytest
+
+    from utils.cache_manager import CacheEntry, CacheStats
+
+    if sys.version_info < (3, 10):
+        pytest.skip('dataclass slots need Python 3.10')
+
+    entry = CacheEntry('k', 'v', 0, 0, ttl=1)
+    assert not hasattr(entry, '__dict__')
+    assert not hasattr(CacheStats(), '__dict__')
+    assert entry.metadata is None and entry.ttl_ns == 1_000_000_000
+
+
+def test_burst_inserts_evict_in_one_pass_per_policy():
+    for policy in EvictionPolicy:
+        cache = MemoryCache(max_size=5, eviction_policy=policy)
+        for index in range(5):
+            cache.set(f'k{index}', index, ttl=100 + index)
+        cache.max_size = 2
+
+        cache.set('new', 'v', ttl=1000)
+
+        stats = cache.get_stats()
+        assert len(cache._cache) == stats.entry_count == 2, policy
+        assert stats.evictions == 4, policy
+        assert stats.total_size == sum(entry.size for entry in cache._cache.values())
+        if policy in (EvictionPolicy.LRU, EvictionPolicy.FIFO, EvictionPolicy.TTL):
+            assert list(cache._cache) == ['k4', 'new'], policy
+
+
+def test_memory_limit_evicts_until_under_budget():
+    cache = MemoryCache(max_memory=250)
+    for index in range(4):
+        cache.set(f'k{index}', b'x' * 100)
+
+    assert list(cache._cache) == ['k2', 'k3']
+    assert cache.get_stats().total_size == 200
+
+    cache.set('huge', b'x' * 1000)
+    assert len(cache._cache) == 0 and cache.get_stats().total_size == 0
+
+
+class _StubManager:
+    def __init__(self, caches):
+        self.caches = caches
+
+    def get_all_stats(self):
+        return {name: cache.get_stats() for name, cache in self.caches.items()}
+
+
+def test_monitor_logs_only_when_stats_change(caplog):
+    import logging
+    import time
+
+    from utils.cache_manager import CacheLevel, CacheMonitor, MultiLevelCache
+
+    cache = MemoryCache()
+    levels = MultiLevelCache()
+    levels.add_level(CacheLevel.L1, MemoryCache())
+    monitor = CacheMonitor(_StubManager({'plain': cache, 'tiered': levels}))
+
+    with caplog.at_level(logging.INFO):
+        monitor.start_monitoring(interval=0.01)
+        time.sleep(0.1)
+        cache.set('a', 1)
+        time.sleep(0.1)
+        started = time.monotonic()
+        monitor.stop_monitoring()
+
+    assert time.monotonic() - started < 1
+    messages = [record.getMessage() for record in caplog.records]
+    assert len([message for message in messages if message.startswith("Cache 'plain'")]) == 2
+    assert len([message for message in messages if message.startswith("Cache 'tiered/L1'")]) == 2
+
+
+def test_stream_stats_yields_on_change():
+    import asyncio
+
+    from utils.cache_manager import CacheMonitor
+
+    cache = MemoryCache()
+    monitor = CacheMonitor(_StubManager({'plain': cache}))
+
+    async def scenario():
+        stream = monitor.stream_stats(interval=0.01)
+        first = await stream.__anext__()
+        entries = [first['plain'].entry_count]
+        cache.set('a', 1)
+        second = await stream.__anext__()
+        entries.append(second['plain'].entry_count)
+        await stream.aclose()
+        return entries
+
+    assert asyncio.run(scenario()) == [0, 1]
+
+
+def test_cache_result_keys_simple_arguments_without_hashing(monkeypatch):
+    from utils import cache_manager
+    from utils.cache_manager import CacheManager, cache_result
+
+    cache = CacheManager().create_cache('decorated')
+    generated = []
+    real_generate = cache_manager._generate_cache_key
+    monkeypatch.setattr(cache_manager, '_generate_cache_key',
+                        lambda *args: generated.append(args) or real_generate(*args))
+    calls = []
+
+    @cache_result('decorated', tags=['squares'])
+    def square(value):
+        calls.append(value)
+        return [value * value]
+
+    try:
+        assert square(3) == [9] and square(3) == [9]
+        assert square(True) == [1] and square(1) == [1]
+        assert square(value=3) == [9]
+        assert calls == [3, True, 1, 3]
+        assert len(generated) == 2
+        assert len(cache.get_by_tags(['squares'])) == 4
+        assert all(isinstance(key, str) for key in cache._cache)
+    finally:
+        CacheManager().delete_cache('decorated')
+
+
+def test_lru_reads_are_buffered_until_eviction_needs_them():
+    cache = MemoryCache(max_size=3)
+    for key in 'abc':
+        cache.set(key, key)
+
+    cache.get('a')
+    cache.mget(['b'])
+    assert list(cache._cache) == ['a', 'b', 'c']
+    assert list(cache._read_buffer) == ['a', 'b']
+
+    cache.set('d', 'd')
+
+    assert list(cache._cache) == ['a', 'b', 'd']
+    assert not cache._read_buffer
+
+
+def test_full_read_buffer_is_drained_inline():
+    from utils.cache_manager import READ_BUFFER_SIZE
+
+    cache = MemoryCache()
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    for _ in range(READ_BUFFER_SIZE):
+        cache.get('a')
+
+    assert not cache._read_buffer
+    assert list(cache._cache) == ['b', 'a']
+
+
+def test_cache_manager_is_the_module_instance():
+    from utils.cache_manager import CacheManager, cache_manager
+
+    assert CacheManager() is cache_manager is CacheManager()
+    assert cache_manager.get_cache() is cache_manager.default_cache
+    assert cache_manager.get_cache('unknown') is cache_manager.default_cache
+
+
+def test_tinylfu_keeps_hot_keys_through_a_scan():
+    def hot_hits(policy):
+        cache = MemoryCache(max_size=10, eviction_policy=policy)
+        hot = list(range(5))
+        for _ in range(10):
+            for key in hot:
+                if cache.get(key) is None:
+                    cache.set(key, key)
+        for key in range(100, 130):
+            cache.set(key, key)
+        return sum(cache.exists(key) for key in hot)
+
+    assert hot_hits(EvictionPolicy.LRU) == 0
+    assert hot_hits(EvictionPolicy.TINYLFU) == 5
+
+
+def test_tinylfu_admits_keys_that_become_frequent():
+    cache = MemoryCache(max_size=2, eviction_policy=EvictionPolicy.TINYLFU)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.get('b')
+
+    assert not cache.set('c', 3)
+    for _ in range(3):
+        cache.get('c')
+    assert cache.set('c', 3)
+
+    assert cache.get('c') == 3 and len(cache._cache) == 2
+    assert not cache.exists('a')
+
+
+def test_count_min_sketch_ages_counters():
+    from utils.cache_manager import _CountMinSketch4
+
+    sketch = _CountMinSketch4(capacity=4)
+    for _ in range(20):
+        sketch.increment('hot')
+    assert sketch.estimate('hot') == 15
+    assert sketch.estimate('cold') <= 1
+
+    for index in range(40):
+        sketch.increment(f'other{index}')
+    assert sketch.estimate('hot') < 15
@@ -0,0 +1,793 @@
+import pytest
+
+from utils.config_manager import ConfigError, JSONLoader, TOMLLoader, YAMLLoader
+
+
+def test_yaml_loader_round_trips(tmp_path):
+    path = tmp_path / 'config.yaml'
+    data = {'server': {'host': 'localhost', 'ports': [80, 443]}, 'debug': True, 'name': 'café'}
+
+    YAMLLoader().save(data, str(path))
+
+    assert YAMLLoader().load(str(path)) == data
+    assert 'café' in path.read_text(encoding='utf-8')
+
+
+def test_yaml_loader_reads_empty_file_as_empty_dict(tmp_path):
+    path = tmp_path / 'empty.yaml'
+    path.write_text('')
+
+    assert YAMLLoader().load(str(path)) == {}
+
+
+def test_toml_loader_round_trips(tmp_path):
+    path = tmp_path / 'config.toml'
+    data = {'title': 'app', 'database': {'port': 5432, 'ratio': 0.5, 'enabled': True}}
+
+    TOMLLoader().save(data, str(path))
+
+    assert TOMLLoader().load(str(path)) == data
+
+
+@pytest.mark.parametrize('loader, suffix, text', [
+    (TOMLLoader(), 'toml', 'key = '),
+    (YAMLLoader(), 'yaml', 'a: [1, 2'),
+    (JSONLoader(), 'json', '{"a": '),
+])
+def test_loaders_wrap_parse_errors(tmp_path, loader, suffix, text):
+    path = tmp_path / f'broken.{suffix}'
+    path.write_text(text)
+
+    with pytest.raises(ConfigError):
+        loader.load(str(path))
+
+
+def test_validator_applies_defaults_and_reports_errors():
+    from utils.config_manager import ConfigSchema, ConfigValidator, ValidationRule
+
+    schema = ConfigSchema(rules=[
+        ValidationRule('server.port', lambda v: isinstance(v, int), 'port must be an int'),
+        ValidationRule('server.host', lambda v: True, 'unused', default_value='localhost'),
+        ValidationRule('name', lambda v: isinstance(v, str), 'name must be a string'),
+        ValidationRule('optional.flag', lambda v: False, 'unused', required=False),
+    ])
+    validator = ConfigValidator(schema)
+
+    config = {'server': {'port': 8080}, 'name': 'app'}
+    assert validator.validate(config) == {'server': {'port': 8080, 'host': 'localhost'}, 'name': 'app'}
+    assert validator.validate(config) == validator.validate(config)
+
+    with pytest.raises(ConfigError) as excinfo:
+        validator.validate({'server': {'port': 'x'}})
+    message = str(excinfo.value)
+    assert "'server.port': port must be an int" in message
+    assert "'name': Required field is missing" in message
+
+
+def _wait_for_callbacks(manager):
+    manager._notifier.submit(lambda: None).result(timeout=5)
+
+
+@pytest.fixture
+def manager():
+    from utils.config_manager import _ConfigManagerImpl
+
+    manager = _ConfigManagerImpl()
+    yield manager
+    manager.shutdown()
+
+
+def test_checksum_matches_blake2b(manager, tmp_path):
+    import hashlib
+
+    path = tmp_path / 'big.json'
+    payload = b'{"a": "' + b'x' * 200_000 + b'"}'
+    path.write_bytes(payload)
+
+    assert manager._calculate_checksum(str(path)) == hashlib.blake2b(payload).hexdigest()
+
+
+def test_watcher_coalesces_events_and_skips_unchanged_files(manager, tmp_path):
+    from types import SimpleNamespace
+
+    from utils.config_manager import ConfigFormat, ConfigWatcher
+
+    path = tmp_path / 'app.json'
+    path.write_text('{"a": 1}')
+    manager.load_config(str(path), 'app')
+    loader = manager.loaders[ConfigFormat.JSON]
+    parses = []
+    load = loader.load
+    loader.load = lambda source: parses.append(source) or load(source)
+    watcher = ConfigWatcher(manager, str(path))
+    watcher.debounce_delay = 60
+    event = SimpleNamespace(is_directory=False, src_path=str(path))
+
+    watcher.on_modified(event)
+    manager._flush_reloads()
+    assert parses == []
+
+    path.write_text('{"a": 2}')
+    for _ in range(5):
+        watcher.on_modified(event)
+    manager._flush_reloads()
+    assert parses == [str(path)]
+    assert manager.get('a', profile_name='app') == 2
+    assert manager._reload_timer is None
+
+
+def test_load_config_skips_unchanged_files_unless_profile_was_edited(manager, tmp_path):
+    from utils.config_manager import ConfigFormat
+
+    path = tmp_path / 'app.json'
+    path.write_text('{"a": 1, "b": {"c": 2}}')
+    loader = manager.loaders[ConfigFormat.JSON]
+    parses = []
+    load = loader.load
+    loader.load = lambda source: parses.append(source) or load(source)
+    changes = []
+    manager.add_change_callback(lambda name, data: changes.append(name))
+
+    manager.load_config(str(path), 'app')
+    manager.load_config(str(path), 'app')
+    manager.reload_config('app')
+    _wait_for_callbacks(manager)
+    assert len(parses) == 1
+    assert len(changes) == 1
+
+    manager.set('a', 5, profile_name='app')
+    manager.reload_config('app')
+    assert len(parses) == 2
+    assert manager.get('a', profile_name='app') == 1
+
+    path.write_text('{"a": 3}')
+    manager.load_config(str(path), 'app', merge=False)
+    assert len(parses) == 3
+    assert manager.get_profile('app').config == {'a': 3}
+
+
+def test_encryption_reuses_derived_keys(monkeypatch):
+    from utils import config_manager as module
+
+    module._key_cache.clear()
+    derivations = []
+    original = module.PBKDF2HMAC
+
+    def counting_kdf(**kwargs):
+        derivations.append(kwargs['salt'])
+        return original(**kwargs)
+
+    monkeypatch.setattr(module, 'PBKDF2HMAC', counting_kdf)
+    salt = b'0123456789abcdef'
+
+    token = module.ConfigEncryption('secret', salt).encrypt('value')
+    assert module.ConfigEncryption('secret', salt).decrypt(token) == 'value'
+    assert len(derivations) == 1
+
+    with pytest.raises(ConfigError):
+        module.ConfigEncryption('other', salt).decrypt(token)
+    assert len(derivations) == 2
+
+
+def test_config_cache_evicts_least_recently_used():
+    from utils.config_manager import ConfigCache
+
+    cache = ConfigCache(max_size=3)
+    for key in 'abc':
+        cache.set(key, key.upper())
+
+    assert cache.get('a') == 'A'
+    cache.set('b', 'B2')
+    cache.set('d', 'D')
+
+    assert list(cache.cache) == ['a', 'b', 'd']
+    assert cache.get('c') is None
+    assert cache.get('b') == 'B2'
+
+
+def test_config_cache_expires_entries(monkeypatch):
+    from types import SimpleNamespace
+
+    from utils import config_manager as module
+
+    now = [1000.0]
+    monkeypatch.setattr(module, 'time', SimpleNamespace(time=lambda: now[0]))
+    cache = module.ConfigCache(ttl=10)
+    cache.set('a', 1)
+
+    now[0] += 9
+    assert cache.get('a') == 1
+    now[0] += 1
+    assert cache.get('a') is None
+    assert 'a' not in cache.cache
+
+
+def test_watched_files_share_one_observer(manager, tmp_path):
+    import time
+
+    first, second = tmp_path / 'first.json', tmp_path / 'second.json'
+    first.write_text('{"a": 1}')
+    second.write_text('{"b": 1}')
+
+    manager.load_config(str(first), 'first', watch=True)
+    manager.load_config(str(second), 'second', watch=True)
+    manager.load_config(str(second), 'second', watch=True)
+
+    assert len(manager.watchers) == 2
+    assert len(manager._observer.emitters) == 1
+
+    second.write_text('{"b": 2}')
+    deadline = time.monotonic() + 5
+    while manager.get('b', profile_name='second') != 2 and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert manager.get('b', profile_name='second') == 2
+    assert manager.get('a', profile_name='first') == 1
+
+
+def test_environment_loader_builds_nested_config(monkeypatch):
+    from utils.config_manager import EnvironmentLoader
+
+    monkeypatch.setenv('CMTEST_DB_HOST', 'localhost')
+    monkeypatch.setenv('CMTEST_DB_PORT', '5432')
+    monkeypatch.setenv('CMTEST_DB_RATIO', '0.25')
+    monkeypatch.setenv('CMTEST_DEBUG', 'True')
+    monkeypatch.setenv('CMTEST_OFFSET', '-3')
+    monkeypatch.setenv('CMTEST_VERSION', '1.2.3')
+    monkeypatch.setenv('CMTEST_SCALE', '1e5')
+    monkeypatch.setenv('OTHER_DB_HOST', 'remote')
+
+    config = EnvironmentLoader(prefix='CMTEST').load()
+
+    assert config == {
+        'db': {'host': 'localhost', 'port': 5432, 'ratio': 0.25},
+        'debug': True,
+        'offset': -3,
+        'version': '1.2.3',
+        'scale': '1e5',
+    }
+
+
+def test_nested_get_set_delete_has(manager):
+    from utils.config_manager import _split_key
+
+    manager.create_profile('app')
+
+    manager.set('logging.handlers.console.level', 'INFO', profile_name='app')
+    manager.set('logging.root', 'WARN', profile_name='app')
+
+    assert manager.get('logging.handlers.console.level', profile_name='app') == 'INFO'
+    assert manager.get('logging.handlers.file', 'none', profile_name='app') == 'none'
+    assert manager.has('logging.root', profile_name='app')
+    assert manager.delete('logging.handlers.console.level', profile_name='app')
+    assert not manager.delete('logging.handlers.console.level', profile_name='app')
+    assert manager.get('logging.handlers.console.level', profile_name='app') is None
+    assert manager.get_profile('app').config == {'logging': {'handlers': {'console': {}}, 'root': 'WARN'}}
+    assert _split_key('logging.root') is _split_key('logging.root')
+
+
+def test_get_reflects_every_kind_of_mutation(manager):
+    manager.create_profile('app', {'db': {'host': 'a', 'port': 1}, 'dotted.key': 'x'})
+
+    assert manager.get('db', profile_name='app') == {'host': 'a', 'port': 1}
+    assert manager.get('dotted.key', 'missing', profile_name='app') == 'missing'
+    assert manager.get('db.user', profile_name='app') is None
+    assert manager.get('db.user', 'root', profile_name='app') == 'root'
+
+    manager.set('db.port', 2, profile_name='app')
+    assert manager.get('db', profile_name='app')['port'] == 2
+    assert manager.get('db.port', profile_name='app') == 2
+
+    profile = manager.get_profile('app')
+    profile.merge({'db': {'user': 'admin'}})
+    assert manager.get('db.user', profile_name='app') == 'admin'
+
+    profile.update({'cache': {'ttl': 5}})
+    assert manager.get('cache.ttl', profile_name='app') == 5
+
+    profile.config = {'db': {'host': 'b'}}
+    assert manager.get('db.host', profile_name='app') == 'b'
+    assert manager.get('cache.ttl', profile_name='app') is None
+
+    manager.delete('db.host', profile_name='app')
+    assert manager.get('db.host', 'gone', profile_name='app') == 'gone'
+    assert manager.get('anything', 'x', profile_name='missing') == 'x'
+
+
+@pytest.mark.parametrize('leaves', [3, 100])
+def test_encrypted_config_round_trips(manager, tmp_path, leaves):
+    import json
+
+    manager.set_encryption('secret', b'0123456789abcdef')
+    config = {'db': {'password': 'hunter2', 'port': 5432}, 'items': {f'k{i}': f'v{i}' for i in range(leaves)}}
+    manager.create_profile('secure', config)
+    path = tmp_path / 'secure.json'
+
+    manager.save_config(str(path), 'secure', encrypted=True)
+
+    stored = json.loads(path.read_text())
+    assert list(stored) == ['db', 'items']
+    assert list(stored['items']) == list(config['items'])
+    assert stored['db']['password'] != 'hunter2'
+
+    manager.load_config(str(path), 'loaded', encrypted=True)
+    loaded = manager.get_profile('loaded').config
+    assert loaded['db'] == {'password': 'hunter2', 'port': '5432'}
+    assert loaded['items'] == config['items']
+
+
+def test_decrypt_keeps_values_that_are_not_ciphertext(manager):
+    manager.set_encryption('secret', b'0123456789abcdef')
+
+    assert manager._decrypt_config({'a': 'plain', 'b': {'c': 1}, 'd': {}}) == {'a': 'plain', 'b': {'c': 1}, 'd': {}}
+
+
+def test_validator_copies_only_when_injecting_defaults():
+    from utils.config_manager import ConfigSchema, ConfigValidator, ValidationRule
+
+    always = lambda v: True
+    validator = ConfigValidator(ConfigSchema(rules=[
+        ValidationRule('server.port', always, 'unused', default_value=80),
+        ValidationRule('server.tls.enabled', always, 'unused', default_value=False),
+    ]))
+
+    complete = {'server': {'port': 1, 'tls': {'enabled': True}}}
+    assert validator.validate(complete) is complete
+
+    config = {'server': {'host': 'h', 'tls': {}}, 'other': {'x': 1}}
+    validated = validator.validate(config)
+
+    assert validated == {'server': {'host': 'h', 'port': 80, 'tls': {'enabled': False}}, 'other': {'x': 1}}
+    assert config == {'server': {'host': 'h', 'tls': {}}, 'other': {'x': 1}}
+    assert validated['other'] is config['other']
+
+
+def test_save_config_leaves_profile_untouched(manager, tmp_path):
+    import json
+
+    config = {'a': {'b': 1}, 'c': [1, 2]}
+    manager.create_profile('plain', config)
+    path = tmp_path / 'out' / 'plain.json'
+
+    manager.save_config(str(path), 'plain')
+
+    assert json.loads(path.read_text()) == config
+    assert manager.get_profile('plain').config is config
+
+
+def test_config_cache_hits_do_not_take_the_lock():
+    import threading
+
+    from utils.config_manager import ConfigCache
+
+    cache = ConfigCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    result = []
+
+    with cache.lock:
+        reader = threading.Thread(target=lambda: result.append(cache.get('a')))
+        reader.start()
+        reader.join(timeout=5)
+
+    assert result == [1]
+    cache.set('c', 3)
+    assert list(cache.cache) == ['a', 'c']
+
+
+def test_json_loader_round_trips(tmp_path):
+    import json
+
+    path = tmp_path / 'config.json'
+    data = {'name': 'café', 'nested': {'list': [1, 2.5, None, True]}, 1: 'int key'}
+
+    JSONLoader().save(data, str(path))
+
+    text = path.read_text(encoding='utf-8')
+    assert 'café' in text
+    assert '\n  "name"' in text
+    assert JSONLoader().load(str(path)) == json.loads(json.dumps(data))
+
+
+@pytest.mark.parametrize('raw, parsed', [
+    ('42', 42), ('-7', -7), ('+3', 3), ('0.5', 0.5), ('.5', 0.5), ('2.', 2.0),
+    ('1.5e-3', 0.0015), ('.5E+2', 50.0),
+    ('FALSE', False), ('true', True), ('1.2.3', '1.2.3'), ('12abc', '12abc'), ('', ''), ('-', '-'),
+])
+def test_environment_values_are_typed(raw, parsed):
+    from utils.config_manager import EnvironmentLoader
+
+    value = EnvironmentLoader()._parse_value(raw)
+
+    assert value == parsed
+    assert type(value) is type(parsed)
+
+
+def test_regex_validator_compiles_once():
+    import re
+
+    from utils.config_manager import ConfigSchema, ConfigValidator, ValidationRule, regex_validator
+
+    is_host = regex_validator(r'[a-z0-9.-]+$')
+    is_word = regex_validator('WORD', re.IGNORECASE)
+    is_digit = regex_validator(re.compile(r'\d'))
+
+    assert is_host('db.internal') and not is_host('DB!') and not is_host(5)
+    assert is_word('word') and is_digit('7a') and not is_digit('a7')
+
+    validator = ConfigValidator(ConfigSchema(rules=[ValidationRule('host', is_host, 'bad host')]))
+    with pytest.raises(ConfigError, match='bad host'):
+        validator.validate({'host': 'not a host'})
+
+
+def test_config_manager_is_the_module_instance():
+    from utils.config_manager import ConfigManager, config_manager, config_property, config_required
+
+    assert ConfigManager() is config_manager is ConfigManager()
+
+    @config_property('cmtest.flag', default='off')
+    class Settings:
+        pass
+
+    @config_required('cmtest.flag')
+    def needs_flag():
+        return config_manager.get('cmtest.flag')
+
+    settings = Settings()
+    assert settings.cmtest_flag == 'off'
+    with pytest.raises(ConfigError):
+        needs_flag()
+
+    settings.cmtest_flag = 'on'
+    try:
+        assert needs_flag() == 'on'
+    finally:
+        config_manager.delete('cmtest')
+
+
+def test_profile_updated_at_follows_monotonic_stamps(manager, monkeypatch):
+    from datetime import timedelta
+    from types import SimpleNamespace
+
+    from utils import config_manager as module
+
+    now = [10_000_000_000]
+    monkeypatch.setattr(module, 'time', SimpleNamespace(monotonic_ns=lambda: now[0], time=lambda: 0.0))
+    manager.create_profile('clock', {'a': 1})
+    profile = manager.get_profile('clock')
+    assert profile.updated_at == profile.created_at
+
+    now[0] += 2_500_000_000
+    manager.set('a', 2, profile_name='clock')
+    assert profile.updated_at - profile.created_at == timedelta(seconds=2.5)
+
+    now[0] += 1_000_000_000
+    profile.merge({'b': 1})
+    assert profile.updated_at - profile.created_at == timedelta(seconds=3.5)
+
+    profile.updated_at = profile.created_at + timedelta(seconds=10)
+    assert profile.updated_at_ns == 20_000_000_000
+
+
+def test_environment_loader_decodes_only_prefixed_values(monkeypatch):
+    import os
+
+    from utils.config_manager import EnvironmentLoader
+
+    monkeypatch.setenv('CMTEST_A_B', '1')
+    monkeypatch.setenv('UNRELATED_CMTEST', '2')
+    fetched = []
+    original = type(os.environ).__getitem__
+
+    def tracking_getitem(environ, key):
+        fetched.append(key)
+        return original(environ, key)
+
+    monkeypatch.setattr(type(os.environ), '__getitem__', tracking_getitem)
+
+    assert EnvironmentLoader(prefix='CMTEST_').load() == {'a': {'b': 1}}
+    assert fetched == ['CMTEST_A_B']
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-8-sig', 'utf-16'])
+def test_yaml_loader_detects_stream_encoding(tmp_path, encoding):
+    path = tmp_path / 'config.yaml'
+    path.write_bytes('name: café\nitems: [1, 2]\n'.encode(encoding))
+
+    assert YAMLLoader().load(str(path)) == {'name': 'café', 'items': [1, 2]}
+
+
+def test_has_treats_explicit_none_as_present(manager):
+    manager.create_profile('app', {'db': {'password': None, 'port': 1}, 'flag': False})
+
+    assert manager.has('db.password', profile_name='app')
+    assert manager.has('flag', profile_name='app')
+    assert manager.has('db', profile_name='app')
+    assert not manager.has('db.port.value', profile_name='app')
+    assert not manager.has('db.user', profile_name='app')
+    assert not manager.has('db', profile_name='missing')
+
+    manager.delete('db.password', profile_name='app')
+    assert not manager.has('db.password', profile_name='app')
+
+
+def test_change_callbacks_run_off_the_calling_thread_in_order(manager):
+    import threading
+
+    manager.create_profile('app')
+    release = threading.Event()
+    seen = []
+
+    def slow(name, changes):
+        release.wait(5)
+        seen.append((name, changes, threading.current_thread() is threading.main_thread()))
+
+    def failing(name, changes):
+        raise RuntimeError('boom')
+
+    manager.add_change_callback(failing)
+    manager.add_change_callback(slow)
+    manager.set('a', 1, profile_name='app')
+    manager.set('a', 2, profile_name='app')
+    manager.remove_change_callback(slow)
+    manager.set('a', 3, profile_name='app')
+
+    assert seen == []
+    assert manager.get('a', profile_name='app') == 3
+    release.set()
+    _wait_for_callbacks(manager)
+    assert seen == [('app', {'a': 1}, False), ('app', {'a': 2}, False)]
+
+
+@pytest.mark.parametrize('name, expected', [
+    ('a.json', 'json'), ('a.YML', 'yaml'), ('a.yaml', 'yaml'), ('a.Toml', 'toml'),
+    ('a.cfg', 'ini'), ('a.conf', 'ini'), ('a.py', 'py'), ('a.txt', 'json'), ('noext', 'json'),
+])
+def test_detect_format_from_suffix(manager, name, expected):
+    from pathlib import Path
+
+    assert manager._detect_format(Path(name)).value == expected
+
+
+def test_profile_merge_is_deep_and_iterative():
+    import sys
+
+    from utils.config_manager import ConfigProfile
+
+    profile = ConfigProfile('p', {'a': {'b': 1, 'c': {'d': 2}}, 'e': [1], 'f': {'g': 1}})
+    profile.merge({'a': {'c': {'x': 3}, 'y': 4}, 'e': [2], 'f': 5, 'h': {'i': 6}})
+
+    assert profile.config == {'a': {'b': 1, 'c': {'d': 2, 'x': 3}, 'y': 4}, 'e': [2], 'f': 5, 'h': {'i': 6}}
+
+    depth = sys.getrecursionlimit() + 100
+    deep_base, deep_update = {}, {}
+    base, update = deep_base, deep_update
+    for _ in range(depth):
+        base['n'], update['n'] = {}, {}
+        base, update = base['n'], update['n']
+    base['old'], update['new'] = 1, 2
+
+    profile = ConfigProfile('deep', deep_base)
+    profile.merge(deep_update)
+
+    node = profile.config
+    for _ in range(depth):
+        node = node['n']
+    assert node == {'old': 1, 'new': 2}
+
+
+def test_monitor_counts_changes_per_profile(manager):
+    from utils.config_manager import ConfigMonitor
+
+    monitor = ConfigMonitor(manager)
+    monitor.coalesce_delay = 60
+    manager.create_profile('app')
+    manager.set('a', 1, profile_name='app')
+    manager.set('c', 3, profile_name='other')
+    _wait_for_callbacks(manager)
+    monitor._flush_changes()
+    manager.set('b', 2, profile_name='app')
+    _wait_for_callbacks(manager)
+    monitor._flush_changes()
+
+    metrics = monitor.get_metrics()
+
+    assert metrics['metrics'] == {'config_changes': 3, 'profile_app_changes': 2, 'profile_other_changes': 1}
+    assert set(metrics['last_access_times']) == {'app', 'other'}
+    assert metrics['total_profiles'] == len(manager.profiles)
+    assert metrics['active_profile'] == 'default'
+
+
+def test_builder_reuses_a_loaded_profile_until_the_file_changes(monkeypatch, tmp_path):
+    import os
+
+    from utils.config_manager import ConfigBuilder, ConfigFormat, config_manager
+
+    path = tmp_path / 'built.json'
+    path.write_text('{"a": 1}')
+    reads = []
+    checksum = config_manager._calculate_checksum
+    monkeypatch.setattr(config_manager, '_calculate_checksum', lambda p: reads.append(p) or checksum(p))
+    builder = ConfigBuilder().from_file(path).with_profile('cmtest_built').with_format(ConfigFormat.JSON)
+
+    try:
+        assert builder.build().get('a', profile_name='cmtest_built') == 1
+        builder.build()
+        builder.build()
+        assert len(reads) == 1
+
+        path.write_text('{"a": 22}')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert builder.build().get('a', profile_name='cmtest_built') == 22
+        assert len(reads) == 2
+
+        config_manager.set('b', 1, profile_name='cmtest_built')
+        builder.with_merge(False).build()
+        assert len(reads) == 3
+        assert config_manager.get_profile('cmtest_built').config == {'a': 22}
+    finally:
+        config_manager.profiles.pop('cmtest_built', None)
+
+
+def test_monitor_formats_monotonic_stamps_lazily(manager, monkeypatch):
+    from datetime import timedelta
+    from types import SimpleNamespace
+
+    from utils import config_manager as module
+
+    now = [5_000_000_000]
+    monkeypatch.setattr(module, 'time', SimpleNamespace(monotonic_ns=lambda: now[0], time=lambda: 0.0))
+    monitor = module.ConfigMonitor(manager)
+
+    now[0] += 1_500_000_000
+    monitor._on_config_change('app', {})
+    now[0] += 2_000_000_000
+    metrics = monitor.get_metrics()
+
+    assert monitor.last_access_times == {'app': 6_500_000_000}
+    assert metrics['uptime_seconds'] == 3.5
+    assert metrics['last_access_times'] == {'app': (monitor.start_time + timedelta(seconds=1.5)).isoformat()}
+
+
+def test_monitor_formats_metrics_once_per_published_batch(manager, monkeypatch):
+    from utils.config_manager import ConfigMonitor
+
+    monitor = ConfigMonitor(manager)
+    monitor._on_config_change('app', {})
+    formatted = []
+    wall_time = monitor._wall_time
+    monkeypatch.setattr(monitor, '_wall_time', lambda stamp: formatted.append(stamp) or wall_time(stamp))
+
+    first = monitor.get_metrics()
+    first['metrics']['config_changes'] = 99
+    second = monitor.get_metrics()
+    assert formatted == []
+    assert second['metrics'] == {'config_changes': 1, 'profile_app_changes': 1}
+    assert second['last_access_times'] == first['last_access_times']
+
+    monitor._on_config_change('other', {})
+    third = monitor.get_metrics()
+    assert len(formatted) == 2
+    assert third['metrics']['config_changes'] == 2
+    assert set(third['last_access_times']) == {'app', 'other'}
+
+
+def _wait_until(predicate, timeout=5):
+    import time
+
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.05)
+    return predicate()
+
+
+def test_watcher_picks_up_atomic_rename_saves(manager, tmp_path):
+    import os
+
+    path = tmp_path / 'atomic.json'
+    path.write_text('{"a": 1}')
+    manager.load_config(str(path), 'atomic', watch=True)
+
+    temp = tmp_path / '.atomic.json.tmp'
+    temp.write_text('{"a": 2}')
+    os.replace(temp, path)
+
+    assert _wait_until(lambda: manager.get('a', profile_name='atomic') == 2)
+
+
+def test_network_filesystems_are_polled(manager, tmp_path, monkeypatch):
+    from utils import config_manager as module
+
+    mounts = tmp_path / 'mounts'
+    mounts.write_text(
+        'rootfs / ext4 rw 0 0\n'
+        f'server:/export {tmp_path}/remote nfs4 rw 0 0\n'
+        f'server:/other {tmp_path}/remote\\040dir cifs rw 0 0\n'
+    )
+    monkeypatch.setattr(module, '_MOUNTS_FILE', str(mounts))
+
+    assert module._network_filesystem(tmp_path / 'remote' / 'app')
+    assert module._network_filesystem(tmp_path / 'remote dir')
+    assert not module._network_filesystem(tmp_path / 'remoteish')
+    assert not module._network_filesystem(tmp_path)
+
+    remote = tmp_path / 'remote'
+    remote.mkdir()
+    path = remote / 'app.json'
+    path.write_text('{"a": 1}')
+    manager.load_config(str(path), 'remote', watch=True)
+
+    assert manager._observer is None
+    assert manager._polling_observer is not None
+
+    path.write_text('{"a": 22}')
+    assert _wait_until(lambda: manager.get('a', profile_name='remote') == 22)
+
+
+def test_monitor_coalesces_bursts_per_profile(manager, monkeypatch):
+    from utils.config_manager import ConfigMonitor
+
+    monitor = ConfigMonitor(manager)
+    monitor.coalesce_delay = 0.3
+    seen = []
+    record = monitor._record_change
+    monkeypatch.setattr(monitor, '_record_change', lambda name: seen.append(name) or record(name))
+
+    manager.create_profile('app')
+    for value in range(5):
+        manager.set('a', value, profile_name='app')
+    manager.set('b', 'x', profile_name='app')
+    manager.set('c', 1, profile_name='other')
+
+    assert _wait_until(lambda: len(seen) == 2)
+    assert sorted(seen) == ['app', 'other']
+    assert monitor.get_metrics()['metrics']['config_changes'] == 2
+    assert monitor._flush_timer is None
+
+
+def test_monitor_counters_materialize_on_demand(manager):
+    from array import array
+
+    from utils.config_manager import ConfigMonitor
+
+    monitor = ConfigMonitor(manager)
+    assert monitor.metrics == {}
+    assert monitor.get_metrics()['metrics'] == {}
+
+    for name in ['a', 'b', 'a']:
+        monitor._on_config_change(name, {})
+
+    assert isinstance(monitor._profile_changes['a'], array)
+    assert monitor.metrics == {'config_changes': 3, 'profile_a_changes': 2, 'profile_b_changes': 1}
+
+
+def test_monitor_readers_never_block_on_the_writer(manager):
+    import threading
+
+    from utils.config_manager import ConfigMonitor
+
+    monitor = ConfigMonitor(manager)
+    monitor._on_config_change('app', {})
+    result = []
+
+    with monitor._write_lock:
+        reader = threading.Thread(target=lambda: result.append(monitor.get_metrics()['metrics']))
+        reader.start()
+        reader.join(timeout=5)
+
+    assert result == [{'config_changes': 1, 'profile_app_changes': 1}]
+
+    writers = [
+        threading.Thread(target=lambda n=n: [monitor._on_config_change(f'p{n % 3}', {}) for _ in range(200)])
+        for n in range(6)
+    ]
+    for writer in writers:
+        writer.start()
+    for _ in range(200):
+        metrics = monitor.get_metrics()['metrics']
+        assert metrics['config_changes'] == sum(v for k, v in metrics.items() if k.startswith('profile_'))
+    for writer in writers:
+        writer.join()
+
+    assert monitor.metrics['config_changes'] == 1201
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.data_pipeline import DataPipeline
+
+
+def _reference(data: pd.DataFrame, batch_size: int) -> pd.DataFrame:
+    batches = []
+    for start in range(0, len(data), batch_size):
+        batch = data[start:start + batch_size].copy()
+        for column in batch.select_dtypes(include=[np.number]).columns:
+            std = batch[column].std()
+            centered = batch[column] - batch[column].mean()
+            batch[column] = centered / std if std != 0 else centered
+        for column in batch.select_dtypes(include=['category']).columns:
+            batch[column] = batch[column].cat.codes
+        batches.append(batch)
+    return pd.concat(batches, ignore_index=True)
+
+
+@pytest.fixture
+def pipeline():
+    pipeline = DataPipeline(num_workers=2, batch_size=7)
+    yield pipeline
+    pipeline.close()
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    size = 53
+    data = pd.DataFrame({
+        'id': np.arange(size),
+        'value': rng.uniform(0, 100, size),
+        'category': pd.Categorical(rng.choice(['A', 'B', 'C'], size)),
+        'label': ['x'] * size,
+    })
+    data.loc[3, 'value'] = np.nan
+    return data
+
+
+def test_process_data_matches_per_batch_pandas(pipeline, frame):
+    result = pipeline.process_data(frame)
+
+    expected = _reference(frame, pipeline.batch_size)
+    assert list(result.columns) == list(frame.columns)
+    np.testing.assert_allclose(result[['id', 'value']], expected[['id', 'value']])
+    assert (result['category'] == expected['category']).all()
+    assert (result['label'] == frame['label']).all()
+
+
+def test_process_data_skips_missing_values(pipeline, frame):
+    result = pipeline.process_data(frame)
+
+    assert result['value'].isna().sum() == 1
+    assert np.isnan(result.loc[3, 'value'])
+
+
+def test_zero_variance_column_becomes_zero(pipeline):
+    data = pd.DataFrame({'constant': [5.0] * 14})
+
+    result = pipeline.process_data(data)
+
+    assert (result['constant'] == 0).all()
+
+
+def test_process_data_is_repeatable(pipeline, frame):
+    first = pipeline.process_data(frame)
+    second = pipeline.process_data(frame)
+
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_process_data_handles_empty_frames(pipeline):
+    assert pipeline.process_data(pd.DataFrame({'id': []})).empty
+    assert list(pipeline.process_data(pd.DataFrame({'label': ['x']}))['label']) == ['x']
+
+
+def test_validate_data_reports_missing_and_duplicate_values():
+    data = pd.DataFrame({'id': [1, 2, 2], 'value': [1.0, np.nan, 3.0]})
+
+    is_valid, errors = DataPipeline.validate_data(data)
+
+    assert not is_valid
+    assert errors == ["Column 'value' contains missing values.", "Duplicate IDs found."]
+
+
+def test_validate_data_accepts_clean_frames():
+    data = pd.DataFrame({'id': [1, 2, 3], 'value': [1.0, 2.0, 3.0]})
+
+    assert DataPipeline.validate_data(data) == (True, [])
+
+
+def test_process_data_assembles_numeric_columns_without_copies(pipeline, frame):
+    result = pipeline.process_data(frame)
+
+    assert result['id'].to_numpy().base is result['value'].to_numpy().base
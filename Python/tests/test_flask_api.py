@@ -0,0 +1,69 @@
+import copy
+import json
+
+import pytest
+
+from api import flask_api
+
+
+@pytest.fixture
+def client():
+    snapshot = copy.deepcopy(flask_api.database)
+    free_ids = list(flask_api._free_ids)
+    flask_api._invalidate_users_payload()
+    with flask_api.app.test_client() as client:
+        yield client
+    flask_api.database[:] = snapshot
+    flask_api._free_ids[:] = free_ids
+    flask_api._invalidate_users_payload()
+
+
+def test_get_users_matches_jsonify(client):
+    for index in range(12):
+        client.post('/users', json={'name': f'user{index}', 'age': index})
+
+    response = client.get('/users')
+
+    users = {user_id: user for user_id, user in enumerate(flask_api.database) if user is not None}
+    with flask_api.app.app_context():
+        expected = flask_api.jsonify(users).get_data()
+    assert list(json.loads(response.data)) == list(json.loads(expected))
+    assert json.loads(response.data) == json.loads(expected)
+    assert response.mimetype == 'application/json'
+
+
+def test_get_users_reflects_create_update_delete(client):
+    client.get('/users')
+
+    created = client.post('/users', json={'name': 'Dana', 'age': 41}).get_json()
+    assert client.get('/users').get_json()[str(created['id'])] == {'name': 'Dana', 'age': 41}
+
+    client.put('/users/1', json={'age': 31})
+    assert client.get('/users').get_json()['1']['age'] == 31
+
+    client.delete('/users/2')
+    assert '2' not in client.get('/users').get_json()
+
+
+def test_helpers_invalidate_cached_payload(client):
+    client.get('/users')
+
+    user_id = flask_api.add_user({'name': 'Eve'})
+
+    assert client.get('/users').get_json()[str(user_id)] == {'name': 'Eve'}
+
+
+def test_deleted_ids_are_reused(client):
+    client.delete('/users/2')
+
+    created = client.post('/users', json={'name': 'Finn'}).get_json()
+
+    assert created['id'] == 2
+    assert client.get('/users/2').get_json() == {'name': 'Finn'}
+
+
+def test_unknown_ids_return_404(client):
+    assert client.get('/users/0').status_code == 404
+    assert client.get('/users/42').status_code == 404
+    assert client.put('/users/42', json={'age': 1}).status_code == 404
+    assert client.delete('/users/42').status_code == 404
@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import LabelEncoder
+
+from ml.ml_utils import FeatureEngineering, MLPipeline, generate_sample_data
+
+
+def test_prepare_data_keeps_label_encoder_codes():
+    df = pd.DataFrame({
+        'level': pd.Categorical(['lo', 'hi', 'mid'] * 4, categories=['lo', 'mid', 'hi']),
+        'colour': ['red', 'blue', 'green', 'blue'] * 3,
+        'target': [0, 1] * 6,
+    })
+    pipeline = MLPipeline()
+    captured = {}
+    pipeline.scaler.fit_transform = lambda X: captured.setdefault('X', X.copy()).to_numpy()
+    pipeline.scaler.transform = lambda X: X.to_numpy()
+
+    pipeline.prepare_data(df, 'target', test_size=0.25)
+
+    X_train = captured['X']
+    for column in ['level', 'colour']:
+        expected = LabelEncoder().fit_transform(df[column].astype(str))
+        np.testing.assert_array_equal(X_train[column], expected[X_train.index])
+
+
+def test_detect_outliers_flags_extreme_values():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(200, 2)), columns=['a', 'b'])
+    df.loc[5, 'a'] = 100.0
+
+    for method in ['iqr', 'zscore']:
+        outliers = FeatureEngineering.detect_outliers(df, method)
+        assert outliers.shape == df.shape
+        assert outliers.loc[5, 'a']
+
+
+def test_detect_outliers_without_numeric_columns():
+    df = pd.DataFrame({'s': ['x', 'y']})
+
+    for method in ['iqr', 'zscore']:
+        assert FeatureEngineering.detect_outliers(df, method).shape == (0, 0)
+
+
+def test_detect_outliers_with_zero_rows():
+    df = pd.DataFrame({'a': pd.Series([], dtype=float)})
+
+    for method in ['iqr', 'zscore']:
+        outliers = FeatureEngineering.detect_outliers(df, method)
+        assert outliers.empty
+        assert list(outliers.columns) == ['a']
+
+
+def test_detect_outliers_matches_per_column_pandas():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(size=(300, 3)), columns=['a', 'b', 'c'])
+    df.loc[7, 'b'] = np.nan
+    df.loc[9, 'c'] = -40.0
+
+    column = df['b']
+    q1, q3 = column.quantile(0.25), column.quantile(0.75)
+    iqr = q3 - q1
+    expected = (column < q1 - 1.5 * iqr) | (column > q3 + 1.5 * iqr)
+
+    outliers = FeatureEngineering.detect_outliers(df, 'iqr')
+    pd.testing.assert_series_equal(outliers['b'], expected)
+
+
+def test_hyperparameter_tuning_runs_under_requested_backend():
+    pipeline = MLPipeline()
+    X_train, _, y_train, _ = pipeline.prepare_data(generate_sample_data(120), 'target')
+    pipeline.models['Logistic Regression'] = LogisticRegression(max_iter=200)
+
+    best = pipeline.hyperparameter_tuning(
+        'Logistic Regression', X_train, y_train, {'C': [0.1, 1.0]}, backend='threading'
+    )
+
+    assert best['C'] in (0.1, 1.0)
+
+
+def test_hyperparameter_tuning_rejects_unknown_backend():
+    pipeline = MLPipeline()
+    pipeline.models['Logistic Regression'] = LogisticRegression()
+
+    with pytest.raises(ValueError):
+        pipeline.hyperparameter_tuning('Logistic Regression', None, None, {}, backend='spark')
+
+
+def test_evaluate_classification_models_matches_sklearn_metrics():
+    from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+    from sklearn.model_selection import cross_val_score
+
+    pipeline = MLPipeline()
+    X_train, X_test, y_train, y_test = pipeline.prepare_data(generate_sample_data(150), 'target')
+    model = LogisticRegression(max_iter=200).fit(X_train, y_train)
+    pipeline.models = {'Logistic Regression': model}
+
+    [result] = pipeline.evaluate_classification_models(X_test, y_test, X_train, y_train)
+
+    y_pred = model.predict(X_test)
+    assert result.accuracy == pytest.approx(accuracy_score(y_test, y_pred))
+    assert result.precision == pytest.approx(precision_score(y_test, y_pred, average='weighted'))
+    assert result.recall == pytest.approx(recall_score(y_test, y_pred, average='weighted'))
+    assert result.f1_score == pytest.approx(f1_score(y_test, y_pred, average='weighted'))
+    np.testing.assert_allclose(result.cv_scores, cross_val_score(model, X_train, y_train, cv=5))
+
+
+def test_forest_tuning_matches_grid_search():
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import GridSearchCV
+
+    pipeline = MLPipeline()
+    X_train, _, y_train, _ = pipeline.prepare_data(generate_sample_data(150), 'target')
+    forest = RandomForestClassifier(random_state=0)
+    pipeline.models['Random Forest'] = forest
+    param_grid = {'n_estimators': [20, 5, 10], 'max_depth': [None, 3]}
+
+    best = pipeline.hyperparameter_tuning('Random Forest', X_train, y_train, param_grid, backend='threading')
+
+    expected = GridSearchCV(forest, param_grid, cv=5, scoring='accuracy').fit(X_train, y_train)
+    assert best == expected.best_params_
+    assert not pipeline.models['Random Forest'].warm_start
+    assert pipeline.models['Random Forest'].n_estimators == best['n_estimators']
+
+
+def test_feature_selection_keeps_best_columns():
+    from sklearn.feature_selection import SelectKBest, f_classif
+
+    df = generate_sample_data(200)
+    X, y = df.drop(columns=['target']), df['target']
+
+    selected = FeatureEngineering.feature_selection(X, y, k=4)
+
+    expected = SelectKBest(f_classif, k=4).fit(X, y)
+    assert list(selected.columns) == list(X.columns[expected.get_support()])
+    np.testing.assert_array_equal(selected.to_numpy(), expected.transform(X))
+
+
+def test_plot_model_comparison_labels_every_bar(monkeypatch):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    from ml.ml_utils import ModelResult
+
+    monkeypatch.setattr(plt, 'show', lambda: None)
+    results = [ModelResult('A', 0.91, 0.9, 0.9, 0.875, []), ModelResult('B', 0.5, 0.5, 0.5, 0.25, [])]
+
+    MLPipeline().plot_model_comparison(results)
+
+    labels = [text.get_text() for text in plt.gca().texts]
+    plt.close('all')
+    assert labels == ['0.910', '0.500', '0.875', '0.250']
+
+
+def test_prepare_data_scales_float32_features():
+    df = generate_sample_data(100)
+
+    X_train, X_test, _, _ = MLPipeline().prepare_data(df, 'target')
+
+    assert X_train.dtype == np.float32 and X_test.dtype == np.float32
+    np.testing.assert_allclose(X_train.mean(axis=0), 0, atol=1e-5)
+    np.testing.assert_allclose(X_train.std(axis=0), 1, atol=1e-4)
+
+
+def test_saved_model_loads_memory_mapped(tmp_path):
+    pipeline = MLPipeline()
+    X_train, X_test, y_train, _ = pipeline.prepare_data(generate_sample_data(120), 'target')
+    pipeline.models['Logistic Regression'] = LogisticRegression(max_iter=200).fit(X_train, y_train)
+    filepath = str(tmp_path / 'model.pkl')
+
+    pipeline.save_model('Logistic Regression', filepath)
+    loaded = MLPipeline()
+    loaded.load_model(filepath, 'Logistic Regression')
+
+    model = loaded.models['Logistic Regression']
+    assert isinstance(model.coef_, np.memmap)
+    np.testing.assert_array_equal(model.predict(X_test), pipeline.models['Logistic Regression'].predict(X_test))
+
+
+def test_predicted_labels_match_predict():
+    pipeline = MLPipeline()
+    X_train, X_test, y_train, _ = pipeline.prepare_data(generate_sample_data(200), 'target')
+
+    for model in pipeline.train_models(X_train, y_train).values():
+        np.testing.assert_array_equal(MLPipeline._predict_labels(model, X_test), model.predict(X_test))
+
+
+def test_generate_sample_data_is_seeded():
+    pd.testing.assert_frame_equal(generate_sample_data(50), generate_sample_data(50))
+    assert not generate_sample_data(50).equals(generate_sample_data(50, random_state=7))
+
+
+def test_prepare_data_split_matches_train_test_split():
+    from sklearn.model_selection import train_test_split
+
+    df = generate_sample_data(100)
+    pipeline = MLPipeline()
+
+    _, _, y_train, y_test = pipeline.prepare_data(df, 'target', test_size=0.3, random_state=3)
+    _, _, y_train_again, _ = pipeline.prepare_data(df, 'target', test_size=0.3, random_state=3)
+
+    expected_train, expected_test = train_test_split(df['target'], test_size=0.3, random_state=3, stratify=df['target'])
+    pd.testing.assert_series_equal(y_train, expected_train)
+    pd.testing.assert_series_equal(y_test, expected_test)
+    pd.testing.assert_series_equal(y_train_again, expected_train)
+    assert len(pipeline._split_cache) == 1
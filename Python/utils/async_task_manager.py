@@ -1,21 +1,33 @@
 import asyncio
+import heapq
 import logging
+import sys
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import (
-    Any, Awaitable, Callable, Dict, List, Optional, Set, Union,
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Union,
     TypeVar, Generic, Coroutine, Tuple
 )
 from uuid import UUID, uuid4
-from functools import wraps
+from functools import partial, wraps
+import numpy as np
 import weakref
 from contextlib import asynccontextmanager
+from collections import OrderedDict, deque
 
 T = TypeVar('T')
 R = TypeVar('R')
 
+SHARED_ARRAY_THRESHOLD = 1 << 20
+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+DEFAULT_TIMEOUT: Any = object()
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -36,7 +48,7 @@ class GroupFailurePolicy(Enum):
     CONTINUE_ON_FAILURE = "continue"
     FAIL_FAST = "fail_fast"
 
-@dataclass
+@dataclass(**_SLOTS)
 class TaskResult(Generic[T]):
     task_id: UUID
     status: TaskStatus
@@ -50,7 +62,7 @@ class TaskResult(Generic[T]):
         if self.start_time and self.end_time:
             self.execution_time = self.end_time - self.start_time
 
-@dataclass
+@dataclass(**_SLOTS)
 class QueuedTask:
     task_id: UUID
     coro: Coroutine
@@ -62,6 +74,79 @@ class QueuedTask:
     retry_delay: float = 1.0
     callback: Optional[Callable] = None
 
+_queued_task_pool: deque = deque(maxlen=4096)
+
+def _acquire_queued_task(
+    task_id: UUID,
+    coro: Coroutine,
+    priority: TaskPriority,
+    timeout: Optional[float],
+    max_retries: int,
+    retry_delay: float,
+    callback: Optional[Callable]
+) -> QueuedTask:
+    if not _queued_task_pool:
+        return QueuedTask(
+            task_id=task_id,
+            coro=coro,
+            priority=priority,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            callback=callback
+        )
+    
+    queued_task = _queued_task_pool.pop()
+    queued_task.task_id = task_id
+    queued_task.coro = coro
+    queued_task.priority = priority
+    queued_task.created_at = time.time()
+    queued_task.timeout = timeout
+    queued_task.retry_count = 0
+    queued_task.max_retries = max_retries
+    queued_task.retry_delay = retry_delay
+    queued_task.callback = callback
+    return queued_task
+
+def _release_queued_task(queued_task: QueuedTask):
+    queued_task.coro = None
+    queued_task.callback = None
+    _queued_task_pool.append(queued_task)
+
+@dataclass(frozen=True)
+class SharedArray:
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+def _share_array(value: Any, segments: List[SharedMemory]) -> Any:
+    if not isinstance(value, np.ndarray) or value.nbytes < SHARED_ARRAY_THRESHOLD or value.dtype.hasobject:
+        return value
+    
+    shm = SharedMemory(create=True, size=value.nbytes)
+    segments.append(shm)
+    np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)[...] = value
+    return SharedArray(name=shm.name, shape=value.shape, dtype=value.dtype.str)
+
+def _call_with_shared_arrays(func: Callable[..., T], args: Tuple, kwargs: Dict[str, Any]) -> T:
+    segments = []
+    
+    def attach(value: Any) -> Any:
+        if not isinstance(value, SharedArray):
+            return value
+        shm = SharedMemory(name=value.name)
+        segments.append(shm)
+        return np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)
+    
+    try:
+        return func(*map(attach, args), **{key: attach(value) for key, value in kwargs.items()})
+    finally:
+        for shm in segments:
+            try:
+                shm.close()
+            except BufferError:
+                pass
+
 class AsyncTaskManager:
     def __init__(
         self,
@@ -69,46 +154,56 @@ class AsyncTaskManager:
         max_queue_size: int = 1000,
         default_timeout: float = 300.0,
         thread_pool_size: int = 10,
-        process_pool_size: int = 4
+        process_pool_size: int = 4,
+        history_size: int = 10_000
     ):
         self.max_concurrent_tasks = max_concurrent_tasks
         self.max_queue_size = max_queue_size
         self.default_timeout = default_timeout
+        self.history_size = history_size
         
         self._running_tasks: Dict[UUID, asyncio.Task] = {}
-        self._task_queue: List[QueuedTask] = []
-        self._task_results: Dict[UUID, TaskResult] = {}
-        self._task_history: List[TaskResult] = []
-        self._semaphore = asyncio.Semaphore(max_concurrent_tasks)
-        self._queue_lock = asyncio.Lock()
+        self._task_queue: List[Tuple[int, int, QueuedTask]] = []
+        self._task_seq = 0
+        self._cancelled_ids: Set[UUID] = set()
+        self._retry_waits: Dict[UUID, Tuple[asyncio.TimerHandle, QueuedTask]] = {}
+        self._task_results: OrderedDict[UUID, TaskResult] = OrderedDict()
+        self._task_done_events: Dict[UUID, asyncio.Event] = {}
+        self._task_history: deque = deque(maxlen=history_size)
+        self._completion_queue: deque = deque()
+        self._completions_ready = asyncio.Event()
+        self._flusher_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
+        self._wake = asyncio.Event()
         self._worker_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         self._thread_executor = ThreadPoolExecutor(max_workers=thread_pool_size)
         self._process_executor = ProcessPoolExecutor(max_workers=process_pool_size)
         
-        self._callbacks: Dict[str, List[Callable]] = {
-            'task_started': [],
-            'task_completed': [],
-            'task_failed': [],
-            'task_cancelled': []
-        }
+        events = ('task_started', 'task_completed', 'task_failed', 'task_cancelled')
+        self._sync_callbacks: Dict[str, List[Callable]] = {event: [] for event in events}
+        self._async_callbacks: Dict[str, List[Callable]] = {event: [] for event in events}
         
         self._metrics = {
             'total_tasks': 0,
             'completed_tasks': 0,
             'failed_tasks': 0,
             'cancelled_tasks': 0,
-            'average_execution_time': 0.0
+            'total_execution_time': 0.0
         }
 
     async def start(self):
+        self._loop = asyncio.get_running_loop()
         if self._worker_task is None or self._worker_task.done():
+            self._wake.set()
             self._worker_task = asyncio.create_task(self._queue_worker())
+            self._flusher_task = asyncio.create_task(self._flush_loop())
             logger.info("AsyncTaskManager started")
 
     async def stop(self):
         self._shutdown_event.set()
+        self._wake.set()
         
         if self._worker_task:
             await self._worker_task
@@ -119,41 +214,51 @@ class AsyncTaskManager:
         if self._running_tasks:
             await asyncio.gather(*self._running_tasks.values(), return_exceptions=True)
         
+        self._completions_ready.set()
+        if self._flusher_task:
+            await self._flusher_task
+        self._flush_completions()
+        
         self._thread_executor.shutdown(wait=True)
         self._process_executor.shutdown(wait=True)
         
+        self._loop = None
         logger.info("AsyncTaskManager stopped")
 
     async def submit_task(
         self,
         coro: Coroutine[Any, Any, T],
         priority: TaskPriority = TaskPriority.MEDIUM,
-        timeout: Optional[float] = None,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
         max_retries: int = 0,
         retry_delay: float = 1.0,
         callback: Optional[Callable[[TaskResult], None]] = None
     ) -> UUID:
         task_id = uuid4()
         
-        if len(self._task_queue) >= self.max_queue_size:
+        if self._queued_count() >= self.max_queue_size:
             raise RuntimeError("Task queue is full")
         
-        queued_task = QueuedTask(
+        queued_task = _acquire_queued_task(
             task_id=task_id,
             coro=coro,
             priority=priority,
-            timeout=timeout or self.default_timeout,
+            timeout=self._resolve_timeout(timeout),
             max_retries=max_retries,
             retry_delay=retry_delay,
             callback=callback
         )
         
-        async with self._queue_lock:
-            self._task_queue.append(queued_task)
-            self._task_queue.sort(key=lambda x: x.priority.value, reverse=True)
+        self._task_done_events[task_id] = asyncio.Event()
+        run_now = self._has_free_slot()
+        if run_now:
+            self._launch_task(queued_task)
+        else:
+            self._push_task(queued_task, queued_task.priority.value)
+            self._wake.set()
         
         self._metrics['total_tasks'] += 1
-        logger.debug(f"Task {task_id} queued with priority {priority.name}")
+        logger.debug(f"Task {task_id} {'started' if run_now else 'queued'} with priority {priority.name}")
         
         return task_id
 
@@ -161,7 +266,7 @@ class AsyncTaskManager:
         self,
         coro: Coroutine[Any, Any, T],
         priority: TaskPriority = TaskPriority.MEDIUM,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = DEFAULT_TIMEOUT
     ) -> T:
         task_id = await self.submit_task(coro, priority, timeout)
         result = await self.wait_for_task(task_id)
@@ -172,52 +277,65 @@ class AsyncTaskManager:
         return result.result
 
     async def wait_for_task(self, task_id: UUID, timeout: Optional[float] = None) -> TaskResult:
-        start_time = time.time()
+        done = self._task_done_events.get(task_id)
         
-        while True:
-            if task_id in self._task_results:
-                return self._task_results[task_id]
-            
-            if timeout and (time.time() - start_time) > timeout:
+        if done is not None:
+            try:
+                await asyncio.wait_for(done.wait(), timeout=timeout or None)
+            except asyncio.TimeoutError:
                 raise asyncio.TimeoutError(f"Waiting for task {task_id} timed out")
-            
-            await asyncio.sleep(0.1)
+        
+        return self._task_results[task_id]
 
     async def cancel_task(self, task_id: UUID) -> bool:
         if task_id in self._running_tasks:
             self._running_tasks[task_id].cancel()
             return True
         
-        async with self._queue_lock:
-            for i, queued_task in enumerate(self._task_queue):
-                if queued_task.task_id == task_id:
-                    del self._task_queue[i]
-                    result = TaskResult(
-                        task_id=task_id,
-                        status=TaskStatus.CANCELLED
-                    )
-                    self._task_results[task_id] = result
-                    self._metrics['cancelled_tasks'] += 1
-                    await self._notify_callbacks('task_cancelled', result)
-                    return True
+        if task_id not in self._task_done_events:
+            return False
+        
+        retry_wait = self._retry_waits.pop(task_id, None)
+        if retry_wait is not None:
+            handle, queued_task = retry_wait
+            handle.cancel()
+            self._discard_queued_task(queued_task)
+        else:
+            self._cancelled_ids.add(task_id)
+            if len(self._cancelled_ids) * 2 > len(self._task_queue):
+                self._compact_queue()
         
-        return False
+        result = TaskResult(
+            task_id=task_id,
+            status=TaskStatus.CANCELLED
+        )
+        self._finish_task(result)
+        self._metrics['cancelled_tasks'] += 1
+        notified = self._notify_callbacks('task_cancelled', result)
+        if notified:
+            await notified
+        return True
 
     async def cancel_all_tasks(self):
-        for task_id in list(self._running_tasks.keys()):
+        for task_id in [*self._running_tasks, *self._retry_waits]:
             await self.cancel_task(task_id)
         
-        async with self._queue_lock:
-            for queued_task in self._task_queue:
-                result = TaskResult(
-                    task_id=queued_task.task_id,
-                    status=TaskStatus.CANCELLED
-                )
-                self._task_results[queued_task.task_id] = result
-                self._metrics['cancelled_tasks'] += 1
-                await self._notify_callbacks('task_cancelled', result)
-            
-            self._task_queue.clear()
+        cancelled, self._task_queue = self._task_queue, []
+        tombstones, self._cancelled_ids = self._cancelled_ids, set()
+        for _, _, queued_task in cancelled:
+            already_cancelled = queued_task.task_id in tombstones
+            self._discard_queued_task(queued_task)
+            if already_cancelled:
+                continue
+            result = TaskResult(
+                task_id=queued_task.task_id,
+                status=TaskStatus.CANCELLED
+            )
+            self._finish_task(result)
+            self._metrics['cancelled_tasks'] += 1
+            notified = self._notify_callbacks('task_cancelled', result)
+            if notified:
+                await notified
 
     async def execute_task_group(
         self,
@@ -228,32 +346,50 @@ class AsyncTaskManager:
         task_ids = []
         
         for coro, priority in tasks:
-            task_id = await self.submit_task(coro, priority, timeout)
+            task_id = await self.submit_task(coro, priority, DEFAULT_TIMEOUT if timeout is None else timeout)
             task_ids.append(task_id)
         
-        results = []
+        waiters = {
+            asyncio.ensure_future(self._task_done_events[task_id].wait()): task_id
+            for task_id in task_ids if task_id in self._task_done_events
+        }
+        finished = set(task_ids) - set(waiters.values())
+        failed = any(self._task_results[task_id].status == TaskStatus.FAILED for task_id in finished)
+        fail_fast = failure_policy == GroupFailurePolicy.FAIL_FAST
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+        timed_out = False
+        
+        while waiters and not (fail_fast and failed):
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait(waiters, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                timed_out = True
+                break
+            
+            for waiter in done:
+                task_id = waiters.pop(waiter)
+                finished.add(task_id)
+                failed = failed or self._task_results[task_id].status == TaskStatus.FAILED
         
+        for waiter in waiters:
+            waiter.cancel()
+        
+        if fail_fast and failed:
+            for remaining_id in waiters.values():
+                await self.cancel_task(remaining_id)
+        
+        results = []
         for task_id in task_ids:
-            try:
-                result = await self.wait_for_task(task_id, timeout)
-                results.append(result)
-                
-                if (failure_policy == GroupFailurePolicy.FAIL_FAST and 
-                    result.status == TaskStatus.FAILED):
-                    for remaining_id in task_ids[len(results):]:
-                        await self.cancel_task(remaining_id)
-                    break
-                    
-            except Exception as e:
-                error_result = TaskResult(
+            if task_id in finished:
+                results.append(self._task_results[task_id])
+            elif timed_out:
+                results.append(TaskResult(
                     task_id=task_id,
                     status=TaskStatus.FAILED,
-                    error=e
-                )
-                results.append(error_result)
-                
-                if failure_policy == GroupFailurePolicy.FAIL_FAST:
-                    break
+                    error=asyncio.TimeoutError(f"Waiting for task {task_id} timed out")
+                ))
         
         return results
 
@@ -263,7 +399,7 @@ class AsyncTaskManager:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         backoff_multiplier: float = 2.0,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = DEFAULT_TIMEOUT
     ) -> T:
         last_exception = None
         current_delay = retry_delay
@@ -288,20 +424,43 @@ class AsyncTaskManager:
 
     async def execute_batch(
         self,
-        items: List[Any],
+        items: Iterable[Any],
         processor: Callable[[Any], Coroutine[Any, Any, R]],
         batch_size: int = 10,
         priority: TaskPriority = TaskPriority.MEDIUM
     ) -> List[TaskResult[R]]:
-        results = []
-        
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            batch_tasks = [(processor(item), priority) for item in batch]
-            batch_results = await self.execute_task_group(batch_tasks)
-            results.extend(batch_results)
+        indexed = [pair async for pair in self.stream_batch(items, processor, batch_size, priority)]
+        indexed.sort(key=lambda pair: pair[0])
+        return [result for _, result in indexed]
+
+    async def stream_batch(
+        self,
+        items: Iterable[Any],
+        processor: Callable[[Any], Coroutine[Any, Any, R]],
+        batch_size: int = 10,
+        priority: TaskPriority = TaskPriority.MEDIUM
+    ) -> AsyncIterator[Tuple[int, TaskResult[R]]]:
+        pending_items = enumerate(items)
+        in_flight: Dict[asyncio.Future, int] = {}
+        
+        async def submit_next():
+            for index, item in pending_items:
+                task_id = await self.submit_task(processor(item), priority)
+                in_flight[asyncio.ensure_future(self.wait_for_task(task_id))] = index
+                return
         
-        return results
+        try:
+            for _ in range(batch_size):
+                await submit_next()
+            
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for waiter in done:
+                    yield in_flight.pop(waiter), waiter.result()
+                    await submit_next()
+        finally:
+            for waiter in in_flight:
+                waiter.cancel()
 
     async def run_in_thread(
         self,
@@ -309,8 +468,8 @@ class AsyncTaskManager:
         *args,
         **kwargs
     ) -> T:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._thread_executor, func, *args, **kwargs)
+        loop = self._loop or asyncio.get_running_loop()
+        return await loop.run_in_executor(self._thread_executor, partial(func, *args, **kwargs))
 
     async def run_in_process(
         self,
@@ -318,35 +477,54 @@ class AsyncTaskManager:
         *args,
         **kwargs
     ) -> T:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._process_executor, func, *args, **kwargs)
+        segments: List[SharedMemory] = []
+        try:
+            call = partial(
+                _call_with_shared_arrays,
+                func,
+                tuple(_share_array(arg, segments) for arg in args),
+                {key: _share_array(value, segments) for key, value in kwargs.items()}
+            )
+            loop = self._loop or asyncio.get_running_loop()
+            return await loop.run_in_executor(self._process_executor, call)
+        finally:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
 
     def add_callback(self, event: str, callback: Callable[[TaskResult], None]):
-        if event in self._callbacks:
-            self._callbacks[event].append(callback)
-        else:
+        if event not in self._sync_callbacks:
             raise ValueError(f"Unknown event type: {event}")
+        
+        if asyncio.iscoroutinefunction(callback):
+            self._async_callbacks[event].append(callback)
+        else:
+            self._sync_callbacks[event].append(callback)
 
     def remove_callback(self, event: str, callback: Callable[[TaskResult], None]):
-        if event in self._callbacks and callback in self._callbacks[event]:
-            self._callbacks[event].remove(callback)
+        for callbacks in (self._sync_callbacks, self._async_callbacks):
+            if event in callbacks and callback in callbacks[event]:
+                callbacks[event].remove(callback)
 
     def get_task_status(self, task_id: UUID) -> Optional[TaskStatus]:
         if task_id in self._running_tasks:
             return TaskStatus.RUNNING
         elif task_id in self._task_results:
             return self._task_results[task_id].status
-        else:
-            for queued_task in self._task_queue:
-                if queued_task.task_id == task_id:
-                    return TaskStatus.PENDING
+        elif task_id in self._task_done_events:
+            return TaskStatus.PENDING
         return None
 
     def get_metrics(self) -> Dict[str, Any]:
+        self._flush_completions()
+        completed = self._metrics['completed_tasks']
         return {
             **self._metrics,
+            'average_execution_time': (
+                self._metrics['total_execution_time'] / completed if completed else 0.0
+            ),
             'running_tasks': len(self._running_tasks),
-            'queued_tasks': len(self._task_queue),
+            'queued_tasks': self._queued_count(),
             'completed_results': len([r for r in self._task_results.values() 
                                     if r.status == TaskStatus.COMPLETED])
         }
@@ -354,27 +532,62 @@ class AsyncTaskManager:
     async def _queue_worker(self):
         while not self._shutdown_event.is_set():
             try:
+                await self._wake.wait()
+                self._wake.clear()
                 await self._process_queue()
-                await asyncio.sleep(0.01)
             except Exception as e:
                 logger.error(f"Queue worker error: {e}")
                 await asyncio.sleep(1.0)
+                self._wake.set()
 
-    async def _process_queue(self):
-        if len(self._running_tasks) >= self.max_concurrent_tasks:
-            return
+    async def _process_queue(self) -> int:
+        launched = 0
         
-        async with self._queue_lock:
-            if not self._task_queue:
-                return
+        while self._task_queue and len(self._running_tasks) < self.max_concurrent_tasks:
+            _, _, queued_task = heapq.heappop(self._task_queue)
+            if queued_task.task_id in self._cancelled_ids:
+                self._cancelled_ids.discard(queued_task.task_id)
+                self._discard_queued_task(queued_task)
+                continue
             
-            queued_task = self._task_queue.pop(0)
+            self._launch_task(queued_task)
+            launched += 1
         
-        await self._semaphore.acquire()
+        return launched
+
+    def _queued_count(self) -> int:
+        return len(self._task_queue) - len(self._cancelled_ids)
+
+    def _compact_queue(self):
+        live = []
+        for entry in self._task_queue:
+            if entry[2].task_id in self._cancelled_ids:
+                self._discard_queued_task(entry[2])
+            else:
+                live.append(entry)
+        heapq.heapify(live)
+        self._task_queue = live
+        self._cancelled_ids.clear()
+
+    @staticmethod
+    def _discard_queued_task(queued_task: QueuedTask):
+        if asyncio.iscoroutine(queued_task.coro):
+            queued_task.coro.close()
+        _release_queued_task(queued_task)
+
+    def _has_free_slot(self) -> bool:
+        return (
+            self._worker_task is not None and not self._worker_task.done()
+            and self._queued_count() == 0
+            and len(self._running_tasks) < self.max_concurrent_tasks
+        )
+
+    def _launch_task(self, queued_task: QueuedTask):
         task = asyncio.create_task(self._execute_queued_task(queued_task))
         self._running_tasks[queued_task.task_id] = task
 
     async def _execute_queued_task(self, queued_task: QueuedTask):
+        retrying = False
         start_time = time.time()
         result = TaskResult(
             task_id=queued_task.task_id,
@@ -382,16 +595,12 @@ class AsyncTaskManager:
             start_time=start_time
         )
         
-        await self._notify_callbacks('task_started', result)
+        notified = self._notify_callbacks('task_started', result)
+        if notified:
+            await notified
         
         try:
-            if queued_task.timeout:
-                task_result = await asyncio.wait_for(
-                    queued_task.coro,
-                    timeout=queued_task.timeout
-                )
-            else:
-                task_result = await queued_task.coro
+            task_result = await self._await_with_timeout(queued_task)
             
             end_time = time.time()
             result.status = TaskStatus.COMPLETED
@@ -399,15 +608,15 @@ class AsyncTaskManager:
             result.end_time = end_time
             result.execution_time = end_time - start_time
             
-            self._metrics['completed_tasks'] += 1
-            self._update_average_execution_time(result.execution_time)
-            
-            await self._notify_callbacks('task_completed', result)
+            notified = self._notify_callbacks('task_completed', result)
+            if notified:
+                await notified
             
         except asyncio.CancelledError:
             result.status = TaskStatus.CANCELLED
-            self._metrics['cancelled_tasks'] += 1
-            await self._notify_callbacks('task_cancelled', result)
+            notified = self._notify_callbacks('task_cancelled', result)
+            if notified:
+                await notified
             
         except Exception as e:
             end_time = time.time()
@@ -417,23 +626,29 @@ class AsyncTaskManager:
             result.execution_time = end_time - start_time
             
             if queued_task.retry_count < queued_task.max_retries:
+                retrying = True
                 queued_task.retry_count += 1
-                await asyncio.sleep(queued_task.retry_delay)
-                
-                async with self._queue_lock:
-                    self._task_queue.insert(0, queued_task)
+                handle = asyncio.get_running_loop().call_later(
+                    queued_task.retry_delay, self._requeue_task, queued_task
+                )
+                self._retry_waits[queued_task.task_id] = (handle, queued_task)
                 
                 logger.info(
                     f"Retrying task {queued_task.task_id} "
                     f"(attempt {queued_task.retry_count}/{queued_task.max_retries})"
                 )
             else:
-                self._metrics['failed_tasks'] += 1
-                await self._notify_callbacks('task_failed', result)
+                notified = self._notify_callbacks('task_failed', result)
+                if notified:
+                    await notified
         
         finally:
-            self._task_results[queued_task.task_id] = result
-            self._task_history.append(result)
+            if retrying:
+                self._store_result(result)
+            else:
+                self._finish_task(result)
+            self._completion_queue.append((result, not retrying))
+            self._completions_ready.set()
             
             if queued_task.callback:
                 try:
@@ -442,24 +657,104 @@ class AsyncTaskManager:
                     logger.error(f"Callback error for task {queued_task.task_id}: {e}")
             
             self._running_tasks.pop(queued_task.task_id, None)
-            self._semaphore.release()
+            self._wake.set()
+            
+            if not retrying:
+                _release_queued_task(queued_task)
+
+    async def _flush_loop(self):
+        while not self._shutdown_event.is_set():
+            await self._completions_ready.wait()
+            self._completions_ready.clear()
+            self._flush_completions()
+
+    def _flush_completions(self):
+        while self._completion_queue:
+            result, final = self._completion_queue.popleft()
+            self._task_history.append(result)
+            if not final:
+                continue
+            
+            if result.status == TaskStatus.COMPLETED:
+                self._metrics['completed_tasks'] += 1
+                self._metrics['total_execution_time'] += result.execution_time
+            elif result.status == TaskStatus.FAILED:
+                self._metrics['failed_tasks'] += 1
+            elif result.status == TaskStatus.CANCELLED:
+                self._metrics['cancelled_tasks'] += 1
 
-    async def _notify_callbacks(self, event: str, result: TaskResult):
-        for callback in self._callbacks.get(event, []):
+    def _resolve_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        return timeout if timeout and timeout > 0 else None
+
+    @staticmethod
+    async def _await_with_timeout(queued_task: QueuedTask) -> Any:
+        if queued_task.timeout is None:
+            return await queued_task.coro
+        
+        task = asyncio.current_task()
+        expired = False
+        
+        def expire():
+            nonlocal expired
+            expired = True
+            task.cancel()
+        
+        handle = asyncio.get_running_loop().call_later(queued_task.timeout, expire)
+        try:
+            return await queued_task.coro
+        except asyncio.CancelledError:
+            if not expired:
+                raise
+            if hasattr(task, 'uncancel'):
+                task.uncancel()
+            raise asyncio.TimeoutError(f"Task {queued_task.task_id} timed out after {queued_task.timeout}s")
+        finally:
+            handle.cancel()
+
+    def _requeue_task(self, queued_task: QueuedTask):
+        self._retry_waits.pop(queued_task.task_id, None)
+        self._push_task(queued_task, queued_task.priority.value + 1)
+        self._wake.set()
+
+    def _store_result(self, result: TaskResult):
+        self._task_results[result.task_id] = result
+        self._task_results.move_to_end(result.task_id)
+        while len(self._task_results) > self.history_size:
+            self._task_results.popitem(last=False)
+
+    def _finish_task(self, result: TaskResult):
+        self._store_result(result)
+        done = self._task_done_events.pop(result.task_id, None)
+        if done is not None:
+            done.set()
+
+    # The queue is only touched from the event loop thread and never across an
+    # await, so heap updates need no lock.
+    def _push_task(self, queued_task: QueuedTask, priority_value: int):
+        heapq.heappush(self._task_queue, (-priority_value, self._task_seq, queued_task))
+        self._task_seq += 1
+
+    def _notify_callbacks(self, event: str, result: TaskResult) -> Optional[Awaitable[None]]:
+        for callback in self._sync_callbacks[event]:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(result)
-                else:
-                    callback(result)
+                callback(result)
             except Exception as e:
                 logger.error(f"Callback error for event {event}: {e}")
+        
+        if self._async_callbacks[event]:
+            return self._notify_async_callbacks(event, result)
+        return None
 
-    def _update_average_execution_time(self, execution_time: float):
-        completed = self._metrics['completed_tasks']
-        current_avg = self._metrics['average_execution_time']
-        self._metrics['average_execution_time'] = (
-            (current_avg * (completed - 1) + execution_time) / completed
+    async def _notify_async_callbacks(self, event: str, result: TaskResult):
+        outcomes = await asyncio.gather(
+            *(callback(result) for callback in self._async_callbacks[event]),
+            return_exceptions=True
         )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error(f"Callback error for event {event}: {outcome}")
 
     @asynccontextmanager
     async def managed_lifecycle(self):
@@ -499,11 +794,15 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0, backoff: float =
 
 class TaskManagerSingleton:
     _instance: Optional[AsyncTaskManager] = None
-    _lock = asyncio.Lock()
+    _lock: Optional[asyncio.Lock] = None
+    _lock_guard = threading.Lock()
     
     @classmethod
     async def get_instance(cls, **kwargs) -> AsyncTaskManager:
         if cls._instance is None:
+            with cls._lock_guard:
+                if cls._lock is None:
+                    cls._lock = asyncio.Lock()
             async with cls._lock:
                 if cls._instance is None:
                     cls._instance = AsyncTaskManager(**kwargs)
@@ -515,6 +814,7 @@ class TaskManagerSingleton:
         if cls._instance:
             await cls._instance.stop()
             cls._instance = None
+        cls._lock = None
 
 async def example_usage():
     async with AsyncTaskManager().managed_lifecycle() as manager:
@@ -1,21 +1,35 @@
 import asyncio
+import bisect
 import hashlib
+import heapq
+import itertools
 import json
+import os
 import pickle
+import random
+import sys
 import time
 import threading
 from abc import ABC, abstractmethod
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from functools import wraps
-from typing import Any, Dict, List, Optional, Union, Callable, TypeVar, Generic
-from weakref import WeakValueDictionary
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Union, Callable, TypeVar, Generic
+from weakref import WeakValueDictionary, ref
 import logging
 
 T = TypeVar('T')
 
+CLEANUP_INTERVAL_NS = 60 * 1_000_000_000
+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+_SIMPLE_KEY_TYPES = frozenset((str, int, bytes, type(None)))
+
+READ_BUFFER_SIZE = 1024
+
 class CacheBackend(Enum):
     MEMORY = "memory"
     REDIS = "redis"
@@ -29,44 +43,63 @@ class EvictionPolicy(Enum):
     FIFO = "fifo"
     TTL = "ttl"
     RANDOM = "random"
+    TINYLFU = "tinylfu"
 
 class CacheLevel(Enum):
     L1 = 1
     L2 = 2
     L3 = 3
 
-@dataclass
+def _fast_sizeof(value: Any, depth: int = 2) -> int:
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+
+    size = sys.getsizeof(value)
+    if depth and isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_fast_sizeof(item, depth - 1) for item in value)
+    elif depth and isinstance(value, dict):
+        size += sum(_fast_sizeof(k, depth - 1) + _fast_sizeof(v, depth - 1)
+                    for k, v in value.items())
+    return size
+
+@dataclass(**_SLOTS)
 class CacheEntry:
     key: str
     value: Any
-    created_at: float
-    last_accessed: float
+    created_at: int
+    last_accessed: int
     access_count: int = 0
     ttl: Optional[float] = None
     size: int = 0
     tags: List[str] = field(default_factory=list)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
+    ttl_ns: Optional[int] = field(default=None, init=False, repr=False)
 
     def __post_init__(self):
         if self.size == 0:
             self.size = self._calculate_size()
+        if self.ttl is not None:
+            self.ttl_ns = int(self.ttl * 1_000_000_000)
 
     def _calculate_size(self) -> int:
-        try:
-            return len(pickle.dumps(self.value))
-        except:
-            return len(str(self.value).encode('utf-8'))
+        return _fast_sizeof(self.value)
 
-    def is_expired(self) -> bool:
-        if self.ttl is None:
+    def is_expired(self, now: Optional[int] = None) -> bool:
+        if self.ttl_ns is None:
             return False
-        return time.time() - self.created_at > self.ttl
+        if now is None:
+            now = time.monotonic_ns()
+        return now - self.created_at > self.ttl_ns
 
-    def touch(self):
-        self.last_accessed = time.time()
+    def touch(self, now: Optional[int] = None):
+        self.last_accessed = time.monotonic_ns() if now is None else now
         self.access_count += 1
 
-@dataclass
+@dataclass(**_SLOTS)
 class CacheStats:
     hits: int = 0
     misses: int = 0
@@ -81,6 +114,155 @@ class CacheStats:
         total = self.hits + self.misses
         self.hit_rate = self.hits / total if total > 0 else 0.0
 
+class _LockSide:
+    __slots__ = ('acquire', 'release')
+
+    def __init__(self, acquire: Callable, release: Callable):
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+class ReadWriteLock:
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._write_depth = 0
+        self._writers_waiting = 0
+        self.reader = _LockSide(self.acquire_read, self.release_read)
+        self.writer = _LockSide(self.acquire_write, self.release_write)
+
+    def acquire_read(self):
+        with self._cond:
+            if self._writer == threading.get_ident():
+                self._write_depth += 1
+                return
+            while self._writer is not None or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+
+    def release_read(self):
+        with self._cond:
+            if self._writer == threading.get_ident():
+                self._write_depth -= 1
+                return
+            self._readers -= 1
+            if not self._readers:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            self._writers_waiting += 1
+            while self._writer is not None or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        with self._cond:
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+class _CleanupScheduler:
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> '_CleanupScheduler':
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def schedule(self, cache: 'MemoryCache', run_at: int):
+        with self._cond:
+            seq = next(self._seq)
+            cache._cleanup_at = run_at
+            cache._cleanup_seq = seq
+            heapq.heappush(self._heap, (run_at, seq, ref(cache)))
+            if self._heap[0][1] == seq:
+                self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._has_due():
+                    timeout = (self._heap[0][0] - time.monotonic_ns()) / 1e9 if self._heap else None
+                    self._cond.wait(timeout)
+            self._run_due()
+
+    def _has_due(self) -> bool:
+        return bool(self._heap) and self._heap[0][0] <= time.monotonic_ns()
+
+    def _run_due(self):
+        due = []
+        with self._cond:
+            now = time.monotonic_ns()
+            while self._heap and self._heap[0][0] <= now:
+                _, seq, cache_ref = heapq.heappop(self._heap)
+                cache = cache_ref()
+                if cache is not None and cache._cleanup_seq == seq:
+                    due.append(cache)
+
+        for cache in due:
+            try:
+                next_run = cache._run_cleanup()
+            except Exception:
+                logging.exception("Cache cleanup failed")
+                next_run = time.monotonic_ns() + CLEANUP_INTERVAL_NS
+            self.schedule(cache, next_run)
+
+class _CountMinSketch4:
+    _HALVE = bytes(count >> 1 for count in range(256))
+    _SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5)
+
+    def __init__(self, capacity: int):
+        width = 1 << max(6, (max(1, capacity) * 8 - 1).bit_length())
+        self._mask = width - 1
+        self._table = bytearray(width)
+        self._sample_size = 10 * max(1, capacity)
+        self._additions = 0
+
+    def _indexes(self, key: Any) -> List[int]:
+        key_hash = hash(key)
+        mask = self._mask
+        return [((key_hash ^ seed) * seed >> 32) & mask for seed in self._SEEDS]
+
+    def increment(self, key: Any):
+        table = self._table
+        for index in self._indexes(key):
+            if table[index] < 15:
+                table[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._table = table.translate(self._HALVE)
+            self._additions //= 2
+
+    def estimate(self, key: Any) -> int:
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
 class CacheInterface(ABC):
     @abstractmethod
     def get(self, key: str) -> Optional[Any]:
@@ -106,172 +288,365 @@ class CacheInterface(ABC):
     def get_stats(self) -> CacheStats:
         pass
 
+    def mget(self, keys: List[str]) -> Dict[str, Any]:
+        result = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    def mset(self, items: Dict[str, Any], ttl: Optional[float] = None) -> bool:
+        return all([self.set(key, value, ttl) for key, value in items.items()])
+
+    def mdelete(self, keys: List[str]) -> List[bool]:
+        return [self.delete(key) for key in keys]
+
 class MemoryCache(CacheInterface):
     def __init__(self, max_size: int = 1000, max_memory: int = 100 * 1024 * 1024,
                  eviction_policy: EvictionPolicy = EvictionPolicy.LRU):
         self.max_size = max_size
         self.max_memory = max_memory
         self.eviction_policy = eviction_policy
-        self._cache: Dict[str, CacheEntry] = {}
-        self._access_order: OrderedDict = OrderedDict()
+        self._cache: OrderedDict = OrderedDict()
+        self._freq_buckets: Dict[int, OrderedDict] = {}
+        self._min_freq = 0
+        self._expiry_heap: List[tuple] = []
+        self._entry_seq: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self._tag_index: Dict[str, Set[str]] = defaultdict(set)
+        self._read_buffer: deque = deque()
+        self._sketch = _CountMinSketch4(max_size) if eviction_policy == EvictionPolicy.TINYLFU else None
         self._stats = CacheStats()
-        self._lock = threading.RLock()
-        self._cleanup_thread = None
-        self._start_cleanup_thread()
+        self._stats_lock = threading.Lock()
+        self._rw = ReadWriteLock()
+        self._cleanup_at = 0
+        self._cleanup_seq = -1
+        _CleanupScheduler.instance().schedule(self, time.monotonic_ns() + CLEANUP_INTERVAL_NS)
 
     def get(self, key: str) -> Optional[Any]:
-        start_time = time.time()
-
-        with self._lock:
-            if key not in self._cache:
-                self._stats.misses += 1
-                return None
-
-            entry = self._cache[key]
-
-            if entry.is_expired():
-                del self._cache[key]
-                if key in self._access_order:
-                    del self._access_order[key]
-                self._stats.misses += 1
-                self._stats.evictions += 1
-                return None
-
-            entry.touch()
-            self._update_access_order(key)
-            self._stats.hits += 1
+        now = time.monotonic_ns()
+        exclusive = self.eviction_policy == EvictionPolicy.LFU
+        if self._sketch is not None:
+            self._sketch.increment(key)
+
+        with self._rw.writer if exclusive else self._rw.reader:
+            entry = self._cache.get(key)
+            fresh = entry is not None and not entry.is_expired(now)
+            if fresh:
+                entry.touch(now)
+                self._update_access_order(key, entry)
+
+        if fresh:
+            self._record_hit((time.monotonic_ns() - now) / 1e9)
+            if len(self._read_buffer) >= READ_BUFFER_SIZE:
+                self._drain_read_buffer()
+            return entry.value
 
-            access_time = time.time() - start_time
-            self._update_average_access_time(access_time)
+        if entry is not None:
+            with self._rw.writer:
+                if self._cache.get(key) is entry:
+                    self._remove(key)
+                    self._stats.evictions += 1
 
-            return entry.value
+        with self._stats_lock:
+            self._stats.misses += 1
+        return None
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None,
             tags: List[str] = None) -> bool:
-        with self._lock:
-            entry = CacheEntry(
+        now = time.monotonic_ns()
+        with self._rw.writer:
+            return self._insert(CacheEntry(
                 key=key,
                 value=value,
-                created_at=time.time(),
-                last_accessed=time.time(),
+                created_at=now,
+                last_accessed=now,
                 ttl=ttl,
                 tags=tags or []
-            )
-
-            if key in self._cache:
-                old_entry = self._cache[key]
-                self._stats.total_size -= old_entry.size
-            else:
-                self._stats.entry_count += 1
-
-            self._cache[key] = entry
-            self._access_order[key] = True
-            self._stats.total_size += entry.size
-
-            self._enforce_limits()
-            self._stats.update_hit_rate()
+            ))
 
+    def delete(self, key: str) -> bool:
+        with self._rw.writer:
+            return self._remove(key)
+
+    def _set_entry(self, entry: CacheEntry) -> bool:
+        with self._rw.writer:
+            return self._insert(entry)
+
+    def mget(self, keys: List[str]) -> Dict[str, Any]:
+        now = time.monotonic_ns()
+        exclusive = self.eviction_policy == EvictionPolicy.LFU
+        result = {}
+        hits = 0
+        expired = []
+        if self._sketch is not None:
+            for key in keys:
+                self._sketch.increment(key)
+
+        with self._rw.writer if exclusive else self._rw.reader:
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is None:
+                    continue
+                if entry.is_expired(now):
+                    expired.append((key, entry))
+                    continue
+                entry.touch(now)
+                self._update_access_order(key, entry)
+                result[key] = entry.value
+                hits += 1
+
+        if len(self._read_buffer) >= READ_BUFFER_SIZE:
+            self._drain_read_buffer()
+
+        if expired:
+            with self._rw.writer:
+                for key, entry in expired:
+                    if self._cache.get(key) is entry:
+                        self._remove(key)
+                        self._stats.evictions += 1
+
+        with self._stats_lock:
+            self._stats.hits += hits
+            self._stats.misses += len(keys) - hits
+        return result
+
+    def mset(self, items: Dict[str, Any], ttl: Optional[float] = None) -> bool:
+        now = time.monotonic_ns()
+        with self._rw.writer:
+            for key, value in items.items():
+                self._insert(CacheEntry(key=key, value=value, created_at=now,
+                                        last_accessed=now, ttl=ttl))
             return True
 
-    def delete(self, key: str) -> bool:
-        with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                del self._cache[key]
-                if key in self._access_order:
-                    del self._access_order[key]
-                self._stats.total_size -= entry.size
-                self._stats.entry_count -= 1
-                return True
-            return False
+    def mdelete(self, keys: List[str]) -> List[bool]:
+        with self._rw.writer:
+            return [self._remove(key) for key in keys]
 
     def clear(self) -> bool:
-        with self._lock:
+        with self._rw.writer:
             self._cache.clear()
-            self._access_order.clear()
+            self._freq_buckets.clear()
+            self._min_freq = 0
+            self._expiry_heap.clear()
+            self._entry_seq.clear()
+            self._tag_index.clear()
+            self._read_buffer.clear()
             self._stats = CacheStats()
             return True
 
     def exists(self, key: str) -> bool:
-        with self._lock:
-            if key not in self._cache:
-                return False
-            return not self._cache[key].is_expired()
+        with self._rw.reader:
+            entry = self._cache.get(key)
+            return entry is not None and not entry.is_expired()
 
     def get_stats(self) -> CacheStats:
-        with self._lock:
-            self._stats.memory_usage = sum(entry.size for entry in self._cache.values())
+        with self._stats_lock:
+            self._stats.memory_usage = self._stats.total_size
+            self._stats.update_hit_rate()
             return self._stats
 
     def get_by_tags(self, tags: List[str]) -> Dict[str, Any]:
-        with self._lock:
+        with self._rw.reader:
+            now = time.monotonic_ns()
             result = {}
-            for key, entry in self._cache.items():
-                if not entry.is_expired() and any(tag in entry.tags for tag in tags):
+            for key in self._keys_for_tags(tags):
+                entry = self._cache[key]
+                if not entry.is_expired(now):
                     result[key] = entry.value
             return result
 
     def delete_by_tags(self, tags: List[str]) -> int:
-        with self._lock:
-            keys_to_delete = []
-            for key, entry in self._cache.items():
-                if any(tag in entry.tags for tag in tags):
-                    keys_to_delete.append(key)
+        with self._rw.writer:
+            keys_to_delete = self._keys_for_tags(tags)
 
             for key in keys_to_delete:
-                self.delete(key)
+                self._remove(key)
 
             return len(keys_to_delete)
 
-    def _update_access_order(self, key: str):
-        if self.eviction_policy == EvictionPolicy.LRU:
-            self._access_order.move_to_end(key)
+    def _insert(self, entry: CacheEntry) -> bool:
+        if self._read_buffer:
+            self._apply_buffered_reads()
 
-    def _enforce_limits(self):
-        while (len(self._cache) > self.max_size or
-               self._stats.total_size > self.max_memory):
-            self._evict_one()
+        key = entry.key
+        old_entry = self._cache.get(key)
+        if self._sketch is not None and not self._admit(key, old_entry):
+            return False
 
-    def _evict_one(self):
-        if not self._cache:
-            return
+        self._cache[key] = entry
+        if old_entry is None:
+            self._stats.entry_count += 1
+        else:
+            self._cache.move_to_end(key)
+            self._stats.total_size -= old_entry.size
+            self._forget_frequency(key, old_entry)
+            self._unindex_tags(key, old_entry)
+
+        self._record_frequency(key, entry)
+        self._schedule_expiry(key, entry)
+        for tag in entry.tags:
+            self._tag_index[tag].add(key)
+        self._stats.total_size += entry.size
 
-        if self.eviction_policy == EvictionPolicy.LRU:
-            key = next(iter(self._access_order))
+        self._enforce_limits()
+
+        return True
+
+    def _admit(self, key: str, old_entry: Optional[CacheEntry]) -> bool:
+        self._sketch.increment(key)
+        if old_entry is not None or not self._cache or len(self._cache) < self.max_size:
+            return True
+        victim = next(iter(self._cache))
+        return self._sketch.estimate(key) >= self._sketch.estimate(victim)
+
+    def _remove(self, key: str) -> bool:
+        entry = self._cache.pop(key, None)
+        if entry is None:
+            return False
+        self._forget_entry(key, entry)
+        return True
+
+    def _forget_entry(self, key: str, entry: CacheEntry):
+        self._forget_frequency(key, entry)
+        self._entry_seq.pop(key, None)
+        self._unindex_tags(key, entry)
+        self._stats.total_size -= entry.size
+        self._stats.entry_count -= 1
+
+    def _keys_for_tags(self, tags: List[str]) -> Set[str]:
+        return set().union(*(self._tag_index.get(tag, ()) for tag in tags))
+
+    def _unindex_tags(self, key: str, entry: CacheEntry):
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def _update_access_order(self, key: str, entry: CacheEntry):
+        if self.eviction_policy in (EvictionPolicy.LRU, EvictionPolicy.TINYLFU):
+            self._read_buffer.append(key)
         elif self.eviction_policy == EvictionPolicy.LFU:
-            key = min(self._cache.keys(),
-                     key=lambda k: self._cache[k].access_count)
-        elif self.eviction_policy == EvictionPolicy.FIFO:
-            key = min(self._cache.keys(),
-                     key=lambda k: self._cache[k].created_at)
-        elif self.eviction_policy == EvictionPolicy.TTL:
-            expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-            if expired_keys:
-                key = expired_keys[0]
-            else:
-                key = next(iter(self._cache))
-        else:
-            import random
-            key = random.choice(list(self._cache.keys()))
+            self._unlink_frequency(key, entry.access_count - 1)
+            self._freq_buckets.setdefault(entry.access_count, OrderedDict())[key] = None
+
+    def _record_frequency(self, key: str, entry: CacheEntry):
+        if self.eviction_policy == EvictionPolicy.LFU:
+            self._freq_buckets.setdefault(entry.access_count, OrderedDict())[key] = None
+            self._min_freq = min(self._min_freq, entry.access_count)
+
+    def _forget_frequency(self, key: str, entry: CacheEntry):
+        if self.eviction_policy == EvictionPolicy.LFU:
+            self._unlink_frequency(key, entry.access_count)
+
+    def _unlink_frequency(self, key: str, count: int):
+        bucket = self._freq_buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._freq_buckets[count]
+            if self._min_freq == count:
+                self._min_freq = count + 1
+
+    def _least_frequent_key(self) -> str:
+        if self._min_freq not in self._freq_buckets:
+            self._min_freq = min(self._freq_buckets)
+        return next(iter(self._freq_buckets[self._min_freq]))
+
+    def _drain_read_buffer(self):
+        with self._rw.writer:
+            self._apply_buffered_reads()
+
+    def _apply_buffered_reads(self):
+        buffer = self._read_buffer
+        cache = self._cache
+        while buffer:
+            key = buffer.popleft()
+            if key in cache:
+                cache.move_to_end(key)
 
-        self.delete(key)
-        self._stats.evictions += 1
+    def _enforce_limits(self):
+        if not self._over_limits():
+            return
 
-    def _cleanup_expired(self):
-        with self._lock:
-            expired_keys = [k for k, v in self._cache.items() if v.is_expired()]
-            for key in expired_keys:
-                self.delete(key)
-                self._stats.evictions += 1
+        evicted = 0
+        if self.eviction_policy in (EvictionPolicy.LRU, EvictionPolicy.FIFO, EvictionPolicy.TINYLFU):
+            while self._over_limits():
+                key, entry = self._cache.popitem(last=False)
+                self._forget_entry(key, entry)
+                evicted += 1
+        else:
+            next_victim = self._victim_picker()
+            while self._over_limits():
+                self._remove(next_victim())
+                evicted += 1
+        self._stats.evictions += evicted
+
+    def _over_limits(self) -> bool:
+        return bool(self._cache) and (len(self._cache) > self.max_size or
+                                      self._stats.total_size > self.max_memory)
+
+    def _victim_picker(self) -> Callable[[], str]:
+        if self.eviction_policy == EvictionPolicy.LFU:
+            return self._least_frequent_key
+
+        if self.eviction_policy == EvictionPolicy.TTL:
+            def next_expiring():
+                key = self._next_expiring_key()
+                return next(iter(self._cache)) if key is None else key
+            return next_expiring
+
+        keys = list(self._cache)
+
+        def random_key():
+            index = random.randrange(len(keys))
+            keys[index], keys[-1] = keys[-1], keys[index]
+            return keys.pop()
+        return random_key
+
+    def _schedule_expiry(self, key: str, entry: CacheEntry):
+        if entry.ttl_ns is None:
+            self._entry_seq.pop(key, None)
+            return
 
-    def _start_cleanup_thread(self):
-        def cleanup_worker():
-            while True:
-                time.sleep(60)
-                self._cleanup_expired()
+        seq = next(self._seq)
+        self._entry_seq[key] = seq
+        expires_at = entry.created_at + entry.ttl_ns
+        heapq.heappush(self._expiry_heap, (expires_at, seq, key))
+        if expires_at < self._cleanup_at:
+            _CleanupScheduler.instance().schedule(self, expires_at + 1)
 
-        self._cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
-        self._cleanup_thread.start()
+    def _next_expiring_key(self) -> Optional[str]:
+        heap = self._expiry_heap
+        while heap and self._entry_seq.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def _cleanup_expired(self):
+        with self._rw.writer:
+            self._apply_buffered_reads()
+            heap = self._expiry_heap
+            now = time.monotonic_ns()
+            while heap and heap[0][0] < now:
+                _, seq, key = heapq.heappop(heap)
+                if self._entry_seq.get(key) == seq:
+                    self._remove(key)
+                    self._stats.evictions += 1
+
+    def _run_cleanup(self) -> int:
+        self._cleanup_expired()
+        with self._rw.reader:
+            next_run = time.monotonic_ns() + CLEANUP_INTERVAL_NS
+            if self._expiry_heap:
+                next_run = min(next_run, self._expiry_heap[0][0] + 1)
+            return next_run
+
+    def _record_hit(self, access_time: float):
+        with self._stats_lock:
+            self._stats.hits += 1
+            self._update_average_access_time(access_time)
 
     def _update_average_access_time(self, access_time: float):
         total_accesses = self._stats.hits + self._stats.misses
@@ -281,6 +656,91 @@ class MemoryCache(CacheInterface):
                 / total_accesses
             )
 
+class ShardedMemoryCache(CacheInterface):
+    def __init__(self, max_size: int = 1000, max_memory: int = 100 * 1024 * 1024,
+                 eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+                 shards: Optional[int] = None):
+        if shards is None:
+            shards = os.cpu_count() or 1
+        shards = 1 << (shards - 1).bit_length()
+        self._mask = shards - 1
+        self._shards = [
+            MemoryCache(max(1, max_size // shards), max(1, max_memory // shards), eviction_policy)
+            for _ in range(shards)
+        ]
+
+    def _shard(self, key: str) -> MemoryCache:
+        return self._shards[hash(key) & self._mask]
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._shard(key).get(key)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None,
+            tags: List[str] = None) -> bool:
+        return self._shard(key).set(key, value, ttl, tags)
+
+    def delete(self, key: str) -> bool:
+        return self._shard(key).delete(key)
+
+    def clear(self) -> bool:
+        return all([shard.clear() for shard in self._shards])
+
+    def exists(self, key: str) -> bool:
+        return self._shard(key).exists(key)
+
+    def mget(self, keys: List[str]) -> Dict[str, Any]:
+        groups = defaultdict(list)
+        for key in keys:
+            groups[hash(key) & self._mask].append(key)
+
+        result = {}
+        for index, shard_keys in groups.items():
+            result.update(self._shards[index].mget(shard_keys))
+        return result
+
+    def mset(self, items: Dict[str, Any], ttl: Optional[float] = None) -> bool:
+        groups = defaultdict(dict)
+        for key, value in items.items():
+            groups[hash(key) & self._mask][key] = value
+        return all([self._shards[index].mset(group, ttl) for index, group in groups.items()])
+
+    def mdelete(self, keys: List[str]) -> List[bool]:
+        groups = defaultdict(list)
+        for position, key in enumerate(keys):
+            groups[hash(key) & self._mask].append(position)
+
+        results = [False] * len(keys)
+        for index, positions in groups.items():
+            deleted = self._shards[index].mdelete([keys[position] for position in positions])
+            for position, was_deleted in zip(positions, deleted):
+                results[position] = was_deleted
+        return results
+
+    def get_stats(self) -> CacheStats:
+        stats = CacheStats()
+        for shard_stats in map(MemoryCache.get_stats, self._shards):
+            accesses = shard_stats.hits + shard_stats.misses
+            stats.average_access_time += shard_stats.average_access_time * accesses
+            stats.hits += shard_stats.hits
+            stats.misses += shard_stats.misses
+            stats.evictions += shard_stats.evictions
+            stats.total_size += shard_stats.total_size
+            stats.entry_count += shard_stats.entry_count
+        if stats.hits + stats.misses:
+            stats.average_access_time /= stats.hits + stats.misses
+        stats.memory_usage = stats.total_size
+        stats.update_hit_rate()
+        return stats
+
+    def get_by_tags(self, tags: List[str]) -> Dict[str, Any]:
+        result = {}
+        for shard in self._shards:
+            result.update(shard.get_by_tags(tags))
+        return result
+
+    def delete_by_tags(self, tags: List[str]) -> int:
+        return sum(shard.delete_by_tags(tags) for shard in self._shards)
+
 class MultiLevelCache:
     def __init__(self):
         self.levels: Dict[CacheLevel, CacheInterface] = {}
@@ -294,7 +754,7 @@ class MultiLevelCache:
             cache = self.levels[level]
             value = cache.get(key)
             if value is not None:
-                self._promote_to_higher_levels(key, value, level)
+                self._promote_one_level(key, value, level)
                 self._stats.hits += 1
                 return value
 
@@ -302,9 +762,15 @@ class MultiLevelCache:
         return None
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        now = time.monotonic_ns()
+        size = _fast_sizeof(value)
         success = True
         for cache in self.levels.values():
-            success &= cache.set(key, value, ttl)
+            if isinstance(cache, MemoryCache):
+                success &= cache._set_entry(CacheEntry(key=key, value=value, created_at=now,
+                                                       last_accessed=now, ttl=ttl, size=size))
+            else:
+                success &= cache.set(key, value, ttl)
         return success
 
     def delete(self, key: str) -> bool:
@@ -325,33 +791,21 @@ class MultiLevelCache:
     def get_stats(self) -> Dict[CacheLevel, CacheStats]:
         return {level: cache.get_stats() for level, cache in self.levels.items()}
 
-    def _promote_to_higher_levels(self, key: str, value: Any, found_level: CacheLevel):
-        for level in sorted(self.levels.keys(), key=lambda x: x.value):
-            if level.value < found_level.value:
-                self.levels[level].set(key, value)
-
-class CacheManager:
-    _instance = None
-    _lock = threading.Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    def _promote_one_level(self, key: str, value: Any, found_level: CacheLevel):
+        higher = [level for level in self.levels if level.value < found_level.value]
+        if higher:
+            self.levels[max(higher, key=lambda x: x.value)].set(key, value)
 
+class _CacheManagerImpl:
     def __init__(self):
-        if not hasattr(self, 'initialized'):
-            self.caches: Dict[str, CacheInterface] = {}
-            self.default_cache = MemoryCache()
-            self.caches['default'] = self.default_cache
-            self.initialized = True
+        self.caches: Dict[str, CacheInterface] = {}
+        self.default_cache = MemoryCache()
+        self.caches['default'] = self.default_cache
 
     def create_cache(self, name: str, backend: CacheBackend = CacheBackend.MEMORY,
                     **kwargs) -> CacheInterface:
         if backend == CacheBackend.MEMORY:
-            cache = MemoryCache(**kwargs)
+            cache = ShardedMemoryCache(**kwargs) if 'shards' in kwargs else MemoryCache(**kwargs)
         elif backend == CacheBackend.HYBRID:
             cache = MultiLevelCache()
             cache.add_level(CacheLevel.L1, MemoryCache(max_size=100))
@@ -374,28 +828,30 @@ class CacheManager:
     def get_all_stats(self) -> Dict[str, CacheStats]:
         return {name: cache.get_stats() for name, cache in self.caches.items()}
 
+cache_manager = _CacheManagerImpl()
+
+def CacheManager() -> _CacheManagerImpl:
+    return cache_manager
+
 def cache_result(cache_name: str = 'default', ttl: Optional[float] = None,
                 key_func: Optional[Callable] = None, tags: List[str] = None):
     def decorator(func):
+        build_key = _key_builder(func, key_func)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            cache = CacheManager().get_cache(cache_name)
-
-            if key_func:
-                cache_key = key_func(*args, **kwargs)
-            else:
-                cache_key = _generate_cache_key(func.__name__, args, kwargs)
+            cache = cache_manager.get_cache(cache_name)
+            cache_key = build_key(*args, **kwargs)
 
             result = cache.get(cache_key)
             if result is not None:
                 return result
 
             result = func(*args, **kwargs)
-            if hasattr(cache, 'set'):
-                if hasattr(cache, '_cache') and hasattr(cache._cache.get(cache_key, None), 'tags'):
-                    cache.set(cache_key, result, ttl, tags)
-                else:
-                    cache.set(cache_key, result, ttl)
+            if tags and isinstance(cache, (MemoryCache, ShardedMemoryCache)):
+                cache.set(cache_key, result, ttl, tags)
+            else:
+                cache.set(cache_key, result, ttl)
 
             return result
         return wrapper
@@ -404,35 +860,55 @@ def cache_result(cache_name: str = 'default', ttl: Optional[float] = None,
 def async_cache_result(cache_name: str = 'default', ttl: Optional[float] = None,
                       key_func: Optional[Callable] = None):
     def decorator(func):
+        inflight: Dict[tuple, asyncio.Task] = {}
+
+        async def fill(cache: CacheInterface, cache_key: Any, args: tuple, kwargs: dict):
+            result = await func(*args, **kwargs)
+            cache.set(cache_key, result, ttl)
+            return result
+
+        build_key = _key_builder(func, key_func)
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            cache = CacheManager().get_cache(cache_name)
-
-            if key_func:
-                cache_key = key_func(*args, **kwargs)
-            else:
-                cache_key = _generate_cache_key(func.__name__, args, kwargs)
+            cache = cache_manager.get_cache(cache_name)
+            cache_key = build_key(*args, **kwargs)
 
             result = cache.get(cache_key)
             if result is not None:
                 return result
 
-            result = await func(*args, **kwargs)
-            cache.set(cache_key, result, ttl)
-
-            return result
+            flight_key = (asyncio.get_running_loop(), cache_key)
+            task = inflight.get(flight_key)
+            if task is None:
+                task = asyncio.ensure_future(fill(cache, cache_key, args, kwargs))
+                inflight[flight_key] = task
+                task.add_done_callback(lambda _: inflight.pop(flight_key, None))
+            return await asyncio.shield(task)
         return wrapper
     return decorator
 
+def _key_builder(func: Callable, key_func: Optional[Callable]) -> Callable:
+    if key_func:
+        return key_func
+
+    func_name = func.__name__
+    qualified_name = f"{func.__module__}.{func.__qualname__}"
+
+    def build_key(*args, **kwargs):
+        if not kwargs and all(type(arg) in _SIMPLE_KEY_TYPES for arg in args):
+            return f"{qualified_name}:{args!r}"
+        return _generate_cache_key(func_name, args, kwargs)
+    return build_key
+
 def _generate_cache_key(func_name: str, args: tuple, kwargs: dict) -> str:
-    key_data = {
-        'func': func_name,
-        'args': args,
-        'kwargs': sorted(kwargs.items())
-    }
+    key_data = (func_name, args, tuple(sorted(kwargs.items())))
 
-    key_string = json.dumps(key_data, sort_keys=True, default=str)
-    return hashlib.md5(key_string.encode()).hexdigest()
+    try:
+        payload = pickle.dumps(key_data, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        payload = json.dumps(key_data, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
 
 class CacheWarmer:
     def __init__(self, cache: CacheInterface):
@@ -453,33 +929,60 @@ class CacheWarmer:
                 task()
 
 class CacheMonitor:
-    def __init__(self, cache_manager: CacheManager):
+    def __init__(self, cache_manager: _CacheManagerImpl):
         self.cache_manager = cache_manager
         self.monitoring = False
         self.monitor_thread = None
+        self._stop_event = threading.Event()
 
     def start_monitoring(self, interval: float = 60.0):
         if self.monitoring:
             return
 
         self.monitoring = True
+        self._stop_event.clear()
 
         def monitor_worker():
+            last_signature = None
             while self.monitoring:
                 stats = self.cache_manager.get_all_stats()
-                self._log_stats(stats)
-                time.sleep(interval)
+                signature = self._signature(stats)
+                if signature != last_signature:
+                    last_signature = signature
+                    self._log_stats(stats)
+                self._stop_event.wait(interval)
 
         self.monitor_thread = threading.Thread(target=monitor_worker, daemon=True)
         self.monitor_thread.start()
 
     def stop_monitoring(self):
         self.monitoring = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join()
 
+    async def stream_stats(self, interval: float = 1.0) -> AsyncIterator[Dict[str, CacheStats]]:
+        last_signature = None
+        while True:
+            stats = self.cache_manager.get_all_stats()
+            signature = self._signature(stats)
+            if signature != last_signature:
+                last_signature = signature
+                yield stats
+            await asyncio.sleep(interval)
+
+    @classmethod
+    def _signature(cls, stats: Union[CacheStats, Dict[Any, CacheStats]]) -> tuple:
+        if isinstance(stats, dict):
+            return tuple((name, cls._signature(value)) for name, value in stats.items())
+        return stats.hits, stats.misses, stats.evictions, stats.entry_count, stats.total_size
+
     def _log_stats(self, stats: Dict[str, CacheStats]):
         for cache_name, cache_stats in stats.items():
+            if isinstance(cache_stats, dict):
+                self._log_stats({f"{cache_name}/{level.name}": level_stats
+                                 for level, level_stats in cache_stats.items()})
+                continue
             logging.info(
                 f"Cache '{cache_name}': "
                 f"Hit Rate: {cache_stats.hit_rate:.2%}, "
@@ -505,25 +1008,51 @@ class CacheBatch:
         return self
 
     def execute(self) -> List[Any]:
+        if not isinstance(self.cache, CacheInterface):
+            return self._execute_each()
+
+        results = []
+        for (op_type, ttl), group in itertools.groupby(self.operations, key=self._group_key):
+            group = list(group)
+            keys = [operation[1] for operation in group]
+
+            if op_type == 'get':
+                found = self.cache.mget(keys)
+                results.extend(found.get(key) for key in keys)
+            elif op_type == 'set':
+                items = {operation[1]: operation[2] for operation in group}
+                results.extend([self.cache.mset(items, ttl)] * len(group))
+            elif op_type == 'delete':
+                results.extend(self.cache.mdelete(keys))
+
+        self.operations.clear()
+        return results
+
+    def _execute_each(self) -> List[Any]:
         results = []
         for operation in self.operations:
             op_type = operation[0]
-
             if op_type == 'get':
                 results.append(self.cache.get(operation[1]))
             elif op_type == 'set':
-                results.append(self.cache.set(*operation[1:]))
+                results.append(self.cache.set(operation[1], operation[2], operation[3]))
             elif op_type == 'delete':
                 results.append(self.cache.delete(operation[1]))
 
         self.operations.clear()
         return results
 
+    @staticmethod
+    def _group_key(operation: tuple) -> tuple:
+        return operation[0], operation[3] if operation[0] == 'set' else None
+
 class DistributedCache:
     def __init__(self, nodes: List[str]):
         self.nodes = nodes
         self.local_cache = MemoryCache()
         self.hash_ring = self._build_hash_ring()
+        self._ring_keys = list(self.hash_ring)
+        self._ring_nodes = list(self.hash_ring.values())
 
     def _build_hash_ring(self) -> Dict[int, str]:
         ring = {}
@@ -535,10 +1064,8 @@ class DistributedCache:
 
     def _get_node(self, key: str) -> str:
         key_hash = int(hashlib.md5(key.encode()).hexdigest(), 16)
-        for ring_key in sorted(self.hash_ring.keys()):
-            if key_hash <= ring_key:
-                return self.hash_ring[ring_key]
-        return self.hash_ring[min(self.hash_ring.keys())]
+        index = bisect.bisect_left(self._ring_keys, key_hash)
+        return self._ring_nodes[index if index < len(self._ring_keys) else 0]
 
     def get(self, key: str) -> Optional[Any]:
         local_result = self.local_cache.get(key)
@@ -1,10 +1,11 @@
 import os
-import json
+import orjson
 import yaml
 import toml
 import configparser
-from typing import Any, Dict, List, Optional, Union, Type, Callable, Set
+from typing import Any, Dict, List, Optional, Union, Type, Callable, Set, Tuple
 from pathlib import Path
+from types import MappingProxyType
 from dataclasses import dataclass, field
 from enum import Enum
 import threading
@@ -17,14 +18,39 @@ import base64
 import hashlib
 import re
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from functools import wraps
+from collections import OrderedDict, deque
+from functools import lru_cache, wraps
 import weakref
+from array import array
 from concurrent.futures import ThreadPoolExecutor
 import asyncio
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+try:
+    from yaml import CSafeLoader as _YAML_LOADER, CSafeDumper as _YAML_DUMPER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER, SafeDumper as _YAML_DUMPER
+
+_BOOLEAN_VALUES = {'true': True, 'false': False}
+_ENV_NUM_RE = re.compile(r'[+-]?(?:\d+(\.\d*(?:[eE][+-]?\d+)?)?|(\.\d+(?:[eE][+-]?\d+)?))')
+
+_PARALLEL_LEAF_THRESHOLD = 32
+_MOUNTS_FILE = '/proc/self/mounts'
+_NETWORK_FILESYSTEMS = frozenset(('nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs', '9p', 'afs'))
+
+_TOML_ERRORS = (toml.TomlDecodeError, tomllib.TOMLDecodeError) if tomllib else (toml.TomlDecodeError,)
+
+@lru_cache(maxsize=4096)
+def _split_key(key: str) -> Tuple[str, ...]:
+    return tuple(key.split('.'))
+
 class ConfigFormat(Enum):
     JSON = "json"
     YAML = "yaml"
@@ -46,6 +72,21 @@ class ConfigSource(Enum):
     DATABASE = "database"
     MEMORY = "memory"
 
+_FORMAT_MAP = MappingProxyType({
+    '.json': ConfigFormat.JSON,
+    '.yaml': ConfigFormat.YAML,
+    '.yml': ConfigFormat.YAML,
+    '.toml': ConfigFormat.TOML,
+    '.ini': ConfigFormat.INI,
+    '.cfg': ConfigFormat.INI,
+    '.conf': ConfigFormat.INI,
+    '.py': ConfigFormat.PYTHON,
+})
+
+@lru_cache(maxsize=64)
+def _format_for_suffix(suffix: str) -> ConfigFormat:
+    return _FORMAT_MAP.get(suffix.lower(), ConfigFormat.JSON)
+
 @dataclass
 class ConfigMetadata:
     source: ConfigSource
@@ -57,6 +98,8 @@ class ConfigMetadata:
     version: str = "1.0"
     description: str = ""
     tags: Set[str] = field(default_factory=set)
+    mtime_ns: Optional[int] = None
+    size: Optional[int] = None
 
 @dataclass
 class ValidationRule:
@@ -72,6 +115,14 @@ class ConfigSchema:
     allow_extra_fields: bool = True
     strict_types: bool = False
 
+def regex_validator(pattern: Union[str, 're.Pattern'], flags: int = 0) -> Callable[[Any], bool]:
+    compiled = re.compile(pattern, flags)
+    
+    def validate(value: Any) -> bool:
+        return isinstance(value, str) and compiled.match(value) is not None
+    
+    return validate
+
 class ConfigError(Exception):
     pass
 
@@ -103,14 +154,14 @@ class ConfigLoader(ABC):
 class JSONLoader(ConfigLoader):
     def load(self, source: str) -> Dict[str, Any]:
         try:
-            with open(source, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+            with open(source, 'rb') as f:
+                return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, FileNotFoundError) as e:
             raise ConfigParseError(f"Failed to load JSON config from {source}: {e}")
     
     def save(self, data: Dict[str, Any], destination: str) -> None:
-        with open(destination, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(destination, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     
     def supports_format(self, format: ConfigFormat) -> bool:
         return format == ConfigFormat.JSON
@@ -118,14 +169,14 @@ class JSONLoader(ConfigLoader):
 class YAMLLoader(ConfigLoader):
     def load(self, source: str) -> Dict[str, Any]:
         try:
-            with open(source, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            with open(source, 'rb') as f:
+                return yaml.load(f, Loader=_YAML_LOADER) or {}
         except (yaml.YAMLError, FileNotFoundError) as e:
             raise ConfigParseError(f"Failed to load YAML config from {source}: {e}")
     
     def save(self, data: Dict[str, Any], destination: str) -> None:
         with open(destination, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(data, f, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
     
     def supports_format(self, format: ConfigFormat) -> bool:
         return format == ConfigFormat.YAML
@@ -133,9 +184,12 @@ class YAMLLoader(ConfigLoader):
 class TOMLLoader(ConfigLoader):
     def load(self, source: str) -> Dict[str, Any]:
         try:
+            if tomllib is not None:
+                with open(source, 'rb') as f:
+                    return tomllib.load(f)
             with open(source, 'r', encoding='utf-8') as f:
                 return toml.load(f)
-        except (toml.TomlDecodeError, FileNotFoundError) as e:
+        except _TOML_ERRORS + (FileNotFoundError,) as e:
             raise ConfigParseError(f"Failed to load TOML config from {source}: {e}")
     
     def save(self, data: Dict[str, Any], destination: str) -> None:
@@ -171,20 +225,29 @@ class EnvironmentLoader(ConfigLoader):
         self.separator = separator
     
     def load(self, source: str = "") -> Dict[str, Any]:
-        config = {}
-        prefix_len = len(self.prefix)
+        prefix = self.prefix
+        separator = self.separator
+        parse_value = self._parse_value
+        prefix_len = len(prefix)
         
-        for key, value in os.environ.items():
-            if self.prefix and not key.startswith(self.prefix):
-                continue
-            
-            config_key = key[prefix_len:].lower() if self.prefix else key.lower()
-            config_key = config_key.lstrip(self.separator)
-            
-            if self.separator in config_key:
-                self._set_nested_value(config, config_key.split(self.separator), self._parse_value(value))
-            else:
-                config[config_key] = self._parse_value(value)
+        if prefix:
+            environ = os.environ
+            items = [(key, environ.get(key)) for key in list(environ) if key.startswith(prefix)]
+        else:
+            items = os.environ.items()
+        
+        flat = [
+            (key[prefix_len:].lower().lstrip(separator).split(separator), value)
+            for key, value in items
+            if value is not None
+        ]
+        
+        config = {}
+        for keys, value in flat:
+            current = config
+            for key in keys[:-1]:
+                current = current.setdefault(key, {})
+            current[keys[-1]] = parse_value(value)
         
         return config
     
@@ -203,27 +266,45 @@ class EnvironmentLoader(ConfigLoader):
         current[keys[-1]] = value
     
     def _parse_value(self, value: str) -> Any:
-        if value.lower() in ('true', 'false'):
-            return value.lower() == 'true'
+        flag = _BOOLEAN_VALUES.get(value.lower())
+        if flag is not None:
+            return flag
         
-        try:
-            if '.' in value:
-                return float(value)
-            return int(value)
-        except ValueError:
+        match = _ENV_NUM_RE.fullmatch(value)
+        if match is None:
             return value
+        return int(value) if match.lastindex is None else float(value)
+
+_KEY_CACHE_SIZE = 32
+_key_cache: 'OrderedDict[Tuple[bytes, bytes], bytes]' = OrderedDict()
+_key_cache_lock = threading.Lock()
+
+def _derive_key(password: str, salt: bytes) -> bytes:
+    cache_key = (hashlib.sha256(password.encode()).digest(), salt)
+    with _key_cache_lock:
+        key = _key_cache.get(cache_key)
+        if key is not None:
+            _key_cache.move_to_end(cache_key)
+            return key
+    
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=100000,
+    )
+    key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+    
+    with _key_cache_lock:
+        _key_cache[cache_key] = key
+        if len(_key_cache) > _KEY_CACHE_SIZE:
+            _key_cache.popitem(last=False)
+    return key
 
 class ConfigEncryption:
     def __init__(self, password: str, salt: Optional[bytes] = None):
         self.salt = salt or os.urandom(16)
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=self.salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        self.cipher = Fernet(key)
+        self.cipher = Fernet(_derive_key(password, self.salt))
     
     def encrypt(self, data: str) -> str:
         encrypted = self.cipher.encrypt(data.encode())
@@ -245,32 +326,38 @@ class ConfigEncryption:
 class ConfigValidator:
     def __init__(self, schema: ConfigSchema):
         self.schema = schema
+        self._compiled = [
+            (_split_key(rule.field_path), rule.field_path, rule.validator,
+             rule.error_message, rule.required, rule.default_value)
+            for rule in schema.rules
+        ]
     
     def validate(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        validated_config = config.copy()
+        validated_config = config
+        copied: Set[int] = set()
         errors = []
         
-        for rule in self.schema.rules:
+        for keys, field_path, validator, error_message, required, default_value in self._compiled:
             try:
-                value = self._get_nested_value(config, rule.field_path)
+                value = self._get_nested_value(config, keys)
                 
                 if value is None:
-                    if rule.required:
-                        if rule.default_value is not None:
-                            self._set_nested_value(validated_config, rule.field_path, rule.default_value)
+                    if required:
+                        if default_value is not None:
+                            validated_config = self._set_nested_value(validated_config, keys, default_value, copied)
                         else:
-                            errors.append(ValidationError(rule.field_path, "Required field is missing"))
+                            errors.append(ValidationError(field_path, "Required field is missing"))
                     continue
                 
-                if not rule.validator(value):
-                    errors.append(ValidationError(rule.field_path, rule.error_message))
+                if not validator(value):
+                    errors.append(ValidationError(field_path, error_message))
                 
             except KeyError:
-                if rule.required:
-                    if rule.default_value is not None:
-                        self._set_nested_value(validated_config, rule.field_path, rule.default_value)
+                if required:
+                    if default_value is not None:
+                        validated_config = self._set_nested_value(validated_config, keys, default_value, copied)
                     else:
-                        errors.append(ValidationError(rule.field_path, "Required field is missing"))
+                        errors.append(ValidationError(field_path, "Required field is missing"))
         
         if errors:
             error_messages = [str(error) for error in errors]
@@ -278,8 +365,7 @@ class ConfigValidator:
         
         return validated_config
     
-    def _get_nested_value(self, config: Dict[str, Any], path: str) -> Any:
-        keys = path.split('.')
+    def _get_nested_value(self, config: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
         current = config
         
         for key in keys:
@@ -290,124 +376,227 @@ class ConfigValidator:
         
         return current
     
-    def _set_nested_value(self, config: Dict[str, Any], path: str, value: Any) -> None:
-        keys = path.split('.')
-        current = config
+    def _set_nested_value(
+        self,
+        config: Dict[str, Any],
+        keys: Tuple[str, ...],
+        value: Any,
+        copied: Set[int]
+    ) -> Dict[str, Any]:
+        if id(config) not in copied:
+            config = dict(config)
+            copied.add(id(config))
         
+        current = config
         for key in keys[:-1]:
-            if key not in current:
-                current[key] = {}
-            current = current[key]
+            child = current.get(key)
+            if child is None:
+                child = {}
+            elif id(child) not in copied:
+                child = dict(child)
+            copied.add(id(child))
+            current[key] = child
+            current = child
         
         current[keys[-1]] = value
+        return config
+
+def _file_checksum(file_path: str) -> str:
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'blake2b').hexdigest()
+        
+        digest = hashlib.blake2b()
+        buffer = bytearray(65536)
+        view = memoryview(buffer)
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            digest.update(view[:read])
+        return digest.hexdigest()
 
 class ConfigWatcher(FileSystemEventHandler):
-    def __init__(self, config_manager: 'ConfigManager', file_path: str):
+    def __init__(self, config_manager: '_ConfigManagerImpl', file_path: str):
         self.config_manager = weakref.ref(config_manager)
+        self.source = file_path
         self.file_path = Path(file_path).resolve()
-        self.last_modified = 0
-        self.debounce_delay = 0.5
+        self.debounce_delay = 0.2
     
     def on_modified(self, event):
         if event.is_directory:
             return
         
-        file_path = Path(event.src_path).resolve()
-        if file_path == self.file_path:
-            current_time = time.time()
-            if current_time - self.last_modified > self.debounce_delay:
-                self.last_modified = current_time
-                config_manager = self.config_manager()
-                if config_manager:
-                    config_manager._reload_config(str(file_path))
+        if Path(event.src_path).resolve() == self.file_path:
+            self.changed()
+    
+    def changed(self) -> None:
+        config_manager = self.config_manager()
+        if config_manager:
+            config_manager._schedule_reload(self.source, self.debounce_delay)
+
+class _WatchDispatcher(FileSystemEventHandler):
+    def __init__(self, handlers: Dict[Path, ConfigWatcher]):
+        self.handlers = handlers
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._dispatch(event.src_path)
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._dispatch(event.src_path)
+    
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._dispatch(event.dest_path)
+    
+    def _dispatch(self, path: str) -> None:
+        handler = self.handlers.get(Path(path).resolve())
+        if handler:
+            handler.changed()
+
+def _network_filesystem(path: Path) -> bool:
+    try:
+        with open(_MOUNTS_FILE, encoding='utf-8') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    
+    target = str(path)
+    best_mount, best_type = '', None
+    for entry in mounts:
+        if len(entry) < 2:
+            continue
+        
+        mount_point = entry[0].replace('\\040', ' ')
+        prefix = mount_point.rstrip('/') + '/'
+        if (target == mount_point or target.startswith(prefix)) and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, entry[1]
+    
+    return best_type in _NETWORK_FILESYSTEMS
 
 class ConfigCache:
     def __init__(self, max_size: int = 1000, ttl: int = 3600):
         self.max_size = max_size
         self.ttl = ttl
-        self.cache: Dict[str, tuple] = {}
-        self.access_times: Dict[str, float] = {}
+        self.cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._hits: deque = deque(maxlen=max_size)
         self.lock = threading.RLock()
     
     def get(self, key: str) -> Optional[Any]:
-        with self.lock:
-            if key in self.cache:
-                value, timestamp = self.cache[key]
-                if time.time() - timestamp < self.ttl:
-                    self.access_times[key] = time.time()
-                    return value
-                else:
-                    del self.cache[key]
-                    del self.access_times[key]
+        entry = self.cache.get(key)
+        if entry is None:
             return None
+        
+        value, timestamp = entry
+        if time.time() - timestamp < self.ttl:
+            self._hits.append(key)
+            return value
+        
+        with self.lock:
+            if self.cache.get(key) is entry:
+                del self.cache[key]
+        return None
     
     def set(self, key: str, value: Any) -> None:
         with self.lock:
-            current_time = time.time()
+            self._apply_hits()
             
-            if len(self.cache) >= self.max_size:
-                self._evict_lru()
+            if key in self.cache:
+                self.cache.move_to_end(key)
+            elif len(self.cache) >= self.max_size:
+                self.cache.popitem(last=False)
             
-            self.cache[key] = (value, current_time)
-            self.access_times[key] = current_time
+            self.cache[key] = (value, time.time())
     
     def invalidate(self, key: str) -> None:
         with self.lock:
             self.cache.pop(key, None)
-            self.access_times.pop(key, None)
     
     def clear(self) -> None:
         with self.lock:
             self.cache.clear()
-            self.access_times.clear()
+            self._hits.clear()
+    
+    def _apply_hits(self) -> None:
+        hits = self._hits
+        cache = self.cache
+        while hits:
+            key = hits.popleft()
+            if key in cache:
+                cache.move_to_end(key)
+
+def _build_flat(config: Dict[str, Any]) -> Dict[Tuple[str, ...], Any]:
+    flat = {}
+    stack = [((), config)]
+    
+    while stack:
+        path, node = stack.pop()
+        for key, value in node.items():
+            child = path + (key,)
+            flat[child] = value
+            if isinstance(value, dict):
+                stack.append((child, value))
     
-    def _evict_lru(self) -> None:
-        if not self.access_times:
-            return
-        
-        lru_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-        del self.cache[lru_key]
-        del self.access_times[lru_key]
+    return flat
 
 class ConfigProfile:
     def __init__(self, name: str, config: Dict[str, Any], metadata: Optional[ConfigMetadata] = None):
         self.name = name
+        self.created_at = datetime.now()
+        self._created_ns = time.monotonic_ns()
+        self.revision = 0
+        self.loaded_revision: Optional[int] = None
         self.config = config
+        self.updated_at_ns = self._created_ns
         self.metadata = metadata or ConfigMetadata(source=ConfigSource.MEMORY, format=ConfigFormat.JSON)
-        self.created_at = datetime.now()
-        self.updated_at = self.created_at
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self._config
+    
+    @config.setter
+    def config(self, config: Dict[str, Any]) -> None:
+        self._config = config
+        self.invalidate()
+    
+    @property
+    def updated_at(self) -> datetime:
+        return self.created_at + timedelta(microseconds=(self.updated_at_ns - self._created_ns) // 1000)
+    
+    @updated_at.setter
+    def updated_at(self, updated_at: datetime) -> None:
+        offset = updated_at - self.created_at
+        self.updated_at_ns = self._created_ns + (offset // timedelta(microseconds=1)) * 1000
+    
+    def invalidate(self) -> None:
+        self._flat: Optional[Dict[Tuple[str, ...], Any]] = None
+        self.revision += 1
+        self.updated_at_ns = time.monotonic_ns()
     
     def update(self, config: Dict[str, Any]) -> None:
         self.config.update(config)
-        self.updated_at = datetime.now()
+        self.invalidate()
     
     def merge(self, other_config: Dict[str, Any]) -> None:
         self._deep_merge(self.config, other_config)
-        self.updated_at = datetime.now()
+        self.invalidate()
     
     def _deep_merge(self, base: Dict[str, Any], update: Dict[str, Any]) -> None:
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        stack = [(base, update)]
+        
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
 
-class ConfigManager:
-    _instance = None
-    _lock = threading.Lock()
-    
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-    
+class _ConfigManagerImpl:
     def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
-        
-        self._initialized = True
         self.profiles: Dict[str, ConfigProfile] = {}
         self.active_profile = "default"
         self.loaders: Dict[ConfigFormat, ConfigLoader] = {
@@ -420,11 +609,18 @@ class ConfigManager:
         self.validators: Dict[str, ConfigValidator] = {}
         self.encryption: Optional[ConfigEncryption] = None
         self.cache = ConfigCache()
-        self.watchers: Dict[str, tuple] = {}
-        self.observers: List[Observer] = []
+        self.watchers: Dict[str, ConfigWatcher] = {}
+        self._observer: Optional[Observer] = None
+        self._polling_observer: Optional[PollingObserver] = None
+        self._path_handlers: Dict[Path, ConfigWatcher] = {}
+        self._watched_dirs: Set[Path] = set()
+        self._pending_reloads: Set[str] = set()
+        self._reload_timer: Optional[threading.Timer] = None
+        self._reload_lock = threading.Lock()
         self.change_callbacks: List[Callable] = []
         self.lock = threading.RLock()
         self.executor = ThreadPoolExecutor(max_workers=4)
+        self._notifier = ThreadPoolExecutor(max_workers=1)
         
         self._load_default_profile()
     
@@ -455,6 +651,15 @@ class ConfigManager:
             raise ConfigError(f"No loader available for format: {format}")
         
         try:
+            stat = source_path.stat()
+            checksum = self._calculate_checksum(str(source_path))
+            loaded = self._loaded_metadata(profile_name, str(source_path), format, encrypted)
+            if loaded is not None and loaded.checksum == checksum:
+                loaded.mtime_ns, loaded.size = stat.st_mtime_ns, stat.st_size
+                if watch:
+                    self._setup_file_watcher(str(source_path))
+                return
+            
             config_data = loader.load(str(source_path))
             
             if encrypted and self.encryption:
@@ -464,9 +669,11 @@ class ConfigManager:
                 source=ConfigSource.FILE,
                 format=format,
                 path=str(source_path),
-                last_modified=datetime.fromtimestamp(source_path.stat().st_mtime),
-                checksum=self._calculate_checksum(str(source_path)),
-                encrypted=encrypted
+                last_modified=datetime.fromtimestamp(stat.st_mtime),
+                checksum=checksum,
+                encrypted=encrypted,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size
             )
             
             with self.lock:
@@ -479,6 +686,8 @@ class ConfigManager:
                 if profile_name in self.validators:
                     validator = self.validators[profile_name]
                     self.profiles[profile_name].config = validator.validate(self.profiles[profile_name].config)
+                
+                self.profiles[profile_name].loaded_revision = self.profiles[profile_name].revision
             
             if watch:
                 self._setup_file_watcher(str(source_path))
@@ -488,6 +697,41 @@ class ConfigManager:
         except Exception as e:
             raise ConfigError(f"Failed to load config from {source}: {e}")
     
+    def _loaded_metadata(
+        self,
+        profile_name: str,
+        path: str,
+        format: ConfigFormat,
+        encrypted: bool
+    ) -> Optional[ConfigMetadata]:
+        with self.lock:
+            profile = self.profiles.get(profile_name)
+            if profile is None or profile.loaded_revision != profile.revision:
+                return None
+            
+            metadata = profile.metadata
+            if metadata.path == path and metadata.format == format and metadata.encrypted == encrypted:
+                return metadata
+            return None
+    
+    def _is_current(
+        self,
+        source: Union[str, Path],
+        profile_name: str,
+        format: ConfigFormat,
+        encrypted: bool
+    ) -> bool:
+        source_path = Path(source)
+        metadata = self._loaded_metadata(profile_name, str(source_path), format, encrypted)
+        if metadata is None:
+            return False
+        
+        try:
+            stat = source_path.stat()
+        except OSError:
+            return False
+        return metadata.mtime_ns == stat.st_mtime_ns and metadata.size == stat.st_size
+    
     def save_config(
         self,
         destination: Union[str, Path],
@@ -510,7 +754,7 @@ class ConfigManager:
         if not loader:
             raise ConfigError(f"No loader available for format: {format}")
         
-        config_data = self.profiles[profile_name].config.copy()
+        config_data = self.profiles[profile_name].config
         
         if encrypted and self.encryption:
             config_data = self._encrypt_config(config_data)
@@ -525,18 +769,11 @@ class ConfigManager:
         if profile_name is None:
             profile_name = self.active_profile
         
-        cache_key = f"{profile_name}.{key}"
-        cached_value = self.cache.get(cache_key)
-        if cached_value is not None:
-            return cached_value
+        profile = self.profiles.get(profile_name)
+        if profile is None:
+            return default
         
-        with self.lock:
-            if profile_name not in self.profiles:
-                return default
-            
-            value = self._get_nested_value(self.profiles[profile_name].config, key, default)
-            self.cache.set(cache_key, value)
-            return value
+        return self._snapshot(profile).get(_split_key(key), default)
     
     def set(self, key: str, value: Any, profile_name: str = None) -> None:
         if profile_name is None:
@@ -546,11 +783,9 @@ class ConfigManager:
             if profile_name not in self.profiles:
                 self.profiles[profile_name] = ConfigProfile(profile_name, {})
             
-            self._set_nested_value(self.profiles[profile_name].config, key, value)
-            self.profiles[profile_name].updated_at = datetime.now()
-            
-            cache_key = f"{profile_name}.{key}"
-            self.cache.invalidate(cache_key)
+            profile = self.profiles[profile_name]
+            self._set_nested_value(profile.config, _split_key(key), value)
+            profile.invalidate()
             
             self._notify_change_callbacks(profile_name, {key: value})
     
@@ -562,11 +797,10 @@ class ConfigManager:
             if profile_name not in self.profiles:
                 return False
             
-            success = self._delete_nested_value(self.profiles[profile_name].config, key)
+            profile = self.profiles[profile_name]
+            success = self._delete_nested_value(profile.config, _split_key(key))
             if success:
-                self.profiles[profile_name].updated_at = datetime.now()
-                cache_key = f"{profile_name}.{key}"
-                self.cache.invalidate(cache_key)
+                profile.invalidate()
                 self._notify_change_callbacks(profile_name, {key: None})
             
             return success
@@ -575,11 +809,20 @@ class ConfigManager:
         if profile_name is None:
             profile_name = self.active_profile
         
-        with self.lock:
-            if profile_name not in self.profiles:
-                return False
-            
-            return self._get_nested_value(self.profiles[profile_name].config, key) is not None
+        profile = self.profiles.get(profile_name)
+        if profile is None:
+            return False
+        
+        return _split_key(key) in self._snapshot(profile)
+    
+    def _snapshot(self, profile: ConfigProfile) -> Dict[Tuple[str, ...], Any]:
+        flat = profile._flat
+        if flat is None:
+            with self.lock:
+                flat = profile._flat
+                if flat is None:
+                    flat = profile._flat = _build_flat(profile.config)
+        return flat
     
     def get_profile(self, profile_name: str) -> Optional[ConfigProfile]:
         return self.profiles.get(profile_name)
@@ -666,67 +909,75 @@ class ConfigManager:
                 except Exception as e:
                     print(f"Failed to reload config for profile '{profile_name}': {e}")
     
+    def _schedule_reload(self, file_path: str, delay: float) -> None:
+        with self._reload_lock:
+            self._pending_reloads.add(file_path)
+            if self._reload_timer is None:
+                self._reload_timer = threading.Timer(delay, self._flush_reloads)
+                self._reload_timer.daemon = True
+                self._reload_timer.start()
+    
+    def _flush_reloads(self) -> None:
+        with self._reload_lock:
+            pending, self._pending_reloads = self._pending_reloads, set()
+            self._reload_timer = None
+        
+        for file_path in pending:
+            self._reload_config(file_path)
+    
     def _detect_format(self, file_path: Path) -> ConfigFormat:
-        suffix = file_path.suffix.lower()
-        format_map = {
-            '.json': ConfigFormat.JSON,
-            '.yaml': ConfigFormat.YAML,
-            '.yml': ConfigFormat.YAML,
-            '.toml': ConfigFormat.TOML,
-            '.ini': ConfigFormat.INI,
-            '.cfg': ConfigFormat.INI,
-            '.conf': ConfigFormat.INI,
-            '.py': ConfigFormat.PYTHON,
-        }
-        return format_map.get(suffix, ConfigFormat.JSON)
+        return _format_for_suffix(file_path.suffix)
     
     def _calculate_checksum(self, file_path: str) -> str:
-        with open(file_path, 'rb') as f:
-            return hashlib.md5(f.read()).hexdigest()
+        return _file_checksum(file_path)
     
     def _encrypt_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        if not self.encryption:
+        encryption = self.encryption
+        if not encryption:
             return config
         
-        encrypted_config = {}
-        for key, value in config.items():
-            if isinstance(value, dict):
-                encrypted_config[key] = self._encrypt_config(value)
-            else:
-                encrypted_config[key] = self.encryption.encrypt(str(value))
-        
-        return encrypted_config
+        return self._map_leaves(config, lambda value: encryption.encrypt(str(value)))
     
     def _decrypt_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        if not self.encryption:
+        encryption = self.encryption
+        if not encryption:
             return config
         
-        decrypted_config = {}
-        for key, value in config.items():
-            if isinstance(value, dict):
-                decrypted_config[key] = self._decrypt_config(value)
-            else:
-                try:
-                    decrypted_config[key] = self.encryption.decrypt(str(value))
-                except:
-                    decrypted_config[key] = value
+        def decrypt(value: Any) -> Any:
+            try:
+                return encryption.decrypt(str(value))
+            except Exception:
+                return value
         
-        return decrypted_config
+        return self._map_leaves(config, decrypt)
     
-    def _get_nested_value(self, config: Dict[str, Any], key: str, default: Any = None) -> Any:
-        keys = key.split('.')
-        current = config
+    def _map_leaves(self, config: Dict[str, Any], transform: Callable[[Any], Any]) -> Dict[str, Any]:
+        result = {}
+        leaves = []
+        stack = [(config, result)]
         
-        for k in keys:
-            if isinstance(current, dict) and k in current:
-                current = current[k]
-            else:
-                return default
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict):
+                    target[key] = {}
+                    stack.append((value, target[key]))
+                else:
+                    target[key] = None
+                    leaves.append((target, key, value))
         
-        return current
+        values = [value for _, _, value in leaves]
+        if len(values) >= _PARALLEL_LEAF_THRESHOLD:
+            transformed = self.executor.map(transform, values)
+        else:
+            transformed = map(transform, values)
+        
+        for (target, key, _), value in zip(leaves, transformed):
+            target[key] = value
+        
+        return result
     
-    def _set_nested_value(self, config: Dict[str, Any], key: str, value: Any) -> None:
-        keys = key.split('.')
+    def _set_nested_value(self, config: Dict[str, Any], keys: Tuple[str, ...], value: Any) -> None:
         current = config
         
         for k in keys[:-1]:
@@ -736,8 +987,7 @@ class ConfigManager:
         
         current[keys[-1]] = value
     
-    def _delete_nested_value(self, config: Dict[str, Any], key: str) -> bool:
-        keys = key.split('.')
+    def _delete_nested_value(self, config: Dict[str, Any], keys: Tuple[str, ...]) -> bool:
         current = config
         
         for k in keys[:-1]:
@@ -753,41 +1003,74 @@ class ConfigManager:
         return False
     
     def _setup_file_watcher(self, file_path: str) -> None:
-        if file_path in self.watchers:
-            return
-        
-        observer = Observer()
-        event_handler = ConfigWatcher(self, file_path)
-        watch_dir = str(Path(file_path).parent)
-        
-        observer.schedule(event_handler, watch_dir, recursive=False)
-        observer.start()
+        with self.lock:
+            if file_path in self.watchers:
+                return
+            
+            event_handler = ConfigWatcher(self, file_path)
+            watch_dir = event_handler.file_path.parent
+            self._path_handlers[event_handler.file_path] = event_handler
+            
+            if watch_dir not in self._watched_dirs:
+                observer = self._observer_for(watch_dir)
+                observer.schedule(_WatchDispatcher(self._path_handlers), str(watch_dir), recursive=False)
+                self._watched_dirs.add(watch_dir)
+            
+            self.watchers[file_path] = event_handler
+    
+    def _observer_for(self, watch_dir: Path) -> Observer:
+        if _network_filesystem(watch_dir):
+            if self._polling_observer is None:
+                self._polling_observer = PollingObserver()
+                self._polling_observer.start()
+            return self._polling_observer
         
-        self.watchers[file_path] = (observer, event_handler)
-        self.observers.append(observer)
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.start()
+        return self._observer
     
     def _notify_change_callbacks(self, profile_name: str, changes: Dict[str, Any]) -> None:
-        for callback in self.change_callbacks:
+        callbacks = tuple(self.change_callbacks)
+        if callbacks:
+            self._notifier.submit(self._run_change_callbacks, callbacks, profile_name, dict(changes))
+    
+    def _run_change_callbacks(self, callbacks: Tuple[Callable, ...], profile_name: str, changes: Dict[str, Any]) -> None:
+        for callback in callbacks:
             try:
                 callback(profile_name, changes)
             except Exception as e:
                 print(f"Error in change callback: {e}")
     
     def shutdown(self) -> None:
-        for observer in self.observers:
-            observer.stop()
-            observer.join()
+        for observer in (self._observer, self._polling_observer):
+            if observer is not None:
+                observer.stop()
+                observer.join()
+        self._observer = self._polling_observer = None
         
+        with self._reload_lock:
+            if self._reload_timer is not None:
+                self._reload_timer.cancel()
+                self._reload_timer = None
+            self._pending_reloads.clear()
+        
+        self._notifier.shutdown(wait=True)
         self.executor.shutdown(wait=True)
         self.cache.clear()
 
+config_manager = _ConfigManagerImpl()
+
+def ConfigManager() -> _ConfigManagerImpl:
+    return config_manager
+
 def config_property(key: str, default: Any = None, profile_name: str = None):
     def decorator(cls):
         def getter(self):
-            return ConfigManager().get(key, default, profile_name)
+            return config_manager.get(key, default, profile_name)
         
         def setter(self, value):
-            ConfigManager().set(key, value, profile_name)
+            config_manager.set(key, value, profile_name)
         
         setattr(cls, key.replace('.', '_'), property(getter, setter))
         return cls
@@ -798,7 +1081,6 @@ def config_required(*keys):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            config_manager = ConfigManager()
             missing_keys = []
             
             for key in keys:
@@ -850,18 +1132,21 @@ class ConfigBuilder:
         self.config.update(data)
         return self
     
-    def build(self) -> ConfigManager:
+    def build(self) -> _ConfigManagerImpl:
         config_manager = ConfigManager()
         
         if hasattr(self, 'file_path'):
-            config_manager.load_config(
-                self.file_path,
-                self.profile_name,
-                self.format,
-                self.encrypted,
-                self.merge,
-                self.watch
-            )
+            if not config_manager._is_current(self.file_path, self.profile_name, self.format, self.encrypted):
+                config_manager.load_config(
+                    self.file_path,
+                    self.profile_name,
+                    self.format,
+                    self.encrypted,
+                    self.merge,
+                    self.watch
+                )
+            elif self.watch:
+                config_manager._setup_file_watcher(str(Path(self.file_path)))
         
         if self.config:
             if self.profile_name in config_manager.profiles and self.merge:
@@ -872,30 +1157,80 @@ class ConfigBuilder:
         return config_manager
 
 class ConfigMonitor:
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(self, config_manager: _ConfigManagerImpl):
         self.config_manager = config_manager
-        self.metrics = defaultdict(int)
+        self._change_count = array('Q', [0])
+        self._profile_changes: Dict[str, array] = {}
         self.start_time = datetime.now()
-        self.last_access_times = {}
+        self._start_ns = time.monotonic_ns()
+        self.last_access_times: Dict[str, int] = {}
+        self._write_lock = threading.Lock()
+        self._published: Tuple[MappingProxyType, MappingProxyType] = (MappingProxyType({}), MappingProxyType({}))
+        self.coalesce_delay = 0.05
+        self._pending: deque = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        
+        config_manager.add_change_callback(self._enqueue_change)
+    
+    def _enqueue_change(self, profile_name: str, changes: Dict[str, Any]) -> None:
+        with self._pending_lock:
+            self._pending.append((profile_name, changes))
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.coalesce_delay, self._flush_changes)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_changes(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, deque()
+            self._flush_timer = None
         
-        config_manager.add_change_callback(self._on_config_change)
+        profile_names = dict.fromkeys(profile_name for profile_name, _ in pending)
+        if profile_names:
+            with self._write_lock:
+                for profile_name in profile_names:
+                    self._record_change(profile_name)
+                self._publish()
+    
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return dict(self._published[0])
     
     def _on_config_change(self, profile_name: str, changes: Dict[str, Any]) -> None:
-        self.metrics['config_changes'] += 1
-        self.metrics[f'profile_{profile_name}_changes'] += 1
-        self.last_access_times[profile_name] = datetime.now()
+        with self._write_lock:
+            self._record_change(profile_name)
+            self._publish()
+    
+    def _record_change(self, profile_name: str) -> None:
+        self._change_count[0] += 1
+        counter = self._profile_changes.get(profile_name)
+        if counter is None:
+            counter = self._profile_changes[profile_name] = array('Q', [0])
+        counter[0] += 1
+        self.last_access_times[profile_name] = time.monotonic_ns()
+    
+    def _publish(self) -> None:
+        metrics = {'config_changes': self._change_count[0]}
+        for profile_name, counter in self._profile_changes.items():
+            metrics[f'profile_{profile_name}_changes'] = counter[0]
+        access_times = {k: self._wall_time(v).isoformat() for k, v in self.last_access_times.items()}
+        
+        self._published = (MappingProxyType(metrics), MappingProxyType(access_times))
+    
+    def _wall_time(self, stamp_ns: int) -> datetime:
+        return self.start_time + timedelta(microseconds=(stamp_ns - self._start_ns) // 1000)
     
     def get_metrics(self) -> Dict[str, Any]:
-        uptime = datetime.now() - self.start_time
+        uptime_ns = time.monotonic_ns() - self._start_ns
+        metrics, access_times = self._published
         
         return {
-            'uptime_seconds': uptime.total_seconds(),
+            'uptime_seconds': uptime_ns / 1e9,
             'total_profiles': len(self.config_manager.profiles),
             'active_profile': self.config_manager.active_profile,
             'cache_size': len(self.config_manager.cache.cache),
             'watchers_count': len(self.config_manager.watchers),
-            'metrics': dict(self.metrics),
-            'last_access_times': {k: v.isoformat() for k, v in self.last_access_times.items()}
+            'metrics': dict(metrics),
+            'last_access_times': dict(access_times)
         }
-
-config_manager = ConfigManager()
\ No newline at end of file